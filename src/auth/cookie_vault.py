@@ -0,0 +1,157 @@
+import os
+import sys
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+# Optional: symmetric encryption for the on-disk vault. Without it cookies
+# are only kept in memory and Selenium runs as before after a restart.
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+    InvalidToken = Exception
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import COOKIE_VAULT_PATH, COOKIE_VAULT_KEY_PATH, COOKIE_EXPIRY_MARGIN_SECONDS, COOKIE_SESSION_HOST, COOKIE_SESSION_NAMES
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class CookieVault:
+    """
+    Encrypted on-disk store for the Selenium picking-console cookies.
+
+    Cookies are saved with their real `expiry` attributes and handed back until
+    the first picking-console session cookie is about to expire (or the server
+    rejects them), so the headless browser only starts when the cookies are
+    actually unusable. Short-lived cookies of other hosts do not count. The
+    key lives in the user's home folder, the vault itself under CACHE_DIR.
+    Launch counts are written with the cookies so they add up across restarts.
+    """
+    _instance = None
+
+    def __init__(self, vault_path: str = COOKIE_VAULT_PATH, key_path: str = COOKIE_VAULT_KEY_PATH):
+        self.vault_path = vault_path
+        self.key_path = key_path
+        self._cookies: Optional[List[Dict[str, Any]]] = None
+        self.stats = {
+            'launches': 0,
+            'launches_avoided': 0,
+        }
+
+        self._fernet = self._load_key() if Fernet is not None else None
+        if self._fernet is None:
+            logger.info("Cookie vault not persisted (cryptography unavailable)")
+        self._read()
+
+    @classmethod
+    def get_instance(cls) -> 'CookieVault':
+        """Get singleton instance of CookieVault"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+
+
+    def _load_key(self) -> Optional['Fernet']:
+        """Load the vault key, creating a user-only key file on first run"""
+        try:
+            if not os.path.exists(self.key_path):
+                os.makedirs(os.path.dirname(self.key_path), exist_ok=True)
+                fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(Fernet.generate_key())
+            with open(self.key_path, 'rb') as f:
+                return Fernet(f.read().strip())
+
+        except Exception as e:
+            logger.warning(f"Cookie vault key unavailable: {str(e)}")
+            return None
+
+    def _read(self):
+        """Load cookies and launch counts from disk"""
+        if self._fernet is None or not os.path.exists(self.vault_path):
+            return
+        try:
+            with open(self.vault_path, 'rb') as f:
+                payload = json.loads(self._fernet.decrypt(f.read()))
+            self._cookies = payload.get('cookies') or None
+            self.stats.update(payload.get('stats', {}))
+
+        except (InvalidToken, ValueError) as e:
+            # Key changed or file damaged, start over
+            logger.warning(f"Discarding unreadable cookie vault: {str(e)}")
+            self._cookies = None
+
+    def _write(self):
+        if self._fernet is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.vault_path), exist_ok=True)
+            payload = json.dumps({'cookies': self._cookies or [], 'stats': self.stats}).encode('utf-8')
+            with open(self.vault_path, 'wb') as f:
+                f.write(self._fernet.encrypt(payload))
+
+        except Exception as e:
+            logger.warning(f"Could not write cookie vault: {str(e)}")
+
+
+
+    @staticmethod
+    def _sent_to_session_host(cookie: Dict[str, Any]) -> bool:
+        domain = (cookie.get('domain') or '').lstrip('.')
+        return bool(domain) and (COOKIE_SESSION_HOST == domain or COOKIE_SESSION_HOST.endswith('.' + domain))
+
+    def session_cookies(self) -> List[Dict[str, Any]]:
+        """The stored picking-console session/auth cookies (COOKIE_SESSION_NAMES, else HttpOnly ones)"""
+        cookies = [cookie for cookie in (self._cookies or []) if self._sent_to_session_host(cookie)]
+        if COOKIE_SESSION_NAMES:
+            return [cookie for cookie in cookies if cookie.get('name') in COOKIE_SESSION_NAMES]
+        return [cookie for cookie in cookies if cookie.get('httpOnly')]
+
+    def expires_at(self) -> Optional[float]:
+        """Earliest session cookie expiry (epoch seconds), None for session-only cookies"""
+        expiries = [cookie['expiry'] for cookie in self.session_cookies() if cookie.get('expiry')]
+        return min(expiries) if expiries else None
+
+    def is_fresh(self) -> bool:
+        """True if cookies are stored and no session cookie is about to expire"""
+        if not self._cookies:
+            return False
+        expiry = self.expires_at()
+        return expiry is None or time.time() < expiry - COOKIE_EXPIRY_MARGIN_SECONDS
+
+    def load(self) -> Optional[List[Dict[str, Any]]]:
+        """Stored cookies if still fresh, else None"""
+        return self._cookies if self.is_fresh() else None
+
+    def save(self, cookies: List[Dict[str, Any]]):
+        """Keep a new set of Selenium cookies"""
+        self._cookies = cookies
+        self._write()
+        expiry = self.expires_at()
+        remaining = f"{(expiry - time.time()) / 3600:.1f}h" if expiry else "session"
+        logger.info(f"Cookie vault : Stored {len(cookies)} cookies (expire in {remaining})")
+
+    def invalidate(self):
+        """Drop the stored cookies (server rejected them)"""
+        if self._cookies:
+            logger.info("Cookie vault : Stored cookies rejected, clearing")
+        self._cookies = None
+        self._write()
+
+    # Counted in memory, written with the next save()
+    def record_launch(self):
+        self.stats['launches'] += 1
+
+    def record_avoided(self):
+        self.stats['launches_avoided'] += 1
+
+    def summary(self) -> str:
+        return (f"Cookie vault: {self.stats['launches']} browser launches, "
+                f"{self.stats['launches_avoided']} avoided")
@@ -0,0 +1,99 @@
+import os
+import sys
+import threading
+import requests
+from typing import Dict
+from urllib.parse import urlsplit
+from requests_kerberos import HTTPKerberosAuth, OPTIONAL
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import KERBEROS_SESSION_AUTH
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class KerberosSession:
+    """
+    Kerberos requests through AmznReq's session, reusing auth per host.
+
+    AmznReq.requests negotiates from scratch on every call, so each FCLM/Rodeo
+    request (and retry) pays the negotiate 401 round trip. Hosts that answered
+    with a negotiate 401 are remembered here, and later requests to them send
+    the Negotiate token up front. If that token is refused, requests_kerberos
+    still runs the full handshake. Each request gets its own HTTPKerberosAuth,
+    so worker threads share nothing but the host set.
+    Used by the threaded AmznReq path; AsyncTransport does the same for aiohttp.
+    """
+    _instance = None
+
+    def __init__(self, amzn_req, enabled: bool = KERBEROS_SESSION_AUTH):
+        self.amzn_req = amzn_req
+        self.enabled = enabled
+        self._negotiate_hosts = set()
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @classmethod
+    def get_instance(cls, amzn_req) -> 'KerberosSession':
+        """Get singleton instance of KerberosSession bound to the current AmznReq"""
+        if cls._instance is None:
+            cls._instance = cls(amzn_req)
+        elif cls._instance.amzn_req is not amzn_req:
+            # New AmznReq (and tickets), negotiate again
+            cls._instance.amzn_req = amzn_req
+            cls._instance.clear()
+        return cls._instance
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            'requests': 0,
+            'handshakes': 0,
+            'preemptive': 0,
+            'round_trips_saved': 0,
+        }
+
+
+
+    def request(self, url: str, method: str = "get", verify: bool = False, **kwargs) -> requests.Response:
+        """AmznReq.requests, with the token sent up front to hosts known to require it"""
+        host = urlsplit(url).hostname
+        preemptive = self.enabled and host in self._negotiate_hosts
+        kerberos_auth = HTTPKerberosAuth(mutual_authentication=OPTIONAL, force_preemptive=preemptive)
+        response = self.amzn_req.session.request(
+            method=method,
+            url=url,
+            auth=kerberos_auth,
+            cookies=self.amzn_req.export_cookies(),
+            verify=verify,
+            **kwargs,
+        )
+        self._record(host, response, preemptive)
+        return response
+
+    def _record(self, host: str, response: requests.Response, preemptive: bool):
+        handshakes = sum(1 for previous in response.history if previous.status_code == 401)
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['handshakes'] += handshakes
+            if preemptive:
+                self.stats['preemptive'] += 1
+                if handshakes == 0:
+                    self.stats['round_trips_saved'] += 1
+            if self.enabled and handshakes and response.status_code != 401:
+                self._negotiate_hosts.add(host)
+
+    def clear(self):
+        """Forget the hosts that required Kerberos, the next request to each negotiates from scratch"""
+        with self._lock:
+            self._negotiate_hosts.clear()
+
+    def reset_stats(self) -> Dict[str, int]:
+        """Counters collected so far (requests, handshakes, preemptive, round_trips_saved), starting new ones"""
+        with self._lock:
+            stats, self.stats = self.stats, self._empty_stats()
+        return stats
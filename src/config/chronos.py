@@ -147,17 +147,20 @@ class TimeManager:
 
 
     @classmethod
-    def calculate_shift_times(cls, start_hour, end_hour):
+    def calculate_shift_times(cls, start_hour, end_hour, tz=None, pad_time=None):
         """
         Handles shift times using 24-hour format (0-23)
         
         Args:
             start_hour (int): Hour to start shift (0-23)
             end_hour (int): Hour to end shift (0-23)
+            tz (pytz.timezone, optional): Timezone to use instead of the active site's
+            pad_time (timedelta, optional): Pad to use instead of the active shift's
         """
-        tz = cls._tz
+        tz = tz or cls._tz
         now = dt.now(pytz.utc).astimezone(tz)
-        pad_time = cls._shift_time.pad_time if cls._shift_time else td(seconds=0)
+        if pad_time is None:
+            pad_time = cls._shift_time.pad_time if cls._shift_time else td(seconds=0)
         # Create times for today
         start_time = now.replace(hour=start_hour, minute=0, second=0, microsecond=0)
         end_time = now.replace(hour=end_hour, minute=0, second=0, microsecond=0)
@@ -174,9 +177,9 @@ class TimeManager:
             end_time = tz.localize(end_time)
 
         # Calculate times milliseconds
-        current_millis = cls.convertToMilli(now, cls._tz)
-        start_millis = cls.convertToMilli(start_time - td(hours=1), cls._tz)
-        end_millis = cls.convertToMilli(end_time + td(hours=21), cls._tz)
+        current_millis = cls.convertToMilli(now, tz)
+        start_millis = cls.convertToMilli(start_time - td(hours=1), tz)
+        end_millis = cls.convertToMilli(end_time + td(hours=21), tz)
 
         # Calculate times
         total_hours = end_time - start_time
@@ -222,8 +225,8 @@ class TimeManager:
             start=start_time,
             end=end_time,
             current=now,
-            timezone=cls._tz.zone,
-            tz=cls._tz,
+            timezone=tz.zone,
+            tz=tz,
             total_hours=total_hours,
             elapsed_time=elapsed_time,
             progress_percent=progress_percent,
@@ -301,25 +304,54 @@ class TimeManager:
         """Get all current shift information in a dictionary format"""
         if not cls._shift_time:
             return {}
-        
+        return cls._shift_info_dict(cls.site_code, cls._shift_time)
+
+    @classmethod
+    def build_shift_info(cls, site_code, start_hour, end_hour, pad_time=None) -> dict:
+        """
+        Shift information for any site without changing the active shift.
+        Used by multi-site monitoring, where every site keeps its own context.
+
+        Args:
+            site_code (str): Site code (e.g., "SAV7")
+            start_hour (int): Hour to start shift (0-23)
+            end_hour (int): Hour to end shift (0-23)
+            pad_time (timedelta, optional): Time padding, none by default
+
+        Returns:
+            dict: Same layout as get_shift_info
+        """
+        timezone = TZ_MAPPING.get(site_code)
+        if not timezone:
+            raise ValueError(f"Invalid site code: {site_code}")
+
+        shift_time = cls.calculate_shift_times(
+            start_hour, end_hour,
+            tz=pytz.timezone(timezone),
+            pad_time=pad_time or td(seconds=0)
+        )
+        return cls._shift_info_dict(site_code, shift_time)
+
+    @staticmethod
+    def _shift_info_dict(site_code, shift_time: ShiftTime) -> dict:
         # Create timezone-aware current time
-        now = dt.now(pytz.UTC).astimezone(cls._tz)
+        now = dt.now(pytz.UTC).astimezone(shift_time.tz)
         return {
-            'site_code': cls.site_code,
-            'timezone': cls._shift_time.timezone,
-            'tz' : cls._tz,
-            'shift_start': cls._shift_time.start,
-            'shift_end': cls._shift_time.end,
+            'site_code': site_code,
+            'timezone': shift_time.timezone,
+            'tz' : shift_time.tz,
+            'shift_start': shift_time.start,
+            'shift_end': shift_time.end,
             'now' : now,
-            'current_time': cls._shift_time.current,
-            'total_hours': cls._shift_time.total_hours,
-            'elapsed_time': cls._shift_time.elapsed_time,
-            'progress_percent': cls._shift_time.progress_percent,
-            'progress': cls._shift_time.progress,
-            'hours_remaining': cls._shift_time.hours_remaining,
-            'formatted_time_remaining' : cls._shift_time.formatted_time_remaining,
-            'start_millis' : cls._shift_time.start_millis,
-            'end_millis' : cls._shift_time.end_millis
+            'current_time': shift_time.current,
+            'total_hours': shift_time.total_hours,
+            'elapsed_time': shift_time.elapsed_time,
+            'progress_percent': shift_time.progress_percent,
+            'progress': shift_time.progress,
+            'hours_remaining': shift_time.hours_remaining,
+            'formatted_time_remaining' : shift_time.formatted_time_remaining,
+            'start_millis' : shift_time.start_millis,
+            'end_millis' : shift_time.end_millis
         }
     
 
@@ -18,6 +18,102 @@ PAD_TIME = 1.5 # Hours for padding time remaining (no longer used)
 
 SLACK_NOTIFICATION_ENABLED = True  # Toggle for enabling/disabling notifications
 
+#Request Constants
+USE_ASYNC_TRANSPORT = True  # Use the pooled aiohttp transport when available (falls back to threads)
+KERBEROS_SESSION_AUTH = True  # Threaded fallback: send the Negotiate token up front to hosts that asked for it once
+HOST_CONNECTION_LIMIT = 4  # Max open connections kept per upstream host
+KEEPALIVE_SECONDS = 900  # Idle time before a pooled connection is dropped (outlives a 10 min refresh)
+REQUEST_TIMEOUT_SECONDS = 120  # Total time allowed for a single upstream request
+STREAM_RODEO = False  # Parse the Rodeo table while it downloads instead of after (each shard with RODEO_SHARDS > 1); the whole-body read_table is faster for HTML
+STREAM_CHUNK_BYTES = 64 * 1024  # Read size for streamed response bodies
+STREAM_BATCH_ROWS = 10000  # Rows per parsed batch when streaming a table
+RODEO_SHARDS = 4  # Concurrent ExSD sub-windows per Rodeo fetch (1 = one request for the whole window)
+MAX_CONCURRENT_REQUESTS = 12  # Requests in flight across all sites (multi-site mode)
+
+#Resilience Constants
+REFRESH_DEADLINE_SECONDS = 150  # Latency budget of one refresh, attempts and retries stop when it runs out (0 = none)
+RETRY_ATTEMPTS = 3  # Attempts per request (first try included)
+RETRY_BASE_DELAY_SECONDS = 1  # Backoff before retry n is base * 2^(n-1)
+USE_HEDGED_REQUESTS = True  # Send a second copy of a slow idempotent GET and take whichever answers first
+HEDGE_AFTER_SECONDS = 8  # Wait this long for a response before hedging
+HEDGE_SOURCES = ('Workforce', 'Process', 'LPI', 'LPI(Hist)')  # Small JSON/HTML sources only, hedging Rodeo doubles a large download
+BREAKER_FAILURE_THRESHOLD = 5  # Consecutive failures (no response, 5xx, 429) before a host's circuit opens
+BREAKER_COOLDOWN_SECONDS = 60  # Open circuit wait before a single probe request is let through
+
+#Cache Constants
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+USE_RESPONSE_CACHE = True  # Revalidate upstream responses with ETag / Last-Modified
+CACHE_TTL_SECONDS = {  # Reuse window for sources that send no validators (0 = always fetch)
+    'Workforce': 0,
+    'Process': 0,
+    'LPI': 0,
+    'LPI(Hist)': 4 * 3600,
+    'Rodeo': 0,
+}
+LPI_HISTORY_BY_DAY = True  # Fetch LPI(Hist) one closed day at a time and keep each day on disk
+LPI_HISTORY_DAYS = 7  # Closed days rolled into the historical rates
+LPI_HISTORY_RETENTION_DAYS = 14  # Stored days older than this are pruned
+
+#Cookie Vault Constants
+USE_COOKIE_VAULT = True  # Keep picking-console cookies encrypted on disk between refreshes and restarts
+COOKIE_VAULT_PATH = os.path.join(CACHE_DIR, 'cookies.vault')
+COOKIE_VAULT_KEY_PATH = os.path.join(os.path.expanduser('~'), '.pickassist', 'vault.key')  # Kept outside the app folder
+COOKIE_EXPIRY_MARGIN_SECONDS = 300  # Treat cookies as expired this long before their real expiry
+COOKIE_RECHECK_SECONDS = 3600  # Re-test cookies without an expiry (session cookies) this often
+COOKIE_SESSION_HOST = 'picking-console.na.picking.aft.a2z.com'  # Only this host's session/auth cookies decide when stored cookies are stale
+COOKIE_SESSION_NAMES = []  # Names of those cookies, empty = every HttpOnly cookie sent to COOKIE_SESSION_HOST
+
+#Scheduler Constants
+USE_SOURCE_SCHEDULER = True  # Auto-refresh only the sources that are due instead of all five
+SOURCE_REFRESH_CADENCE = {  # Seconds between fetches per source (never below the Settings refresh interval)
+    'Workforce': 60,
+    'Process': 60,
+    'Rodeo': 300,
+    'LPI': 600,
+    'LPI(Hist)': 24 * 3600,
+}
+MIN_REFRESH_SECONDS = 30  # Shortest gap between two scheduled refreshes
+
+#Prefetch Constants
+USE_PREFETCH = True  # Fetch and process the next scheduled refresh in the background before it is due
+PREFETCH_DEFAULT_LEAD_SECONDS = 30  # Lead time until refresh durations have been measured
+PREFETCH_MARGIN_SECONDS = 5  # Added to the measured (p90) refresh duration
+PREFETCH_MAX_AGE_SECONDS = 120  # Prefetched data older than this when the refresh is due is discarded
+PREFETCH_SAMPLES = 10  # Recent refresh durations the lead time is taken from
+
+#Location Constants
+LOCATION_GRAMMARS = (  # Scannable ID regexes, named groups aisle/slot (+ floor/mod), first match wins
+    r'^P-(?P<floor>\d+)-(?P<mod>[A-Z])(?P<aisle>\d{3})(?:[A-Z](?P<slot>\d{2,3}))?',  # P-1-A123B45: floor 1, mod A, aisle 123, slot 45
+)
+LOCATION_FLOORS = ('1',)  # Floors mapped to pick areas (pick area ranges carry no floor), None for every floor
+LOCATION_MODS = None  # Mod letters mapped to pick areas, None for every mod
+
+#Rollup Constants
+RODEO_CUBE_DIMENSIONS = ('cpt', 'process_path', 'pick_area')  # Grain the Rodeo summaries roll up from
+RODEO_CUBE_EXTRA_DIMENSIONS = ()  # e.g. ('destination_warehouse',), kept in the cube for other views at the cost of a bigger base
+
+#Incremental Rodeo Constants
+USE_INCREMENTAL_RODEO = True  # Only enrich Rodeo rows not seen last refresh, update the cube with the changed rows
+RODEO_DELTA_MAX_SHARE = 0.5  # Rebuild in full when more than this share of the rows is new
+
+#Progressive Merge Constants
+USE_PROGRESSIVE_MERGE = True  # Show provisional combined data while slower sources are still processing
+PROGRESSIVE_MIN_SOURCES = ('Rodeo', 'Workforce')  # Sources a refresh has to process before anything is shown early
+
+#Telemetry Constants
+USE_REQUEST_TELEMETRY = True  # Record per-request network phase timings for every refresh
+TELEMETRY_PATH = os.path.join(CACHE_DIR, 'telemetry.jsonl')  # One JSON line per refresh, for trend analysis
+TELEMETRY_KEEP = 5000  # Newest refresh records kept in TELEMETRY_PATH
+
+#Capture Constants
+CAPTURE_RESPONSES = False  # Write every refresh's raw upstream responses to a replayable bundle
+CAPTURE_DIR = os.path.join(CACHE_DIR, 'captures')
+CAPTURE_KEEP = 20  # Newest bundles kept, older ones are deleted
+
+#Mock Upstream Constants
+UPSTREAM_OVERRIDE = os.environ.get('PICKASSIST_UPSTREAM')  # e.g. http://127.0.0.1:8780, sends every source to src/data/mock_upstream.py
+MOCK_UPSTREAM_PORT = 8780
+
 TZ_MAPPING = {
             'ABE2' : 'America/New_York',
             'ABE3' : 'America/New_York',
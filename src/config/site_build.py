@@ -15,6 +15,7 @@ from src.config.constants import USER
 from src.config.chronos import TimeManager
 from src.config.res_finder import ResourceFinder
 find_resource = ResourceFinder.find_resource
+from src.data.pick_area_index import PickAreaIndex
 from src.utils.logger import CustomLogger
 logger = CustomLogger.get_logger(__name__)
 #logger.error(f"Some Error: {str(e)}")
@@ -41,26 +42,31 @@ class SiteBuilder:
         if not SiteBuilder._initialized:
             try:
                 self._time_manager = TimeManager.get_instance()
-                self._shift_info = self._time_manager.get_shift_info()
-
-                self._site_code = self._shift_info['site_code']
-                self._timezone = self._shift_info['timezone']
-                self._shift_start = self._shift_info['shift_start']
-                self._total_hours = self._shift_info['total_hours']
-                self._time_remaining = self._shift_info['hours_remaining']
-                self._time_passed = self._shift_info['elapsed_time']
-                
-                self._pick_areas = None  # Will hold loaded site configuration
-                self._plan_data = None  # Will hold loaded plan data
-                
-                self.runs = 0 # Will be used to force plan data refresh
-
-                logger.info(f"SiteBuilder Initialized:\n- Site Code: {self._site_code}\n- Shift Start: {self._shift_start}")
+                self._setup(self._time_manager.get_shift_info())
                 SiteBuilder._initialized = True
             except Exception as e:
                 logger.error(f"Error initializing SiteBuilder: {str(e)}")
                 raise
 
+    def _setup(self, shift_info):
+        """Read site and shift fields from a shift info dictionary"""
+        self._shift_info = shift_info
+
+        self._site_code = self._shift_info['site_code']
+        self._timezone = self._shift_info['timezone']
+        self._shift_start = self._shift_info['shift_start']
+        self._total_hours = self._shift_info['total_hours']
+        self._time_remaining = self._shift_info['hours_remaining']
+        self._time_passed = self._shift_info['elapsed_time']
+        
+        self._pick_areas = None  # Will hold loaded site configuration
+        self._pick_area_index = None  # Location lookup built from the pick areas
+        self._plan_data = None  # Will hold loaded plan data
+        
+        self.runs = 0 # Will be used to force plan data refresh
+
+        logger.info(f"SiteBuilder Initialized:\n- Site Code: {self._site_code}\n- Shift Start: {self._shift_start}")
+
     @classmethod
     def get_instance(cls, new=False):
         """
@@ -84,6 +90,22 @@ class SiteBuilder:
             
         return cls._instance
 
+    @classmethod
+    def for_site(cls, shift_info):
+        """
+        Create a standalone SiteBuilder for another site (multi-site monitoring).
+
+        Args:
+            shift_info (dict): Shift info for the site (see TimeManager.build_shift_info)
+
+        Returns:
+            SiteBuilder: Instance that is not the singleton and does not replace it
+        """
+        builder = object.__new__(cls)
+        builder._time_manager = None
+        builder._setup(shift_info)
+        return builder
+
 
 
     def get_site_info(self, new=False):
@@ -95,6 +117,9 @@ class SiteBuilder:
             logger.info('No pick areas loaded, attempting to load')
             self.load_pick_areas()
 
+        if self._pick_area_index is None:
+            self._pick_area_index = PickAreaIndex(self._pick_areas)
+
 
         if self._plan_data is None:
             logger.info('No plan data loaded, attempting to load')
@@ -104,6 +129,7 @@ class SiteBuilder:
         return {
             'site_code': self._site_code,
             'pick_areas': self._pick_areas,
+            'pick_area_index': self._pick_area_index,
             'plan_data': self._plan_data
         }
 
@@ -291,6 +317,7 @@ class SiteBuilder:
 
         # Initialize empty DataFrame with expected columns
         self._pick_areas = pl.DataFrame()
+        self._pick_area_index = None
 
         # Try network path first
         try:
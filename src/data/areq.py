@@ -1,10 +1,11 @@
 
 from functools import lru_cache, wraps
 from requests.exceptions import ConnectionError, RequestException
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime as dt, timedelta as td
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
 import asyncio
+import polars as pl
 import sys
 import os
 import time
@@ -24,8 +25,23 @@ from amzn_req import AmznReq, MidwayUnauthenticatedError
 # Module Path Fix
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from src.auth.midway import MidwayAuth
-from src.config.constants import USER
+from src.auth.cookie_vault import CookieVault
+from src.auth.kerberos_session import KerberosSession
+from src.config.constants import USER, USE_ASYNC_TRANSPORT, STREAM_RODEO, STREAM_CHUNK_BYTES, STREAM_BATCH_ROWS, USE_RESPONSE_CACHE, LPI_HISTORY_BY_DAY
+from src.config.constants import CAPTURE_RESPONSES, UPSTREAM_OVERRIDE, RODEO_SHARDS, USE_REQUEST_TELEMETRY
+from src.config.constants import REFRESH_DEADLINE_SECONDS, RETRY_ATTEMPTS, RETRY_BASE_DELAY_SECONDS
+from src.config.constants import USE_HEDGED_REQUESTS, HEDGE_AFTER_SECONDS, HEDGE_SOURCES
+from src.config.constants import USE_COOKIE_VAULT, COOKIE_EXPIRY_MARGIN_SECONDS, COOKIE_RECHECK_SECONDS
 from src.config.chronos import TimeManager
+from src.data.transport import AsyncTransport, TRANSPORT_ERRORS
+from src.data.table_stream import TableStreamParser, RODEO_SCHEMA, RODEO_COLUMNS
+from src.data.html_table import read_table
+from src.data.response_cache import ResponseCache
+from src.data.lpi_history import LpiHistoryStore
+from src.data.limiter import RequestLimiter
+from src.data.capture import ResponseCapture
+from src.data.telemetry import RefreshTelemetry
+from src.data.resilience import CircuitBreaker, RefreshDeadline, DeadlineExceededError
 from src.utils.logger import CustomLogger
 logger = CustomLogger.get_logger(__name__)
 #logger.error(f"Some Error: {str(e)}")
@@ -35,9 +51,9 @@ logger = CustomLogger.get_logger(__name__)
 import logging
 logger = logging.getLogger(__name__)
 
-def build_urls ():
-    time_manager = TimeManager.get_instance()
-    SHIFT_INFO = time_manager.get_shift_info()
+def build_urls (shift_info=None):
+    # Active shift unless a site context provides its own (multi-site mode)
+    SHIFT_INFO = shift_info or TimeManager.get_instance().get_shift_info()
         
     # Use the information
     SITE_CODE = SHIFT_INFO['site_code']
@@ -138,10 +154,53 @@ def build_urls ():
         "Workforce" : URLS_RAW["Workforce"],
         "Process" : URLS_RAW["Process"]
     }
+    URLS = {name: upstream_url(url) for name, url in URLS.items()}
     for name, url in URLS.items():
         logger.info('URL: %s\n%s', name, url)
     return URLS
 
+def upstream_url(url: str) -> str:
+    """Point a URL at UPSTREAM_OVERRIDE (mock upstream server) when it is set"""
+    if not UPSTREAM_OVERRIDE:
+        return url
+    parts = urlsplit(url)
+    override = urlsplit(UPSTREAM_OVERRIDE)
+    return urlunsplit((override.scheme, override.netloc, parts.path, parts.query, parts.fragment))
+
+def rodeo_shard_urls(url: str, shards: int) -> List[str]:
+    """Split the Rodeo ExSD window into `shards` consecutive, non-overlapping sub-windows"""
+    base, _, query = url.partition('?')
+    params = parse_qsl(query, keep_blank_values=True)
+    values = dict(params)
+    start = int(values['ExSDRange.RangeStartMillis'])
+    end = int(values['ExSDRange.RangeEndMillis'])
+    step = (end - start) / shards
+
+    urls = []
+    for index in range(shards):
+        # Both ends are inclusive, each shard stops a millisecond before the next one starts
+        bounds = {
+            'ExSDRange.RangeStartMillis': str(start + round(step * index)),
+            'ExSDRange.RangeEndMillis': str(end if index == shards - 1 else start + round(step * (index + 1)) - 1),
+        }
+        shard_params = [(key, bounds.get(key, value)) for key, value in params]
+        urls.append(f"{base}?{urlencode(shard_params)}")
+    return urls
+
+def build_lpi_day_url(site_code: str, day) -> str:
+    """FCLM process page for a single closed day (used for LPI(Hist) by day)"""
+    params = {
+        'primaryAttribute' : 'WORK_FLOW',
+        'secondaryAttribute' : 'PICKING_PROCESS_PATH',
+        'nodeType' : 'FC',
+        'warehouseId' : site_code,
+        'processId' : '100115',
+        'maxIntradayDays' : '1',
+        'spanType' : 'Day',
+        'startDateDay' : day.strftime('%Y/%m/%d'),
+    }
+    return upstream_url(f"https://fclm-portal.amazon.com/ppa/inspect/process?{urlencode(params)}")
+
 def retry_on_webdriver_error(max_attempts=3, delay=2):
     def decorator(func):
         @wraps(func)
@@ -238,13 +297,14 @@ class WebDriverManager:
 
     @classmethod
     @retry_on_webdriver_error(max_attempts=2, delay=1)
-    def get_cookies_with_selenium(cls):
-        """Get cookies using Selenium WebDriver with proper error handling"""
+    def get_cookies_with_selenium(cls, site_code: Optional[str] = None):
+        """Get cookies using Selenium WebDriver with proper error handling (active site when none is given)"""
         driver = None
 
-        time_manager = TimeManager.get_instance()
-        shift_info = time_manager.get_shift_info()
-        site_code = shift_info['site_code']
+        if site_code is None:
+            site_code = (TimeManager.get_instance().get_shift_info() or {}).get('site_code')
+        if not site_code:
+            raise ValueError("No site to load picking-console cookies for")
 
         try:
             driver = cls.initialize_webdriver()
@@ -271,6 +331,27 @@ class WebDriverManager:
                     except:
                         pass
 
+    @classmethod
+    def get_cookies(cls, force: bool = False, site_code: Optional[str] = None):
+        """Picking-console cookies from the vault, launching Selenium only when they are unusable"""
+        if not USE_COOKIE_VAULT:
+            return cls.get_cookies_with_selenium(site_code)
+
+        vault = CookieVault.get_instance()
+        if not force:
+            cookies = vault.load()
+            if cookies:
+                vault.record_avoided()
+                logger.info(f"Using stored cookies. {vault.summary()}")
+                return cookies
+
+        cookies = cls.get_cookies_with_selenium(site_code)
+        vault.record_launch()
+        if cookies:
+            vault.save(cookies)
+        logger.info(vault.summary())
+        return cookies
+
 
 class AmznReqManager:
     _instance = None
@@ -285,31 +366,35 @@ class AmznReqManager:
                 #cls._auth_status = cls._instance.is_midway_authenticated(USER)
                 if not cls._auth_status:
                     cls._instance.exec_mwinit(USER)
+                # Reuse cookies from an earlier run (no browser launch)
+                stored_cookies = CookieVault.get_instance().load() if USE_COOKIE_VAULT else None
+                if stored_cookies:
+                    cls._instance.import_cookies_from_selenium(stored_cookies)
             except FileNotFoundError:
                 #os.system("mwinit -o")
                 cls._instance.exec_mwinit(USER)
                 cls._instance = AmznReq()
-                selenium_cookies = WebDriverManager.get_cookies_with_selenium()
+                selenium_cookies = WebDriverManager.get_cookies()
                 cls._instance.import_cookies_from_selenium(selenium_cookies)
             except MidwayUnauthenticatedError:
                 #os.system("mwinit -o")
                 cls._instance.exec_mwinit(USER)
                 try:
                     cls._instance = AmznReq()
-                    selenium_cookies = WebDriverManager.get_cookies_with_selenium()
+                    selenium_cookies = WebDriverManager.get_cookies()
                     cls._instance.import_cookies_from_selenium(selenium_cookies)
                 except MidwayUnauthenticatedError:
                     #os.system("mwinit -o")
                     cls._auth_status = cls._instance.exec_mwinit(USER)
                     try:
                         cls._instance = AmznReq()
-                        selenium_cookies = WebDriverManager.get_cookies_with_selenium()
+                        selenium_cookies = WebDriverManager.get_cookies()
                         cls._instance.import_cookies_from_selenium(selenium_cookies)
                     except MidwayUnauthenticatedError:
                         logger.error("Midway authentication failed after multiple attempts.")
                         raise
         else:
-            selenium_cookies = WebDriverManager.get_cookies_with_selenium()
+            selenium_cookies = WebDriverManager.get_cookies()
             cls._instance.import_cookies_from_selenium(selenium_cookies)
         return cls._instance
 
@@ -321,66 +406,338 @@ class AmznReqManager:
         return cls.get_instance()
 
 class AsyncRequestHandler:
-    def __init__(self):
-        self.amzn_req = AmznReqManager.get_instance()
+    # Shared by all handlers so concurrent sites don't refresh cookies at once
+    _cookie_refresh_lock = None
+    _cookie_lock_loop = None
+
+    def __init__(self, shift_info: Optional[Dict] = None, limiter: Optional[RequestLimiter] = None):
+        # A mock upstream needs no Midway or picking-console cookies (no Selenium launch)
+        self.amzn_req = None if UPSTREAM_OVERRIDE else AmznReqManager.get_instance()
         self.urls = {}
-        self._cookie_refresh_lock = asyncio.Lock()
+        # Site context (None = active TimeManager shift) and optional shared request limit
+        self.shift_info = shift_info
+        self.limiter = limiter
         self._cookies_last_refresh = None
         self._cookie_valid = False
-        self.max_retries = 3
-        self.base_delay = 1
+        self.max_retries = RETRY_ATTEMPTS
+        self.base_delay = RETRY_BASE_DELAY_SECONDS
+        # Latency budget of the current refresh (set by stream_requests) and per-host breakers
+        self.deadline: Optional[RefreshDeadline] = None
+        self.breaker = CircuitBreaker.get_instance()
+        self.hedge_after = HEDGE_AFTER_SECONDS if USE_HEDGED_REQUESTS else None
+
+        # Pooled asyncio transport, falls back to AmznReq in worker threads
+        self.kerberos = None
+        if USE_ASYNC_TRANSPORT and AsyncTransport.available():
+            self.transport = AsyncTransport.get_instance(self.amzn_req)
+        else:
+            self.transport = None
+            logger.info("Async transport unavailable, using threaded AmznReq requests")
+            if self.amzn_req is not None:
+                # Kerberos reused per host across the worker threads
+                self.kerberos = KerberosSession.get_instance(self.amzn_req)
+            else:
+                logger.warning("UPSTREAM_OVERRIDE needs aiohttp, requests to the mock upstream will fail")
+
+        # Conditional-request cache shared by all sources
+        self.cache = ResponseCache.get_instance() if USE_RESPONSE_CACHE else None
+        # Raw responses of each refresh, written out by DataProcessor for replay
+        self.capture = ResponseCapture() if CAPTURE_RESPONSES else None
+        # Per-request phase timings of each refresh, last record shown in the app
+        self.telemetry = RefreshTelemetry() if USE_REQUEST_TELEMETRY else None
+
+
+    async def _send(self, url: str, headers: Optional[Dict] = None, parser: Optional[TableStreamParser] = None):
+        """Send a GET, inside the shared request limit when one is set"""
+        if self.limiter is not None:
+            queued = time.perf_counter()
+            async with self.limiter.slot(url):
+                waited = time.perf_counter() - queued
+                response = await self._send_now(url, headers, parser)
+            # Waiting on the shared limit counts as queueing
+            response.timing['queued'] = response.timing.get('queued', 0.0) + waited
+            response.timing['total'] = response.timing.get('total', 0.0) + waited
+            return response
+        return await self._send_now(url, headers, parser)
+
+    async def _send_now(self, url: str, headers: Optional[Dict] = None, parser: Optional[TableStreamParser] = None):
+        """Send a GET through the pooled transport or AmznReq in a worker thread"""
+        if self.transport is not None:
+            return await self.transport.get(
+                url, headers=headers, on_chunk=parser.feed if parser else None
+            )
 
+        request_start = time.perf_counter()
+        if parser is not None:
+            response = await asyncio.to_thread(
+                lambda: self._stream_with_amzn_req(url, headers, parser)
+            )
+        elif headers:
+            response = await asyncio.to_thread(
+                lambda: self.kerberos.request(url, headers=headers)
+            )
+        else:
+            response = await asyncio.to_thread(
+                lambda: self.kerberos.request(url, verify=False, allow_redirects=True)
+            )
 
-    async def _make_request_with_retry(self, name: str, url: str, headers: Optional[Dict] = None) -> Dict[str, Any]:
+        # requests only reports the time to the response headers (connect included)
+        total = time.perf_counter() - request_start
+        ttfb = min(response.elapsed.total_seconds(), total)
+        response.timing = {'ttfb': ttfb, 'download': total - ttfb, 'total': total}
+        streamed = parser is not None and response.status_code == 200
+        response.size = parser.bytes_read if streamed else len(response.content)
+        return response
+
+    def _stream_with_amzn_req(self, url: str, headers: Optional[Dict], parser: TableStreamParser):
+        """Threaded fallback for streaming: feed AmznReq chunks straight into the parser"""
+        kwargs = {'headers': headers} if headers else {'allow_redirects': True}
+        response = self.kerberos.request(url, stream=True, **kwargs)
+        if response.status_code == 200:
+            # iter_content undoes gzip/deflate (and br when brotli is installed)
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                parser.feed(chunk)
+        else:
+            response.content  # Buffer the error body for logging
+        return response
+
+    @staticmethod
+    def _response_content(response, parser: Optional[TableStreamParser] = None) -> Any:
+        """Pull the usable body out of a response (parsed table, JSON, or text)"""
+        if parser is not None and response.status_code == 200:
+            return parser.close()
+        if response.headers.get('content-type') == 'application/json':
+            return response.json()
+        return response.text
+
+    @property
+    def _capturing(self) -> bool:
+        return self.capture is not None and self.capture.active
+
+    def _capture_fetch(self, name: str, url: str, response, parser: Optional[TableStreamParser], started: float):
+        """Hand a finished response to the capture, streamed bodies come from the parser"""
+        if not self._capturing:
+            return
+        streamed = parser is not None and response.status_code == 200
+        body = parser.raw_body() if streamed else response.content
+        self.capture.record_fetch(
+            name, url, response.status_code, response.headers, body, started,
+            encoding=response.encoding, streamed=streamed
+        )
+
+    @property
+    def _timing(self) -> bool:
+        return self.telemetry is not None and self.telemetry.active
+
+    def _new_parser(self, stream_table: bool) -> Optional[TableStreamParser]:
+        # Fresh parser per attempt so a failed stream leaves no partial rows
+        if not stream_table:
+            return None
+        return TableStreamParser(
+            schema=RODEO_SCHEMA, batch_rows=STREAM_BATCH_ROWS, keep_raw=self._capturing, columns=RODEO_COLUMNS
+        )
+
+    async def _send_hedged(self, name: str, url: str, headers: Optional[Dict], stream_table: bool):
+        """
+        Send a GET, plus a second copy when the first is slow (hedged request).
+
+        Only for the idempotent GETs of HEDGE_SOURCES: if no response came after
+        `hedge_after` seconds the same request goes out again and whichever
+        finishes first is used, the other one is cancelled.
+        Returns the response and the parser that read it.
+        """
+        parser = self._new_parser(stream_table)
+        if self.hedge_after is None or RefreshTelemetry.source_of(name) not in HEDGE_SOURCES:
+            return await self._send(url, headers, parser), parser
+
+        first = asyncio.create_task(self._send(url, headers, parser))
+        parsers = {first: parser}
+        try:
+            done, _ = await asyncio.wait({first}, timeout=self.hedge_after)
+            if done:
+                return first.result(), parser
+
+            logger.info(f"{name} : No response after {self.hedge_after}s, sending hedged request")
+            hedge_parser = self._new_parser(stream_table)
+            second = asyncio.create_task(self._send(url, headers, hedge_parser))
+            parsers[second] = hedge_parser
+
+            pending = {first, second}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Take a response over an error (also when both finished together),
+                # an error only when both failed
+                answered = [task for task in done if task.exception() is None]
+                if answered or not pending:
+                    task = answered[0] if answered else next(iter(done))
+                    if task is second:
+                        logger.info(f"{name} : Hedged request answered first")
+                    return task.result(), parsers[task]
+
+        finally:
+            for task in parsers:
+                if not task.done():
+                    task.cancel()
+
+    async def _make_request_with_retry(self, name: str, url: str, headers: Optional[Dict] = None, stream_table: bool = False) -> Dict[str, Any]:
         """Make request with retry logic and exponential backoff"""
 
+        started = time.monotonic()
+        lookup_start = time.perf_counter()
+
+        # Revalidate against the on-disk copy (or skip the request inside its TTL)
+        cached = None
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.lookup, url)
+            if self.cache.fresh(name, cached):
+                self.cache.record_hit(name, cached, revalidated=False)
+                content = await asyncio.to_thread(lambda: cached.content)
+                if self._capturing:
+                    self.capture.record_cached(name, url, content, started)
+                if self._timing:
+                    self.telemetry.record_attempt(
+                        name, url, 1, 200, {'total': time.perf_counter() - lookup_start}, cached='ttl'
+                    )
+                return {
+                    'status_code': 200,
+                    'content': content
+                }
+            headers = ResponseCache.conditional_headers(cached, headers)
+
+        # Last upstream answer, or what to report when there was none
+        response = None
+        failure = {'status_code': 503, 'content': f"No response for {name}"}
+        sent = 0
+
         for attempt in range(self.max_retries):
+            if not self.breaker.allow(url):
+                logger.warning(f"{name} : Circuit open for {urlsplit(url).hostname}, not sending")
+                failure = {'status_code': 503, 'content': f"Circuit open for {urlsplit(url).hostname}"}
+                break
+
+            remaining = self.deadline.remaining() if self.deadline is not None else None
+            sent += 1
+            # Whether the breaker has been told how this attempt went
+            settled = False
             try:
-                if headers:
-                    response = await asyncio.to_thread(
-                        lambda: self.amzn_req.requests(url, headers=headers)
-                    )
-                else:
-                    response = await asyncio.to_thread(
-                        lambda: self.amzn_req.requests(url, verify=False, allow_redirects=True)
+                started = time.monotonic()
+                attempt_start = time.perf_counter()
+                try:
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    response, parser = await asyncio.wait_for(
+                        self._send_hedged(name, url, headers, stream_table), remaining
                     )
+                except Exception as e:
+                    if isinstance(e, asyncio.TimeoutError) and self.deadline is not None and self.deadline.expired:
+                        e = DeadlineExceededError(f"{name} did not finish inside the {self.deadline.seconds}s refresh deadline")
+                    else:
+                        self.breaker.record_failure(url)
+                        settled = True
+                    if self._timing:
+                        self.telemetry.record_attempt(
+                            name, url, attempt + 1, None, {'total': time.perf_counter() - attempt_start}, error=str(e)
+                        )
+                    raise e
                 print(f"{name} Status Code: {response.status_code}")
+                self.breaker.record(url, response.status_code)
+                settled = True
+
+                revalidated = response.status_code == 304 and cached is not None
+                if self._timing:
+                    self.telemetry.record_attempt(
+                        name, url, attempt + 1, response.status_code, response.timing, response.size,
+                        cached='304' if revalidated else None
+                    )
+
+                if revalidated:
+                    # Unchanged upstream, reuse the stored body
+                    self.cache.record_hit(name, cached, revalidated=True)
+                    content = await asyncio.to_thread(lambda: cached.content)
+                    if self._capturing:
+                        self.capture.record_cached(name, url, content, started)
+                    return {
+                        'status_code': 200,
+                        'content': content
+                    }
+
+                self._capture_fetch(name, url, response, parser, started)
                 if response.status_code != 200:
                     # Raise an exception to trigger the retry mechanism
                     raise RequestException(f"Request failed for {name} with status code {response.status_code}")
                 
+                if parser is not None:
+                    # Joining the parsed batches is CPU work, keep it off the event loop
+                    content = await asyncio.to_thread(self._response_content, response, parser)
+                else:
+                    content = self._response_content(response)
+                if self.cache is not None:
+                    size = parser.bytes_read if parser is not None else len(response.content)
+                    self.cache.record_miss(name, size)
+                    await asyncio.to_thread(self.cache.store, name, url, response.headers, content, size)
+
                 return {
                     'status_code': response.status_code,
-                    'content': response.json() if response.headers.get('content-type') == 'application/json' 
-                              else response.text
+                    'content': content
                 }
 
-            except (ConnectionError, RequestException) as e:
+            except DeadlineExceededError as e:
+                failure = {'status_code': 504, 'content': str(e)}
+                break
+
+            except (ConnectionError, RequestException, *TRANSPORT_ERRORS) as e:
                 delay = self.base_delay * (2 ** attempt)  # Exponential backoff
-                logger.warning(f"Request failed for {name} (attempt {attempt + 1}/{self.max_retries}): {str(e)}") 
+                logger.warning(f"Request failed for {name} (attempt {attempt + 1}/{self.max_retries}): {str(e) or type(e).__name__}") 
+                failure['content'] = str(e) or type(e).__name__
 
                 if attempt < self.max_retries - 1:
+                    if self.deadline is not None and not self.deadline.allows(delay):
+                        logger.warning(f"{name} : No time left in the refresh deadline for another attempt")
+                        break
+
                     logger.info(f"Retrying in {delay} seconds...")
                     await asyncio.sleep(delay)
                     
                     # Refresh cookies before retry if it's a Workforce or Process request
                     if name in ("Workforce", "Process"):
                         await self._ensure_valid_cookies(url)
-                else:
-                    logger.error(f"Request failed after {self.max_retries} attempts: {str(e)}")
-                    return {
-                        'status_code': response.status_code,
-                        'content': response.json() if response.headers.get('content-type') == 'application/json' 
-                                else response.text
-                    }
+
+            finally:
+                if not settled:
+                    # Deadline or cancellation, a half-open probe must not stay in flight
+                    self.breaker.release(url)
+
+        reason = f"status code {response.status_code}" if response is not None else failure['content']
+        logger.error(f"Request failed for {name} after {sent} attempt(s): {reason}")
+        if response is not None:
+            # Hand on the last upstream answer (status and error body)
+            return {
+                'status_code': response.status_code,
+                'content': self._response_content(response)
+            }
+        return failure
+
+    @classmethod
+    def _cookie_lock(cls) -> asyncio.Lock:
+        """Cookie refresh lock for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if cls._cookie_lock_loop is not loop:
+            cls._cookie_refresh_lock = asyncio.Lock()
+            cls._cookie_lock_loop = loop
+        return cls._cookie_refresh_lock
 
     async def _ensure_valid_cookies(self, url: str) -> bool:
         """Ensures valid cookies exist, refreshing only if necessary"""
-        async with self._cookie_refresh_lock:
-            # Chack if cookies are still valid
+        if UPSTREAM_OVERRIDE:
+            return True
+
+        async with self._cookie_lock():
+            # Chack if cookies are still valid (real expiry, or a periodic re-test for session cookies)
             if self._cookies_last_refresh:
                 cookie_age = dt.now() - self._cookies_last_refresh
-                if cookie_age.total_seconds() > 3600:  # 1 hour expiration
+                expiry = CookieVault.get_instance().expires_at() if USE_COOKIE_VAULT else None
+                expired = expiry is not None and time.time() >= expiry - COOKIE_EXPIRY_MARGIN_SECONDS
+                if expired or cookie_age.total_seconds() > COOKIE_RECHECK_SECONDS:
                     self._cookie_valid = False
 
             
@@ -388,22 +745,34 @@ class AsyncRequestHandler:
                 return True
 
             # Test existing cookies
+            check_start = time.perf_counter()
             try:
-                test_result = await asyncio.to_thread(
-                    lambda: self._test_workforce_cookies(url)
-                )
+                test_result = await self._test_workforce_cookies(url)
+                if self._timing:
+                    self.telemetry.record_cookies(check_seconds=time.perf_counter() - check_start)
                 if test_result == 200:
                     self._cookie_valid = True
+                    self._cookies_last_refresh = dt.now()
                     return True
 
             except Exception as e:
                 logger.debug(f"Cookie test failed: {str(e)}")
 
-            # If we reach here, we need new cookies
+            # If we reach here, we need new cookies, from this handler's site (multi-site mode)
+            shift_info = self.shift_info or TimeManager.get_instance().get_shift_info() or {}
+            site_code = shift_info.get('site_code')
+            if not site_code:
+                logger.error("Cookie refresh needs a site, none is set")
+                return False
+
+            refresh_start = time.perf_counter()
             try:
-                logger.info("Refreshing cookies with Selenium...")
+                logger.info(f"Refreshing cookies with Selenium for {site_code}...")
+                if USE_COOKIE_VAULT:
+                    # Current cookies were rejected, don't hand them out again
+                    CookieVault.get_instance().invalidate()
                 selenium_cookies = await asyncio.to_thread(
-                    WebDriverManager.get_cookies_with_selenium
+                    WebDriverManager.get_cookies, True, site_code
                 )
                 
                 if selenium_cookies:
@@ -420,21 +789,39 @@ class AsyncRequestHandler:
             except Exception as e:
                 logger.warning(f"Cookie refresh failed: {str(e)}")
                 return False
+            finally:
+                if self._timing:
+                    self.telemetry.record_cookies(refresh_seconds=time.perf_counter() - refresh_start)
 
-    async def stream_requests(self):
-        """Stream responses as they become available"""
+    async def stream_requests(self, sources: Optional[List[str]] = None):
+        """Stream responses as they become available (only `sources` when given)"""
 
-        if not self.amzn_req.is_midway_authenticated(USER):
+        if self.amzn_req is not None and not self.amzn_req.is_midway_authenticated(USER):
             AmznReqManager.refresh_instance()
             self.amzn_req.exec_mwinit(USER)
 
         try:
-            self.urls = build_urls()
+            self.urls = build_urls(self.shift_info)
+            if self.cache is not None:
+                self.cache.reset_stats()
+            self.deadline = RefreshDeadline(REFRESH_DEADLINE_SECONDS)
+            if self.telemetry is not None:
+                shift_info = self.shift_info or TimeManager.get_instance().get_shift_info()
+                self.telemetry.begin(shift_info['site_code'], sources)
+            if self.kerberos is not None:
+                self.kerberos.reset_stats()
+
             # Create all request tasks immediately
             tasks = {
                 asyncio.create_task(self._make_request(name, url)): name 
                 for name, url in self.urls.items()
+                if sources is None or name in sources
             }
+            # Completion times are stamped as tasks finish, not when the consumer gets to them
+            requested_at = time.perf_counter()
+            finished_at = {}
+            for task in tasks:
+                task.add_done_callback(lambda done: finished_at.setdefault(done, time.perf_counter()))
             
             # Yield responses as soon as they complete
             while tasks:
@@ -447,13 +834,36 @@ class AsyncRequestHandler:
                     name = tasks[task]
                     try:
                         response = await task
+                        if self._capturing:
+                            self.capture.record_source(name, response)
+                        if self._timing:
+                            self.telemetry.record_source(
+                                name, finished_at.get(task, time.perf_counter()) - requested_at,
+                                response['status_code'] if response else None
+                            )
                         yield name, response
                     except Exception as e:
                         logger.error(f"Request failed for {name}: {str(e)}")
+                        if self._capturing:
+                            self.capture.record_source(name, None)
+                        if self._timing:
+                            self.telemetry.record_source(name, finished_at.get(task, time.perf_counter()) - requested_at, None)
                         yield name, None
                     finally:
                         tasks.pop(task)
 
+            if self.cache is not None:
+                logger.info(self.cache.summary())
+            if self.kerberos is not None:
+                auth_stats = self.kerberos.reset_stats()
+                logger.info(f"Kerberos: {auth_stats['requests']} requests, {auth_stats['handshakes']} handshakes, "
+                            f"{auth_stats['round_trips_saved']} round trips saved")
+            if self._timing:
+                record = await asyncio.to_thread(self.telemetry.finish)
+                summary = self.telemetry.summary_text(record)
+                print(summary)
+                logger.info(summary)
+
         except Exception as e:
             error_message = f"Error in stream_requests:\n{str(e)}"
             logger.warning(error_message)
@@ -461,8 +871,7 @@ class AsyncRequestHandler:
     async def _make_request(self, name: str, url: str):
         """Handle individual requests using amzn_req's session"""
         try:
-            time_manager = TimeManager.get_instance()
-            shift_info = time_manager.get_shift_info()
+            shift_info = self.shift_info or TimeManager.get_instance().get_shift_info()
             site_code = shift_info['site_code']
 
             try:
@@ -490,8 +899,14 @@ class AsyncRequestHandler:
                     }
                     
                     return await self._make_request_with_retry(name, url, headers)
+                elif name == "LPI(Hist)" and LPI_HISTORY_BY_DAY:
+                    return await self._request_lpi_history(site_code, shift_info)
+                elif name == "Rodeo" and RODEO_SHARDS > 1:
+                    return await self._request_rodeo_sharded(url, RODEO_SHARDS)
                 else:
-                    return await self._make_request_with_retry(name, url)
+                    # Rodeo is parsed as it downloads
+                    stream_table = STREAM_RODEO and name == "Rodeo"
+                    return await self._make_request_with_retry(name, url, stream_table=stream_table)
 
             except Exception as e:
                 error_message = f"Error in _make_request for {name}: \n{str(e)}"
@@ -502,7 +917,90 @@ class AsyncRequestHandler:
             logger.error(error_message)
 
 
-    def _test_workforce_cookies(self, url: str) -> Optional[int]:
+    async def _request_lpi_history(self, site_code: str, shift_info: Dict) -> Dict[str, Any]:
+        """Fetch only the history days that are not stored yet"""
+        history = LpiHistoryStore.get_instance()
+        days = history.history_days(shift_info['shift_start'])
+        missing = history.missing_days(site_code, days)
+        logger.info(f"LPI(Hist) : {len(days) - len(missing)} of {len(days)} days stored, fetching {len(missing)}")
+        print(f"LPI(Hist) : fetching {len(missing)} of {len(days)} days")
+
+        results = await asyncio.gather(
+            *(self._make_request_with_retry(f"LPI(Hist) {day.isoformat()}", build_lpi_day_url(site_code, day))
+              for day in missing),
+            return_exceptions=True
+        )
+
+        pages = {}
+        for day, result in zip(missing, results):
+            if isinstance(result, dict) and result.get('status_code') == 200:
+                pages[day] = result['content']
+            else:
+                logger.warning(f"LPI(Hist) : No page for {day.isoformat()}: {result}")
+
+        if missing and not pages:
+            # Nothing new came back, report the fetch error rather than the stored days
+            failed = results[0]
+            if isinstance(failed, dict):
+                return failed
+            return {'status_code': 500, 'content': str(failed)}
+
+        return {
+            'status_code': 200,
+            'content': {
+                'site_code': site_code,
+                'days': days,
+                'pages': pages,
+            }
+        }
+
+    async def _request_rodeo_sharded(self, url: str, shards: int) -> Dict[str, Any]:
+        """Fetch the Rodeo ExSD window as concurrent sub-windows and merge them"""
+        shard_urls = rodeo_shard_urls(url, shards)
+        print(f"Rodeo : fetching {len(shard_urls)} ExSD shards")
+
+        # Parsed while streaming (STREAM_RODEO), otherwise each shard once it has downloaded
+        results = await asyncio.gather(
+            *(self._make_request_with_retry(f"Rodeo {index + 1}/{len(shard_urls)}", shard_url, stream_table=STREAM_RODEO)
+              for index, shard_url in enumerate(shard_urls)),
+            return_exceptions=True
+        )
+
+        frames = []
+        for index, result in enumerate(results):
+            if not isinstance(result, dict) or result.get('status_code') != 200:
+                # A partial backlog would undercount picks, fail the whole source
+                logger.warning(f"Rodeo : Shard {index + 1}/{len(shard_urls)} failed: {result}")
+                if isinstance(result, dict):
+                    return result
+                return {'status_code': 500, 'content': str(result)}
+            frames.append(result['content'])
+
+        if not STREAM_RODEO:
+            # The merge needs frames
+            frames = await asyncio.to_thread(
+                lambda: [read_table(body, RODEO_SCHEMA, RODEO_COLUMNS) for body in frames]
+            )
+
+        merged = await asyncio.to_thread(self.merge_rodeo_shards, frames)
+        return {
+            'status_code': 200,
+            'content': merged
+        }
+
+    @staticmethod
+    def merge_rodeo_shards(frames: List[pl.DataFrame]) -> pl.DataFrame:
+        """One Rodeo frame from the shard frames (the windows do not overlap, rows are kept as listed)"""
+        # Empty shards only carry untyped header columns
+        filled = [frame for frame in frames if frame.height > 0]
+        if not filled:
+            return frames[0] if frames else pl.DataFrame()
+
+        merged = pl.concat(filled, how='vertical_relaxed')
+        logger.info(f"Rodeo : Merged {len(frames)} shards, {merged.height} rows")
+        return merged
+
+    async def _test_workforce_cookies(self, url: str) -> Optional[int]:
         """Test if current cookies are valid for workforce endpoint"""
         try:
             headers = {
@@ -511,7 +1009,7 @@ class AsyncRequestHandler:
                 'Connection': 'keep-alive',
             }
             
-            response = self.amzn_req.requests(url, headers=headers)
+            response = await self._send(url, headers)
             return response.status_code
             
         except Exception as e:
@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import base64
+import argparse
+import tempfile
+import threading
+import http.server
+import polars as pl
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import amzn_req._cookie
+from amzn_req import AmznReq
+from requests_kerberos import HTTPKerberosAuth
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.auth.kerberos_session import KerberosSession
+from src.config.constants import RODEO_SHARDS, LPI_HISTORY_DAYS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# The stub takes any Negotiate token, so no KDC is involved
+STUB_TOKEN = f"Negotiate {base64.b64encode(b'pickassist-bench').decode()}"
+
+
+class SpnegoStub(http.server.ThreadingHTTPServer):
+    """Answers 401 + WWW-Authenticate: Negotiate until a request carries a Negotiate token, counts both"""
+    daemon_threads = True
+
+    def __init__(self, host: str, latency: float):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'challenges': 0}
+        super().__init__((host, 0), SpnegoHandler)
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def reset(self) -> Dict[str, int]:
+        with self.lock:
+            stats, self.stats = self.stats, {'hits': 0, 'challenges': 0}
+        return stats
+
+
+class SpnegoHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.count('hits')
+        time.sleep(self.server.latency)
+        if not self.headers.get('Authorization', '').startswith('Negotiate '):
+            self.server.count('challenges')
+            self.send_response(401)
+            self.send_header('WWW-Authenticate', 'Negotiate')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = b'<html><table><tr><th>ok</th></tr></table></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def bench_amzn_req():
+    """An AmznReq without Midway cookies or Kerberos tickets (fixed stub token)"""
+    generate = HTTPKerberosAuth.generate_request_header
+    cookie_file = amzn_req._cookie.MIDWAY_COOKIE_FILENAME
+    with tempfile.TemporaryDirectory() as directory:
+        empty_jar = os.path.join(directory, 'cookie')
+        with open(empty_jar, 'w') as jar:
+            jar.write("# Netscape HTTP Cookie File\n")
+        HTTPKerberosAuth.generate_request_header = lambda self, response, host, is_preemptive=False: STUB_TOKEN
+        amzn_req._cookie.MIDWAY_COOKIE_FILENAME = empty_jar
+        try:
+            yield AmznReq()
+        finally:
+            HTTPKerberosAuth.generate_request_header = generate
+            amzn_req._cookie.MIDWAY_COOKIE_FILENAME = cookie_file
+
+
+def refresh_urls(fclm: SpnegoStub, rodeo: SpnegoStub, history_days: int) -> List[str]:
+    """The Kerberos requests of one refresh: LPI, the LPI(Hist) days not stored yet, the Rodeo shards"""
+    fclm_url = f"http://{fclm.server_address[0]}:{fclm.server_address[1]}"
+    rodeo_url = f"http://{rodeo.server_address[0]}:{rodeo.server_address[1]}"
+    return (
+        [f"{fclm_url}/ppa/inspect/process?spanType=Intraday"]
+        + [f"{fclm_url}/ppa/inspect/process?spanType=Day&day={day}" for day in range(history_days)]
+        + [f"{rodeo_url}/SAV7/ItemListCSV?shard={shard}" for shard in range(RODEO_SHARDS)]
+    )
+
+
+def run(args) -> pl.DataFrame:
+    # One stub per upstream host, Kerberos state is kept per host
+    fclm, rodeo = SpnegoStub('127.0.0.2', args.latency), SpnegoStub('127.0.0.3', args.latency)
+    for stub in (fclm, rodeo):
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+
+    rows = []
+    try:
+        with bench_amzn_req() as client, ThreadPoolExecutor(args.workers) as executor:
+            for session_auth in (False, True):
+                # What the threaded AmznReq path sends through
+                kerberos = KerberosSession(client, enabled=session_auth)
+                for refresh in range(1, args.refreshes + 1):
+                    # Closed LPI days are stored after the first refresh
+                    urls = refresh_urls(fclm, rodeo, LPI_HISTORY_DAYS if refresh == 1 else 0)
+                    started = time.perf_counter()
+                    statuses = list(executor.map(lambda url: kerberos.request(url).status_code, urls))
+                    seconds = time.perf_counter() - started
+                    hits = fclm.reset()['hits'] + rodeo.reset()['hits']
+                    stats = kerberos.reset_stats()
+                    rows.append((
+                        session_auth, refresh, len(urls), sum(1 for status in statuses if status != 200),
+                        hits, hits - len(urls), stats['round_trips_saved'], seconds
+                    ))
+    finally:
+        for stub in (fclm, rodeo):
+            stub.shutdown()
+            stub.server_close()
+
+    return pl.DataFrame(rows, schema={
+        'session_auth': pl.Boolean, 'refresh': pl.Int64, 'requests': pl.Int64, 'failed': pl.Int64,
+        'server_hits': pl.Int64, 'negotiate_401s': pl.Int64, 'round_trips_saved': pl.Int64, 'seconds': pl.Float64
+    }, orient='row').with_columns(pl.col('seconds').round(2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kerberos round trips per refresh, per-request vs session auth, against a SPNEGO stub")
+    parser.add_argument('--refreshes', type=int, default=3, help="Refreshes per mode")
+    parser.add_argument('--workers', type=int, default=4, help="Worker threads sending the requests")
+    parser.add_argument('--latency', type=float, default=0.05, help="Seconds before each stub response")
+    args = parser.parse_args()
+
+    print(f"{args.refreshes} refreshes, {args.workers} workers, {args.latency}s per round trip")
+    results = run(args)
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, tbl_width_chars=160):
+        print(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import polars as pl
+from typing import Callable, List, Optional, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.data.locations import with_location
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+ID_COLUMNS = {
+    'Outer Scannable ID': ('primary_aisle', 'primary_slot'),
+    'Outer Outer Scannable ID': ('secondary_aisle', 'secondary_slot'),
+}
+LETTERS = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
+
+
+# Reference: the per-row parsers _normalize_rodeo used before with_location
+def extract_aisle(id_str: str) -> Optional[int]:
+    if not isinstance(id_str, str) or not id_str.startswith('P-1-'):
+        return None
+    pattern = r'P-1-[A-Z](\d{3})'
+    match = re.search(pattern, id_str)
+    return int(match.group(1)) if match else None
+
+
+def extract_slot(id_str: str) -> Optional[int]:
+    if not isinstance(id_str, str) or not id_str.startswith('P-1-'):
+        return None
+    pattern = r'P-1-[A-Z]\d{3}[A-Z](\d{2,3})'
+    match = re.search(pattern, id_str)
+    return int(match.group(1)) if match else None
+
+
+def scannable_id(rng: random.Random) -> Optional[str]:
+    """A scannable ID, mostly P-1- bins plus the edge cases the grammar has to agree on"""
+    kind = rng.random()
+    mod, aisle, bay = rng.choice(LETTERS), rng.randint(0, 999), rng.choice(LETTERS)
+    if kind < 0.70:
+        return f"P-1-{mod}{aisle:03d}{bay}{rng.randint(0, 999):0{rng.choice([2, 3])}d}"
+    if kind < 0.78:
+        return f"P-2-{mod}{aisle:03d}{bay}{rng.randint(0, 99):02d}"  # Other floor
+    if kind < 0.82:
+        return f"P-1-{mod}{aisle:03d}"  # Aisle only
+    if kind < 0.85:
+        return f"P-1-{mod}{rng.randint(1000, 9999)}{bay}{rng.randint(0, 99):02d}"  # 4-digit aisle
+    if kind < 0.88:
+        return None
+    if kind < 0.91:
+        return f"ts{rng.randint(0, 10 ** 9)}"  # Tote, not a location
+    if kind < 0.93:
+        return f"P-1-{mod.lower()}{aisle:03d}B12"
+    if kind < 0.95:
+        return f"P-10-A{aisle:03d}B12"
+    if kind < 0.97:
+        return "P-1-A12B3"
+    return f"P-1-{mod}{aisle:03d}{bay}{rng.randint(0, 9)}xyz"  # 1-digit slot, trailing junk
+
+
+def legacy(frame: pl.DataFrame) -> pl.DataFrame:
+    return frame.with_columns([
+        pl.col(column).map_elements(parse, return_dtype=pl.Int64).cast(pl.Int64).alias(name)
+        for column, names in ID_COLUMNS.items()
+        for parse, name in zip((extract_aisle, extract_slot), names)
+    ])
+
+
+def native(frame: pl.DataFrame) -> pl.DataFrame:
+    lazy = frame.lazy()
+    for column, (aisle, slot) in ID_COLUMNS.items():
+        lazy = lazy.pipe(with_location, column, aisle, slot)
+    return lazy.collect()
+
+
+def _timed(parse: Callable[[pl.DataFrame], pl.DataFrame], frame: pl.DataFrame):
+    started = time.perf_counter()
+    result = parse(frame)
+    return time.perf_counter() - started, result
+
+
+def run(args) -> Tuple[float, float, List[tuple]]:
+    rng = random.Random(args.seed)
+    frame = pl.DataFrame(
+        {column: [scannable_id(rng) for _ in range(args.rows)] for column in ID_COLUMNS},
+        schema={column: pl.Utf8 for column in ID_COLUMNS}
+    )
+    legacy_seconds, expected = _timed(legacy, frame)
+    native_seconds, result = _timed(native, frame)
+
+    rows = []
+    for names in ID_COLUMNS.values():
+        for name in names:
+            mismatches = (~expected[name].eq_missing(result[name])).sum()
+            rows.append((name, expected[name].is_not_null().sum(), mismatches))
+    return legacy_seconds, native_seconds, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scannable-ID location parsing, map_elements vs with_location, with a differential check")
+    parser.add_argument('--rows', type=int, default=500000, help="Rows, each with both scannable-ID columns")
+    parser.add_argument('--seed', type=int, default=7, help="Seed of the synthetic IDs")
+    args = parser.parse_args()
+
+    legacy_seconds, native_seconds, rows = run(args)
+    print(f"{args.rows} rows x {len(ID_COLUMNS)} IDs: map_elements {legacy_seconds:.2f}s, "
+          f"with_location {native_seconds:.3f}s ({legacy_seconds / native_seconds:.0f}x)")
+    print(pl.DataFrame(rows, schema={'column': pl.Utf8, 'parsed': pl.Int64, 'mismatches': pl.Int64}, orient='row'))
+    if any(mismatches for _, _, mismatches in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
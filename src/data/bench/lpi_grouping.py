@@ -0,0 +1,142 @@
+import os
+import sys
+import math
+import time
+import asyncio
+import argparse
+import polars as pl
+from typing import Any, Dict, List
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.data.processor import DataProcessor
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+SUMMARY_KEYS = {
+    'process_summary': ['process_path'],
+    'process_area_summary': ['process_path', 'pick_area'],
+}
+
+
+def legacy_group_lpi(df: pl.DataFrame) -> Dict[str, Any]:
+    """Reference: the nine scalar queries and two group_bys _group_lpi ran before the single pass"""
+    def scalar(frame: pl.LazyFrame, expr: pl.Expr):
+        return frame.select([expr.alias('value')]).collect().get_column('value')[0]
+
+    rate = (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2)
+    volume = pl.col('unit_count').sum()
+    hours = pl.col('time_hours').sum().round(2)
+
+    hov = df.lazy().filter(pl.col('process_path').str.contains('PPHOVRESERVE'))
+    non_hov = df.lazy().filter(~pl.col('process_path').str.contains('PPHOVRESERVE'))
+    if df['process_path'].str.contains('PPHOVRESERVE').any():
+        hov_rate, hov_vol, hov_hrs = scalar(hov, rate), scalar(hov, volume), scalar(hov, hours)
+    else:
+        hov_rate = hov_vol = hov_hrs = 0
+
+    aggregations = [
+        pl.col('unit_count').sum().alias("cases_picked"),
+        pl.col('time_hours').sum().alias("total_hours").round(2),
+        pl.col('units_per_hr').mean().alias("mean_cph").round(2),
+        (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2).alias("avg_cph")
+    ]
+    return {
+        "hov": {"hov_rate": hov_rate, "hov_vol": hov_vol, "hov_hrs": hov_hrs},
+        "non_hov": {
+            "non_hov_rate": scalar(non_hov, rate), "non_hov_vol": scalar(non_hov, volume), "non_hov_hrs": scalar(non_hov, hours)
+        },
+        "combined": {
+            "combined_rate": scalar(df.lazy(), rate), "combined_vol": scalar(df.lazy(), volume), "combined_hrs": scalar(df.lazy(), hours)
+        },
+        "process_summary": df.group_by('process_path').agg(aggregations),
+        "process_area_summary": df.group_by(['process_path', 'pick_area']).agg(aggregations).sort('process_path', 'pick_area'),
+    }
+
+
+def lpi_frame(rows: int, paths: int, areas: int, seed: int) -> pl.DataFrame:
+    """A synthetic lpi_full: associate rows over the paths (two of them HOV) and areas (some unknown)"""
+    path_names = pl.Series([f"PPPATH{index}" for index in range(paths)] + ['PPHOVRESERVE', 'PPHOVRESERVE2'])
+    area_names = pl.Series([f"AREA{index:03d}" for index in range(areas)] + [None], dtype=pl.Utf8)
+    return pl.DataFrame({
+        'process_path': path_names.sample(rows, with_replacement=True, seed=seed),
+        'pick_area': area_names.sample(rows, with_replacement=True, seed=seed + 1),
+        'unit_count': pl.Series(range(400)).sample(rows, with_replacement=True, seed=seed + 2),
+        'time_hours': (pl.Series(range(201)) / 100).sample(rows, with_replacement=True, seed=seed + 3),
+    }).with_columns(
+        pl.when(pl.col('time_hours') > 0)
+        .then(pl.col('unit_count') / pl.col('time_hours'))
+        .otherwise(0).round(2).alias('units_per_hr')
+    )
+
+
+def _same(expected: Any, result: Any) -> bool:
+    if isinstance(expected, float) and isinstance(result, float) and math.isnan(expected):
+        return math.isnan(result)
+    return expected == result
+
+
+def differences(expected: Dict[str, Any], result: Dict[str, Any]) -> List[str]:
+    """Scalars and summaries that differ between the two implementations"""
+    different = [
+        f"{group}.{name}" for group in ('hov', 'non_hov', 'combined')
+        for name, value in expected[group].items() if not _same(value, result[group][name])
+    ]
+    for name, keys in SUMMARY_KEYS.items():
+        if not expected[name].sort(keys).equals(result[name].sort(keys).select(expected[name].columns)):
+            different.append(name)
+    return different
+
+
+def _timed(group, df: pl.DataFrame, repeat: int):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = group(df)
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def run(args) -> pl.DataFrame:
+    # _group_lpi reads nothing from the processor
+    single_pass = lambda df: asyncio.run(DataProcessor._group_lpi(None, df))
+    full = lpi_frame(args.rows, args.paths, args.areas, args.seed)
+    cases = {
+        'full week': full,
+        'no HOV': full.filter(~pl.col('process_path').str.contains('PPHOVRESERVE')),
+        'empty': full.head(0),
+    }
+
+    rows = []
+    for case, df in cases.items():
+        legacy_seconds, expected = _timed(legacy_group_lpi, df, args.repeat)
+        seconds, result = _timed(single_pass, df, args.repeat)
+        rows.append((case, df.height, legacy_seconds, seconds, ', '.join(differences(expected, result)) or '-'))
+
+    return pl.DataFrame(rows, schema={
+        'case': pl.Utf8, 'rows': pl.Int64, 'nine_queries_s': pl.Float64, 'single_pass_s': pl.Float64, 'differences': pl.Utf8
+    }, orient='row').with_columns(pl.col('nine_queries_s', 'single_pass_s').round(3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LPI grouping, nine queries vs one pass, with a differential check")
+    parser.add_argument('--rows', type=int, default=2000000, help="lpi_full rows (a full week at a large site)")
+    parser.add_argument('--paths', type=int, default=36, help="Non-HOV process paths")
+    parser.add_argument('--areas', type=int, default=300, help="Pick areas")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per implementation, the fastest is shown")
+    parser.add_argument('--seed', type=int, default=5, help="Seed of the synthetic rows")
+    args = parser.parse_args()
+
+    results = run(args)
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(results)
+    if (results['differences'] != '-').any():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
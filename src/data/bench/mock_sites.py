@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+# Optional: the mock server runs on aiohttp.web
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.data.mock_upstream import SyntheticSite, MockUpstream, load_pick_areas
+from src.data.lpi_history import LpiHistoryStore
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Sites with a bundled site_info JSON (pick areas for the synthetic data)
+BENCH_SITES = ['ATL7', 'AVP8', 'HGR5', 'HWA4', 'KRB1', 'KRB2', 'KRB3', 'KRB4', 'MDT9', 'SAV7']
+
+
+def site_mocks(site_codes: Iterable[str], latency: Dict[str, float], rodeo_rows: int = 10000,
+               associates: int = 300, rodeo_format: str = 'html', seed: int = 0) -> Dict[str, MockUpstream]:
+    """One MockUpstream per site, each with its own synthetic data"""
+    return {
+        site_code: MockUpstream(
+            SyntheticSite(site_code, load_pick_areas(site_code), rodeo_rows=rodeo_rows,
+                          associates=associates, seed=seed, rodeo_format=rodeo_format),
+            latency=latency, seed=seed
+        )
+        for site_code in site_codes
+    }
+
+
+def multi_site_app(mocks: Dict[str, MockUpstream]) -> 'web.Application':
+    """
+    One server for several mock sites, routed by the site in the path
+    (picking-console, Rodeo) or the warehouseId query (FCLM).
+    """
+    def route(handler: str, site_of):
+        async def handle(request: 'web.Request') -> 'web.StreamResponse':
+            mock = mocks.get(site_of(request))
+            if mock is None:
+                raise web.HTTPNotFound(text=f"No mock site {site_of(request)}")
+            return await getattr(mock, handler)(request)
+        return handle
+
+    in_path = lambda request: request.match_info['site']
+    app = web.Application()
+    app.router.add_get('/api/fcs/{site}/workforce', route('_workforce', in_path))
+    app.router.add_get('/api/fcs/{site}/process-paths/information', route('_process', in_path))
+    app.router.add_get('/ppa/inspect/process', route('_lpi', lambda request: request.query.get('warehouseId')))
+    app.router.add_get('/{site}/ItemListCSV', route('_rodeo', in_path))
+    return app
+
+
+@asynccontextmanager
+async def serving(app: 'web.Application', url: str):
+    """Run `app` on the host and port of `url` (UPSTREAM_OVERRIDE) for the duration of the block"""
+    if web is None:
+        raise RuntimeError("aiohttp is required for the mock upstream server")
+    parts = urlsplit(url)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, parts.hostname, parts.port).start()
+    try:
+        yield runner
+    finally:
+        await runner.cleanup()
+
+
+@contextmanager
+def fresh_history(directory: Optional[str] = None):
+    """An empty LPI history store for the block, so every run fetches the closed days again"""
+    previous = LpiHistoryStore._instance
+    with tempfile.TemporaryDirectory(dir=directory) as cache_dir:
+        LpiHistoryStore._instance = LpiHistoryStore(cache_dir)
+        try:
+            yield LpiHistoryStore._instance
+        finally:
+            LpiHistoryStore._instance = previous
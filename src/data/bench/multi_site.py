@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import polars as pl
+from typing import List, Tuple
+
+# Every source goes to the local mock upstream (read by src.config.constants on import)
+os.environ.setdefault('PICKASSIST_UPSTREAM', 'http://127.0.0.1:8781')
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+import src.data.areq as areq
+from src.config.constants import UPSTREAM_OVERRIDE, MAX_CONCURRENT_REQUESTS, HOST_CONNECTION_LIMIT
+from src.data.bench.mock_sites import BENCH_SITES, site_mocks, multi_site_app, serving, fresh_history
+from src.data.multi_site import MultiSiteMonitor
+from src.data.transport import AsyncTransport
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+def _limits(value: str) -> Tuple[int, int]:
+    """GLOBAL:PER_HOST"""
+    max_concurrent, per_host = value.split(':')
+    return int(max_concurrent), int(per_host)
+
+
+async def _refresh(site_codes: List[str], start: int, end: int, max_concurrent: int, per_host: int):
+    """One cold refresh of `site_codes` in one monitor: (seconds, monitor, summary)"""
+    monitor = MultiSiteMonitor(site_codes, start, end, max_concurrent=max_concurrent, per_host=per_host)
+    with fresh_history():
+        started = time.perf_counter()
+        summary = await monitor.run()
+        return time.perf_counter() - started, monitor, summary
+
+
+async def run(args) -> pl.DataFrame:
+    mocks = site_mocks(
+        args.sites, {'*': args.latency, 'Rodeo': args.rodeo_latency},
+        rodeo_rows=args.rodeo_rows, associates=args.associates
+    )
+    rows = []
+    async with serving(multi_site_app(mocks), UPSTREAM_OVERRIDE):
+        try:
+            # Baseline: one site after another, like separate instances taking turns
+            seconds, requests, peak, ok = 0.0, 0, 0, 0
+            for site_code in args.sites:
+                site_seconds, monitor, summary = await _refresh(
+                    [site_code], args.start, args.end, MAX_CONCURRENT_REQUESTS, HOST_CONNECTION_LIMIT
+                )
+                seconds += site_seconds
+                requests += monitor.limiter.stats['requests']
+                peak = max(peak, monitor.limiter.stats['peak_active'])
+                ok += summary.filter(pl.col('status') == 'ok').height
+            rows.append(('one site at a time', seconds, requests, peak, ok))
+
+            for max_concurrent, per_host in args.limits:
+                seconds, monitor, summary = await _refresh(args.sites, args.start, args.end, max_concurrent, per_host)
+                ok = summary.filter((pl.col('site_code') != 'REGION') & (pl.col('status') == 'ok')).height
+                rows.append((f"fan-out {max_concurrent} global / {per_host} per host", seconds,
+                             monitor.limiter.stats['requests'], monitor.limiter.stats['peak_active'], ok))
+        finally:
+            # Close pooled connections before the loop goes away
+            await AsyncTransport.reset_instance()
+
+    return pl.DataFrame(rows, schema={
+        'mode': pl.Utf8, 'seconds': pl.Float64, 'requests': pl.Int64, 'peak_in_flight': pl.Int64, 'sites_ok': pl.Int64
+    }, orient='row').with_columns(pl.col('seconds').round(2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-site refresh of N sites against the local mock upstream")
+    parser.add_argument('--sites', nargs='+', default=BENCH_SITES, help="Sites with a bundled site_info JSON")
+    parser.add_argument('--start', type=int, default=6, help="Shift start hour (0-23)")
+    parser.add_argument('--end', type=int, default=18, help="Shift end hour (0-23)")
+    parser.add_argument('--rodeo-rows', type=int, default=20000, help="Rodeo backlog rows per site")
+    parser.add_argument('--associates', type=int, default=300, help="Associates per site")
+    parser.add_argument('--latency', type=float, default=0.1, help="Seconds before each mock response")
+    parser.add_argument('--rodeo-latency', type=float, default=0.5, help="Seconds before each Rodeo response")
+    parser.add_argument('--limits', nargs='+', type=_limits,
+                        default=[(4, 2), (MAX_CONCURRENT_REQUESTS, HOST_CONNECTION_LIMIT), (100, 100)],
+                        help="GLOBAL:PER_HOST request limits to compare")
+    args = parser.parse_args()
+    args.sites = [site.upper() for site in args.sites]
+
+    # Every run is a cold refresh, not answered from the response cache
+    areq.USE_RESPONSE_CACHE = False
+
+    print(f"{len(args.sites)} sites, {args.rodeo_rows} Rodeo rows each, mock at {UPSTREAM_OVERRIDE}")
+    results = asyncio.run(run(args))
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=60):
+        print(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import json
+import asyncio
+import argparse
+from typing import Any, Dict, List, Tuple
+
+# Every source goes to the local mock upstream (read by src.config.constants on import)
+os.environ.setdefault('PICKASSIST_UPSTREAM', 'http://127.0.0.1:8781')
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+import src.data.areq as areq
+from src.config.constants import UPSTREAM_OVERRIDE
+from src.config.chronos import TimeManager
+from src.config.site_build import SiteBuilder
+from src.data.bench.mock_sites import serving, fresh_history
+from src.data.merge import present_sources
+from src.data.mock_upstream import SyntheticSite, MockUpstream, load_pick_areas
+from src.data.processor import DataProcessor
+from src.data.transport import AsyncTransport
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class BrokenProcessMock(MockUpstream):
+    """Answers Process with a map _normalize_process cannot read, so it returns a bare pl.DataFrame()"""
+
+    async def _process(self, request):
+        body = json.dumps({'processPathInformationMap': {'PPBROKEN': 'not a process path'}}).encode()
+        return await self._serve(request, 'Process', 'application/json', [body])
+
+
+async def run(args) -> List[Tuple[str, bool]]:
+    shift_info = TimeManager.build_shift_info(args.site, args.start, args.end)
+    site = SyntheticSite(args.site, load_pick_areas(args.site), rodeo_rows=args.rodeo_rows)
+    # LPI answers last, so the second refresh publishes (with the failed Process) before it lands
+    mock = BrokenProcessMock(site, latency={'*': args.latency, 'LPI': args.lpi_latency})
+    processor = DataProcessor(shift_info=shift_info, site_info=SiteBuilder.for_site(shift_info).get_site_info())
+    partials: List[Dict[str, Any]] = []
+
+    async with serving(mock.app(), UPSTREAM_OVERRIDE):
+        try:
+            with fresh_history():
+                await processor.process_incoming_data()
+                full = processor.get_results()
+                await processor.process_incoming_data(on_partial=partials.append)
+        finally:
+            # Close pooled connections before the loop goes away
+            await AsyncTransport.reset_instance()
+
+    combined = full.get('combined_data') or {}
+    completeness = (partials[0].get('combined_data') or {}).get('completeness', {}) if partials else {}
+    return [
+        ("Process normalizer failed (bare DataFrame)", not isinstance(full.get('Process'), dict)),
+        ("Process left out of the merge", 'Process' not in present_sources(full)),
+        ("Full refresh merged the other sources", combined.get('process_level') is not None),
+        ("Partial results published while LPI was pending", len(partials) > 0),
+        ("Partial results mark LPI as pending", completeness.get('LPI') is False),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Progressive merge with a failing source against the local mock upstream")
+    parser.add_argument('--site', default='SAV7', help="Site with a bundled site_info JSON")
+    parser.add_argument('--start', type=int, default=6, help="Shift start hour (0-23)")
+    parser.add_argument('--end', type=int, default=18, help="Shift end hour (0-23)")
+    parser.add_argument('--rodeo-rows', type=int, default=4000, help="Rodeo backlog rows")
+    parser.add_argument('--latency', type=float, default=0.05, help="Seconds before each mock response")
+    parser.add_argument('--lpi-latency', type=float, default=1.0, help="Seconds before each LPI response")
+    args = parser.parse_args()
+    args.site = args.site.upper()
+
+    # Every refresh fetches again, not answered from the response cache
+    areq.USE_RESPONSE_CACHE = False
+
+    checks = asyncio.run(run(args))
+    for name, ok in checks:
+        print(f"{'OK  ' if ok else 'FAIL'} {name}")
+    if not all(ok for _, ok in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
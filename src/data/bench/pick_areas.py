@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+import random
+import argparse
+import polars as pl
+from typing import List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.data.pick_area_index import PickAreaIndex
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+def legacy_assign(pick_areas: pl.DataFrame, locations: pl.DataFrame) -> pl.Series:
+    """Reference: the per-row filter _normalize_rodeo used before PickAreaIndex"""
+    pick_areas = (
+        pick_areas
+        .select([
+            pl.col('Name'),
+            pl.col('Start Aisle'),
+            pl.col('End Aisle'),
+            pl.col('Start Slot'),
+            pl.col('End Slot')
+        ])
+        .with_columns([
+            pl.col('Start Aisle').str.extract_all(r'\d+').list.first().cast(pl.Int64),
+            pl.col('End Aisle').str.extract_all(r'\d+').list.first().cast(pl.Int64),
+            pl.col('Start Slot').cast(pl.Int64),
+            pl.col('End Slot').cast(pl.Int64)
+        ])
+    )
+
+    def find_pick_area(aisle: Optional[int], slot: Optional[int]) -> Optional[str]:
+        if aisle is None or slot is None:
+            return None
+        matches = pick_areas.filter(
+            (pl.col('Start Aisle') <= aisle) &
+            (pl.col('End Aisle') >= aisle) &
+            (pl.col('Start Slot') <= slot) &
+            (pl.col('End Slot') >= slot)
+        )
+        return matches['Name'][0] if matches.height > 0 else None
+
+    return locations.select(
+        pl.struct(['Aisle', 'Slot'])
+        .map_elements(lambda x: find_pick_area(x['Aisle'], x['Slot']), return_dtype=pl.Utf8)
+        .alias('Pick Area')
+    )['Pick Area']
+
+
+def layout(areas: int, overlap: bool, seed: int) -> pl.DataFrame:
+    """Random pick areas as site_info has them (string bounds, some "A101"-style aisles, one unusable row)"""
+    rng = random.Random(seed + areas)
+    rows = []
+    for index in range(areas):
+        start_aisle = rng.randint(1, 950)
+        end_aisle = start_aisle + rng.randint(0, 60 if overlap else 8)
+        start_slot = rng.choice([1, 1, 100, 200, 300])
+        rows.append({
+            'Name': f"AREA{index}",
+            'Start Aisle': f"A{start_aisle}" if index % 3 == 0 else str(start_aisle),
+            'End Aisle': str(end_aisle),
+            'Start Slot': str(start_slot),
+            'End Slot': str(start_slot + rng.randint(10, 400)),
+        })
+    rows.append({'Name': 'NO AISLE', 'Start Aisle': 'x', 'End Aisle': '5', 'Start Slot': '1', 'End Slot': '9'})
+    return pl.DataFrame(rows)
+
+
+def locations(rows: int, seed: int) -> pl.DataFrame:
+    """Aisle / Slot as _normalize_rodeo has them: -1 when unparsed (null slots for good measure)"""
+    rng = random.Random(seed)
+    return pl.DataFrame({
+        'Aisle': [rng.choice([rng.randint(0, 1000), -1]) for _ in range(rows)],
+        'Slot': [rng.choice([rng.randint(0, 800), -1, None]) for _ in range(rows)],
+    }, schema={'Aisle': pl.Int64, 'Slot': pl.Int64})
+
+
+def run(args) -> pl.DataFrame:
+    frame = locations(args.rows, args.seed)
+    results: List[tuple] = []
+    for areas in args.areas:
+        for overlap in (False, True):
+            pick_areas = layout(areas, overlap, args.seed)
+
+            started = time.perf_counter()
+            index = PickAreaIndex(pick_areas)
+            build = time.perf_counter() - started
+
+            started = time.perf_counter()
+            assigned = frame.lazy().select(index.assign('Aisle', 'Slot').alias('Pick Area')).collect()['Pick Area']
+            assign = time.perf_counter() - started
+
+            started = time.perf_counter()
+            expected = legacy_assign(pick_areas, frame)
+            legacy = time.perf_counter() - started
+
+            mismatches = (~expected.eq_missing(assigned)).sum()
+            results.append((areas, overlap, build * 1000, assign * 1000, legacy, assigned.is_not_null().sum(), mismatches))
+
+    return pl.DataFrame(results, schema={
+        'areas': pl.Int64, 'overlapping': pl.Boolean, 'build_ms': pl.Float64, 'assign_ms': pl.Float64,
+        'per_row_filter_s': pl.Float64, 'matched': pl.Int64, 'mismatches': pl.Int64
+    }, orient='row').with_columns(pl.col('build_ms', 'assign_ms', 'per_row_filter_s').round(2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pick-area assignment, per-row filter vs PickAreaIndex, with a differential check")
+    parser.add_argument('--rows', type=int, default=20000, help="Rodeo locations to assign")
+    parser.add_argument('--areas', nargs='+', type=int, default=[100, 500, 1000, 2000], help="Pick areas per layout")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the layouts and locations")
+    args = parser.parse_args()
+
+    results = run(args)
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(results)
+    if results['mismatches'].sum():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
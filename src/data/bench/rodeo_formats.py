@@ -0,0 +1,101 @@
+import io
+import os
+import sys
+import time
+import pytz
+import argparse
+import polars as pl
+from datetime import datetime as dt
+from typing import Any, Callable, Tuple
+
+# Optional: the pre-parser baseline, only with --pandas
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.config.constants import STREAM_CHUNK_BYTES, STREAM_BATCH_ROWS
+from src.data.html_table import read_table
+from src.data.mock_upstream import SyntheticSite, load_pick_areas
+from src.data.table_stream import TableStreamParser, RODEO_SCHEMA, RODEO_COLUMNS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+def _best(parse: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Fastest of `repeat` runs and its result"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = parse()
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def _streamed(body: bytes) -> pl.DataFrame:
+    """The body fed to the streaming parser in download-sized chunks, as areq does"""
+    parser = TableStreamParser(schema=RODEO_SCHEMA, batch_rows=STREAM_BATCH_ROWS, columns=RODEO_COLUMNS)
+    for offset in range(0, len(body), STREAM_CHUNK_BYTES):
+        parser.feed(body[offset:offset + STREAM_CHUNK_BYTES])
+    return parser.close()
+
+
+def run(args) -> pl.DataFrame:
+    pick_areas = load_pick_areas(args.site)
+    now = dt.now(pytz.UTC)
+    rows = []
+    for rodeo_rows in args.rows:
+        bodies = {
+            rodeo_format: b''.join(
+                SyntheticSite(args.site, pick_areas, rodeo_rows=rodeo_rows, seed=1, rodeo_format=rodeo_format).rodeo_chunks(now)
+            )
+            for rodeo_format in ('html', 'csv', 'tsv')
+        }
+        paths = [
+            ('html', 'whole body', lambda: read_table(bodies['html'], RODEO_SCHEMA, RODEO_COLUMNS)),
+            ('html', 'streamed', lambda: _streamed(bodies['html'])),
+            ('csv', 'whole body', lambda: read_table(bodies['csv'], RODEO_SCHEMA, RODEO_COLUMNS)),
+            ('csv', 'streamed', lambda: _streamed(bodies['csv'])),
+            ('tsv', 'whole body', lambda: read_table(bodies['tsv'], RODEO_SCHEMA, RODEO_COLUMNS)),
+        ]
+        if args.pandas and pd is not None:
+            paths.insert(0, ('html', 'pandas.read_html', lambda: pd.read_html(io.StringIO(bodies['html'].decode('utf-8')))[0]))
+
+        expected = None
+        for rodeo_format, path, parse in paths:
+            seconds, df = _best(parse, 1 if path == 'pandas.read_html' else args.repeat)
+            if path == 'pandas.read_html':
+                # pandas types its own columns, only the rows can be compared
+                same = len(df) == rodeo_rows
+            else:
+                df = df.select(RODEO_COLUMNS)
+                expected = df if expected is None else expected
+                same = df.equals(expected)
+            rows.append((rodeo_rows, rodeo_format, path, len(bodies[rodeo_format]) / 1e6, seconds, same))
+
+    return pl.DataFrame(rows, schema={
+        'rows': pl.Int64, 'format': pl.Utf8, 'parse': pl.Utf8, 'body_mb': pl.Float64, 'seconds': pl.Float64, 'same_frame': pl.Boolean
+    }, orient='row').with_columns(pl.col('body_mb').round(1), pl.col('seconds').round(3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rodeo ItemList parse time, CSV/TSV export vs HTML table")
+    parser.add_argument('--site', default='SAV7', help="Site with a bundled site_info JSON")
+    parser.add_argument('--rows', nargs='+', type=int, default=[100000, 300000], help="Rodeo backlog rows")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per parse, the fastest is shown")
+    parser.add_argument('--pandas', action='store_true', help="Also time pandas.read_html (slow)")
+    args = parser.parse_args()
+    args.site = args.site.upper()
+
+    results = run(args)
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(results)
+
+
+if __name__ == "__main__":
+    main()
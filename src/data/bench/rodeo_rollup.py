@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import polars as pl
+from datetime import timedelta as td
+from typing import Any, Dict, List, Tuple
+
+# No upstream is called, but the processor's request handler must not need Midway
+os.environ.setdefault('PICKASSIST_UPSTREAM', 'http://127.0.0.1:8781')
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.config.chronos import TimeManager
+from src.config.site_build import SiteBuilder
+from src.data.processor import DataProcessor
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+SUMMARIES = ['cpt_summary', 'cpt_process_summary', 'cpt_process_area_summary']
+
+
+def legacy_group_rodeo(processor: DataProcessor, df: pl.DataFrame) -> Dict[str, Any]:
+    """Reference: the three count queries and three group_bys _group_rodeo ran before the rollup cube"""
+    cpt_hours = processor._cpt_hours_remaining(df)
+    is_hov = pl.col('process_path').str.contains('PPHOVRESERVE')
+
+    def picks(frame: pl.LazyFrame) -> int:
+        return frame.select([pl.col('transfer_request_id').count().alias("vol")]).collect().get_column('vol')[0]
+
+    def finish(summary: pl.DataFrame, sort: bool) -> pl.DataFrame:
+        summary = summary.join(cpt_hours, on='cpt', how='left').with_columns([
+            (pl.col('total_units') / pl.col('total_cases')).round(2).alias('case_density')
+        ])
+        return (summary.sort('cpt') if sort else summary).with_columns([
+            pl.col('hours_remaining').fill_null(pl.col('hours_remaining').max()).alias('hours_remaining')
+        ])
+
+    counts = [pl.col('transfer_request_id').count().alias("total_cases"), pl.col('quantity').sum().alias("total_units")]
+    return {
+        "picks": {
+            "non_hov_picks_rem": picks(df.lazy().filter(~is_hov)),
+            "hov_picks_rem": picks(df.lazy().filter(is_hov)),
+            "all_picks_rem": picks(df.lazy()),
+        },
+        "cpt_summary": finish(df.group_by('cpt').agg(counts + [
+            pl.when(is_hov).then(pl.col('transfer_request_id')).count().alias('hov_cases')
+        ]), True),
+        "cpt_process_summary": finish(
+            df.group_by(['cpt', 'process_path']).agg(counts).sort('cpt', 'process_path'), True
+        ),
+        "cpt_process_area_summary": finish(
+            df.group_by(['cpt', 'process_path', 'pick_area']).agg(counts).sort('cpt', 'process_path', 'pick_area'), False
+        ),
+    }
+
+
+def rodeo_frame(rows: int, shift_info: Dict[str, Any], args, seed: int, prefix: str = 'T') -> pl.DataFrame:
+    """
+    A synthetic enriched rodeo_full: half-hourly CPTs from now, HOV rows under
+    the 'HOV' CPT, each path picking from its own run of areas (some unknown)
+    """
+    now = shift_info['now'].replace(second=0, microsecond=0)
+    times = [now + td(minutes=30 * index) for index in range(args.cpts)]
+    slots = pl.DataFrame({
+        'need_to_ship_by_date': [time.strftime('%Y-%m-%d %H:%M:00') for time in times],
+        'cpt': [time.strftime('%m-%d %H:%M') for time in times],
+    }).sample(rows, with_replacement=True, seed=seed)
+    # Path index `paths` is the HOV path, area offset `areas_per_path` an unknown area
+    path = pl.col('path')
+    area = (path * args.areas_per_path + pl.col('area')) % args.areas
+    return slots.with_columns([
+        pl.format(prefix + '{}', pl.int_range(pl.len())).alias('transfer_request_id'),
+        pl.Series(['ATL7', 'AVP8', 'HGR5', 'SAV7']).sample(rows, with_replacement=True, seed=seed + 1).alias('destination_warehouse'),
+        pl.Series(range(args.paths + 1)).sample(rows, with_replacement=True, seed=seed + 2).alias('path'),
+        pl.Series(range(1, 50)).sample(rows, with_replacement=True, seed=seed + 3).alias('quantity'),
+        pl.Series(range(args.areas_per_path + 1)).sample(rows, with_replacement=True, seed=seed + 4).alias('area'),
+    ]).with_columns([
+        pl.when(path == args.paths).then(pl.lit('PPHOVRESERVE')).otherwise(pl.format('PPPATH{}', path)).alias('process_path'),
+        pl.when(pl.col('area') < args.areas_per_path).then(pl.format('AREA{}', area.cast(pl.Utf8).str.zfill(3))).alias('pick_area'),
+        pl.when(path == args.paths).then(pl.lit('HOV')).otherwise(pl.col('cpt')).alias('cpt'),
+    ]).drop('path', 'area')
+
+
+def refreshed(snapshot: pl.DataFrame, shift_info: Dict[str, Any], args) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """The next snapshot with `churn` of the rows picked and as many new ones listed, and those two sets"""
+    changed = int(snapshot.height * args.churn)
+    removed = snapshot.sample(changed, seed=args.seed + 10)
+    added = rodeo_frame(changed, shift_info, args, args.seed + 20, prefix='N')
+    kept = snapshot.join(removed.select('transfer_request_id'), on='transfer_request_id', how='anti')
+    return pl.concat([kept, added]), added, removed
+
+
+def differences(expected: Dict[str, Any], result: Dict[str, Any]) -> List[str]:
+    """Pick counts and summaries that differ between the two implementations"""
+    different = [name for name, value in expected['picks'].items() if result['picks'][name] != value]
+    different += [name for name in SUMMARIES if not expected[name].equals(result[name])]
+    return different
+
+
+def _timed(group, df: pl.DataFrame, repeat: int):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = group(df)
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def run(args) -> pl.DataFrame:
+    shift_info = TimeManager.build_shift_info(args.site, args.start, args.end)
+    processor = DataProcessor(shift_info=shift_info, site_info=SiteBuilder.for_site(shift_info).get_site_info())
+    legacy = lambda df: legacy_group_rodeo(processor, df)
+    cube = lambda df: asyncio.run(processor._group_rodeo(df))
+
+    rows = []
+    for size in args.rows:
+        full = rodeo_frame(size, shift_info, args, args.seed)
+        cases = {'first refresh': full}
+        if size == args.rows[-1]:
+            cases.update({'no HOV': full.filter(pl.col('process_path') != 'PPHOVRESERVE'), 'empty': full.head(0)})
+        for case, df in cases.items():
+            legacy_seconds, expected = _timed(legacy, df, args.repeat)
+            seconds, result = _timed(cube, df, args.repeat)
+            rows.append((case, df.height, legacy_seconds, seconds, ', '.join(differences(expected, result)) or '-'))
+
+        # A later refresh: the cube of the last snapshot takes the changed rows
+        snapshot = processor._rodeo_cube(full)
+        df, added, removed = refreshed(full, shift_info, args)
+        delta = {'added': added, 'removed': removed, 'kept': df}
+
+        def update(df: pl.DataFrame) -> Dict[str, Any]:
+            processor.rodeo_delta.cube = snapshot
+            return asyncio.run(processor._group_rodeo(df, delta))
+
+        legacy_seconds, expected = _timed(legacy, df, args.repeat)
+        seconds, result = _timed(update, df, args.repeat)
+        rows.append((f"refresh, {args.churn:.0%} changed", df.height, legacy_seconds, seconds, ', '.join(differences(expected, result)) or '-'))
+    processor.rodeo_delta.cube = None
+
+    return pl.DataFrame(rows, schema={
+        'case': pl.Utf8, 'rows': pl.Int64, 'group_bys_s': pl.Float64, 'rollup_cube_s': pl.Float64, 'differences': pl.Utf8
+    }, orient='row').with_columns(pl.col('group_bys_s', 'rollup_cube_s').round(3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rodeo grouping, separate group_bys vs the rollup cube, with a differential check")
+    parser.add_argument('--site', default='SAV7', help="Site with a bundled site_info JSON")
+    parser.add_argument('--start', type=int, default=6, help="Shift start hour (0-23)")
+    parser.add_argument('--end', type=int, default=18, help="Shift end hour (0-23)")
+    parser.add_argument('--rows', nargs='+', type=int, default=[20000, 200000, 1000000], help="rodeo_full rows")
+    parser.add_argument('--paths', type=int, default=20, help="Non-HOV process paths")
+    parser.add_argument('--areas', type=int, default=200, help="Pick areas")
+    parser.add_argument('--areas-per-path', type=int, default=20, help="Pick areas a process path picks from")
+    parser.add_argument('--cpts', type=int, default=40, help="Half-hourly CPTs")
+    parser.add_argument('--churn', type=float, default=0.05, help="Share of the rows picked (and newly listed) between refreshes")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per implementation, the fastest is shown")
+    parser.add_argument('--seed', type=int, default=7, help="Seed of the synthetic rows")
+    args = parser.parse_args()
+    args.site = args.site.upper()
+
+    results = run(args)
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(results)
+    if (results['differences'] != '-').any():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import polars as pl
+
+# Every source goes to the local mock upstream (read by src.config.constants on import)
+os.environ.setdefault('PICKASSIST_UPSTREAM', 'http://127.0.0.1:8781')
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+import src.data.areq as areq
+from src.config.constants import UPSTREAM_OVERRIDE
+from src.config.chronos import TimeManager
+from src.data.areq import AsyncRequestHandler, build_urls
+from src.data.bench.mock_sites import serving
+from src.data.html_table import read_table
+from src.data.mock_upstream import SyntheticSite, MockUpstream, load_pick_areas
+from src.data.table_stream import RODEO_SCHEMA, RODEO_COLUMNS
+from src.data.transport import AsyncTransport
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+async def run(args) -> pl.DataFrame:
+    shift_info = TimeManager.build_shift_info(args.site, args.start, args.end)
+    site = SyntheticSite(args.site, load_pick_areas(args.site), rodeo_rows=args.rodeo_rows, rodeo_format=args.format)
+    # Latency per request, drip per connection: what sharding can win back
+    mock = MockUpstream(site, latency={'*': args.latency}, drip={'*': args.drip})
+    handler = AsyncRequestHandler(shift_info=shift_info)
+    url = build_urls(shift_info)['Rodeo']
+
+    rows, expected = [], None
+    async with serving(mock.app(), UPSTREAM_OVERRIDE):
+        try:
+            for streamed in (True, False):
+                for shards in args.shards:
+                    areq.STREAM_RODEO, areq.RODEO_SHARDS = streamed, shards
+                    started = time.perf_counter()
+                    response = await handler._make_request('Rodeo', url)
+                    seconds = time.perf_counter() - started
+
+                    content = response['content'] if response and response['status_code'] == 200 else None
+                    if isinstance(content, str):
+                        # One unsharded, unstreamed request hands the body to the processor
+                        content = await asyncio.to_thread(read_table, content, RODEO_SCHEMA, RODEO_COLUMNS)
+                    ids = set(content['Transfer Request ID'].to_list()) if content is not None else set()
+                    expected = ids if expected is None else expected
+                    rows.append((streamed, shards, seconds, len(ids), ids == expected))
+        finally:
+            # Close pooled connections before the loop goes away
+            await AsyncTransport.reset_instance()
+
+    return pl.DataFrame(rows, schema={
+        'streamed': pl.Boolean, 'shards': pl.Int64, 'seconds': pl.Float64, 'rows': pl.Int64, 'same_rows': pl.Boolean
+    }, orient='row').with_columns(pl.col('seconds').round(2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rodeo fetch time by ExSD shard count against the local mock upstream")
+    parser.add_argument('--site', default='SAV7', help="Site with a bundled site_info JSON")
+    parser.add_argument('--start', type=int, default=6, help="Shift start hour (0-23)")
+    parser.add_argument('--end', type=int, default=18, help="Shift end hour (0-23)")
+    parser.add_argument('--rodeo-rows', type=int, default=100000, help="Rodeo backlog rows")
+    parser.add_argument('--format', choices=['html', 'csv'], default='html', help="Rodeo body format")
+    parser.add_argument('--latency', type=float, default=1.0, help="Seconds before each mock response")
+    parser.add_argument('--drip', type=float, default=4e6, help="Bytes per second per connection (0 = unlimited)")
+    parser.add_argument('--shards', nargs='+', type=int, default=[1, 2, 4, 8], help="RODEO_SHARDS values to compare")
+    args = parser.parse_args()
+    args.site = args.site.upper()
+
+    # Every fetch goes to the mock, not answered from the response cache
+    areq.USE_RESPONSE_CACHE = False
+
+    print(f"{args.rodeo_rows} Rodeo rows ({args.format}), {args.latency}s latency, mock at {UPSTREAM_OVERRIDE}")
+    results = asyncio.run(run(args))
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(results)
+
+
+if __name__ == "__main__":
+    main()
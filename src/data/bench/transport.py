@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import threading
+import requests
+import polars as pl
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List
+
+# Optional: the stub upstream runs on aiohttp.web
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from src.data.transport import AsyncTransport
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# One loopback address per upstream host (picking-console, fclm-portal, rodeo),
+# so each gets its own connection pool as it does live
+SOURCE_HOSTS = {
+    'Workforce': '127.0.0.1',
+    'Process': '127.0.0.1',
+    'LPI': '127.0.0.2',
+    'Rodeo': '127.0.0.3',
+}
+STUB_THREAD_PREFIX = 'stub-upstream'
+
+
+class NoCookies:
+    """Stands in for AmznReq: the stub upstream needs no cookies"""
+    def export_cookies(self):
+        return None
+
+
+def stub_app(latency: float, body: bytes) -> 'web.Application':
+    """Answers every GET with `body` after `latency` seconds"""
+    async def answer(request):
+        await asyncio.sleep(latency)
+        return web.Response(body=body, content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', answer)
+    return app
+
+
+@contextmanager
+def serving_in_thread(app: 'web.Application', hosts: List[str], port: int):
+    """
+    Run `app` on `port` at each of `hosts`, on its own event loop and thread
+    (threads named STUB_THREAD_PREFIX), so blocked client threads cannot starve it
+    """
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(thread_name_prefix=STUB_THREAD_PREFIX))
+    thread = threading.Thread(target=loop.run_forever, name=STUB_THREAD_PREFIX, daemon=True)
+    thread.start()
+
+    async def start() -> 'web.AppRunner':
+        runner = web.AppRunner(app)
+        await runner.setup()
+        for host in hosts:
+            await web.TCPSite(runner, host, port).start()
+        return runner
+
+    runner = asyncio.run_coroutine_threadsafe(start(), loop).result()
+    try:
+        yield
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _client_threads() -> int:
+    """Threads alive, not counting the stub upstream's"""
+    return sum(1 for thread in threading.enumerate() if not thread.name.startswith(STUB_THREAD_PREFIX))
+
+
+async def _peak_threads(stop: asyncio.Event) -> int:
+    """Most client threads alive at once until `stop` is set"""
+    peak = _client_threads()
+    while not stop.is_set():
+        peak = max(peak, _client_threads())
+        await asyncio.sleep(0.01)
+    return peak
+
+
+async def _refreshes(urls: List[str], rounds: int, fetch: Callable[[str], Awaitable[int]]):
+    """`rounds` refreshes of every URL at once: (seconds, requests, failed, threads added)"""
+    # A fresh default executor, so idle workers of an earlier run are not counted
+    executor = ThreadPoolExecutor()
+    asyncio.get_running_loop().set_default_executor(executor)
+    baseline = _client_threads()
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_peak_threads(stop))
+    started = time.perf_counter()
+    statuses = []
+    try:
+        for _ in range(rounds):
+            statuses.extend(await asyncio.gather(*(fetch(url) for url in urls)))
+        seconds = time.perf_counter() - started
+    finally:
+        stop.set()
+        peak = await sampler
+        executor.shutdown(wait=True)
+    failed = sum(1 for status in statuses if status != 200)
+    return seconds, len(statuses), failed, peak - baseline
+
+
+async def run(args) -> pl.DataFrame:
+    urls = [
+        f"http://{host}:{args.port}/SITE{site}/{source}"
+        for site in range(args.sites) for source, host in SOURCE_HOSTS.items()
+    ]
+    body = b'<html><table>' + b'<tr><td>row</td></tr>' * (args.body_kb * 1024 // 20) + b'</table></html>'
+
+    rows = []
+    with serving_in_thread(stub_app(args.latency, body), sorted(set(SOURCE_HOSTS.values())), args.port):
+        # Before: AmznReq (a requests session) called from worker threads
+        session = requests.Session()
+        async def threaded(url: str) -> int:
+            response = await asyncio.to_thread(lambda: session.get(url, verify=False, allow_redirects=True))
+            response.content
+            return response.status_code
+        try:
+            rows.append(('to_thread + requests', *await _refreshes(urls, args.rounds, threaded)))
+        finally:
+            session.close()
+
+        # After: pooled aiohttp sessions on the event loop
+        transport = AsyncTransport.get_instance(NoCookies())
+        async def pooled(url: str) -> int:
+            return (await transport.get(url)).status_code
+        try:
+            rows.append(('AsyncTransport', *await _refreshes(urls, args.rounds, pooled)))
+        finally:
+            # Close pooled connections before the loop goes away
+            await AsyncTransport.reset_instance()
+
+    return pl.DataFrame(rows, schema={
+        'transport': pl.Utf8, 'seconds': pl.Float64, 'requests': pl.Int64, 'failed': pl.Int64, 'threads_added': pl.Int64
+    }, orient='row').with_columns(pl.col('seconds').round(2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Threaded requests vs the pooled asyncio transport against a local stub upstream")
+    parser.add_argument('--sites', type=int, default=10, help="Sites refreshed at once, each with every source")
+    parser.add_argument('--rounds', type=int, default=3, help="Refreshes of every URL")
+    parser.add_argument('--latency', type=float, default=0.3, help="Seconds before each stub response")
+    parser.add_argument('--body-kb', type=int, default=100, help="Size of each response body")
+    parser.add_argument('--port', type=int, default=8790, help="Stub port on every loopback host")
+    args = parser.parse_args()
+    if web is None:
+        sys.exit("aiohttp is required for the stub upstream")
+
+    print(f"{args.sites} sites x {len(SOURCE_HOSTS)} sources, {args.rounds} rounds, "
+          f"{args.latency}s latency, {args.body_kb} KB bodies, {os.cpu_count()} CPUs")
+    results = asyncio.run(run(args))
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(results)
+
+
+if __name__ == "__main__":
+    main()
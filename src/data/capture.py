@@ -0,0 +1,252 @@
+import io
+import os
+import sys
+import json
+import time
+import pytz
+import zipfile
+import polars as pl
+from datetime import date, datetime as dt, timedelta as td
+from typing import Any, Dict, List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import CAPTURE_DIR, CAPTURE_KEEP
+from src.data.lpi_history import LpiHistoryStore
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Credentials are never written to a bundle (cookies stay in the encrypted vault)
+SENSITIVE_HEADERS = {'set-cookie', 'cookie', 'authorization', 'proxy-authorization', 'www-authenticate'}
+
+
+def safe_headers(headers) -> Dict[str, str]:
+    """Headers without cookies or auth tokens"""
+    return {key: value for key, value in (headers or {}).items() if key.lower() not in SENSITIVE_HEADERS}
+
+
+def encode_shift_info(shift_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Shift info as plain JSON (datetimes as ISO strings, timedeltas as seconds)"""
+    encoded = {}
+    for key, value in shift_info.items():
+        if key == 'tz':
+            # Rebuilt from 'timezone' on load
+            continue
+        if isinstance(value, dt):
+            encoded[key] = {'datetime': value.isoformat()}
+        elif isinstance(value, date):
+            encoded[key] = {'date': value.isoformat()}
+        elif isinstance(value, td):
+            encoded[key] = {'timedelta': value.total_seconds()}
+        else:
+            encoded[key] = value
+    return encoded
+
+
+def decode_shift_info(encoded: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of encode_shift_info"""
+    tz = pytz.timezone(encoded['timezone'])
+    shift_info = {}
+    for key, value in encoded.items():
+        if isinstance(value, dict) and 'datetime' in value:
+            value = dt.fromisoformat(value['datetime'])
+            if value.tzinfo is not None:
+                value = value.astimezone(tz)
+        elif isinstance(value, dict) and 'date' in value:
+            value = date.fromisoformat(value['date'])
+        elif isinstance(value, dict) and 'timedelta' in value:
+            value = td(seconds=value['timedelta'])
+        shift_info[key] = value
+    shift_info['tz'] = tz
+    return shift_info
+
+
+class ResponseCapture:
+    """
+    Records one refresh worth of upstream responses for offline replay.
+
+    Every fetch keeps its status, headers, raw body and timing relative to the
+    start of the refresh, and every source handed to DataProcessor keeps the
+    moment it was yielded. finish() writes it all, with the shift and site
+    context, to one compressed zip per refresh in CAPTURE_DIR.
+    Bundles are played back with src/data/replay.py.
+    """
+
+    def __init__(self, capture_dir: str = CAPTURE_DIR, keep: int = CAPTURE_KEEP):
+        self.capture_dir = capture_dir
+        self.keep = keep
+        self.active = False
+        self._reset()
+
+    def _reset(self):
+        self._started = None
+        self._context: Dict[str, Any] = {}
+        self._fetches: List[Dict[str, Any]] = []
+        self._sources: List[Dict[str, Any]] = []
+        self._files: Dict[str, bytes] = {}
+
+
+
+    def begin(self, shift_info: Dict[str, Any], site_info: Optional[Dict[str, Any]] = None, sources: Optional[List[str]] = None):
+        """Start recording a refresh"""
+        self._reset()
+        self.active = True
+        self._started = time.monotonic()
+        self._context = {
+            'captured_at': dt.now(pytz.UTC).isoformat(),
+            'site_code': shift_info['site_code'],
+            'shift_info': encode_shift_info(shift_info),
+            'requested': sources,
+            'plan_data': None,
+        }
+
+        if site_info:
+            pick_areas = site_info.get('pick_areas')
+            if isinstance(pick_areas, pl.DataFrame):
+                self._files['site/pick_areas.parquet'] = self._frame_bytes(pick_areas)
+            self._context['plan_data'] = site_info.get('plan_data')
+
+    def elapsed(self) -> float:
+        """Seconds since begin()"""
+        return time.monotonic() - self._started
+
+    def record_fetch(self, name: str, url: str, status_code: int, headers, body: bytes,
+                     started: float, encoding: Optional[str] = None, streamed: bool = False):
+        """Keep one upstream response as it came off the wire"""
+        if not self.active:
+            return
+        fetch_id = len(self._fetches)
+        file_name = f"fetches/{fetch_id:03d}.body"
+        self._files[file_name] = body or b''
+        self._fetches.append({
+            'id': fetch_id,
+            'name': name,
+            'url': url,
+            'status_code': status_code,
+            'headers': safe_headers(headers),
+            'encoding': encoding,
+            'kind': 'raw',
+            'streamed': streamed,
+            'file': file_name,
+            'size': len(body or b''),
+            'started': round(started - self._started, 4),
+            'finished': round(self.elapsed(), 4),
+        })
+
+    def record_cached(self, name: str, url: str, content: Any, started: float):
+        """Keep a response that was answered from the response cache"""
+        if not self.active:
+            return
+        fetch_id = len(self._fetches)
+        if isinstance(content, pl.DataFrame):
+            kind, file_name, data = 'frame', f"fetches/{fetch_id:03d}.parquet", self._frame_bytes(content)
+        elif isinstance(content, (dict, list)):
+            kind, file_name, data = 'json', f"fetches/{fetch_id:03d}.json", json.dumps(content).encode('utf-8')
+        else:
+            kind, file_name, data = 'text', f"fetches/{fetch_id:03d}.txt", str(content).encode('utf-8')
+
+        self._files[file_name] = data
+        self._fetches.append({
+            'id': fetch_id,
+            'name': name,
+            'url': url,
+            'status_code': 200,
+            'headers': {},
+            'encoding': 'utf-8',
+            'kind': kind,
+            'streamed': False,
+            'file': file_name,
+            'size': len(data),
+            'started': round(started - self._started, 4),
+            'finished': round(self.elapsed(), 4),
+        })
+
+    def record_source(self, name: str, response: Optional[Dict[str, Any]]):
+        """Note when a source was handed to the processor"""
+        if not self.active:
+            return
+        entry = {
+            'name': name,
+            'offset': round(self.elapsed(), 4),
+            'status_code': response['status_code'] if response else None,
+        }
+
+        content = response.get('content') if response else None
+        if isinstance(content, dict) and 'pages' in content:
+            # Day-by-day LPI history, the stored days are added on finish()
+            entry['history'] = {
+                'site_code': content['site_code'],
+                'days': [day.isoformat() for day in content['days']],
+            }
+        self._sources.append(entry)
+
+    def finish(self) -> Optional[str]:
+        """Write the bundle and drop old ones, returns the bundle path"""
+        if not self.active:
+            return None
+        self.active = False
+
+        try:
+            # The processor only composes LPI history from its store, so the
+            # replay needs every day of the window, not just the fetched ones
+            history = LpiHistoryStore.get_instance()
+            for source in self._sources:
+                if 'history' not in source:
+                    continue
+                site_code = source['history']['site_code']
+                for day in source['history']['days']:
+                    stored = history.load_day(site_code, date.fromisoformat(day))
+                    if stored is not None:
+                        self._files[f"lpi_history/{site_code}/{day}.parquet"] = self._frame_bytes(stored)
+
+            manifest = dict(self._context)
+            manifest['duration'] = round(self.elapsed(), 4)
+            manifest['fetches'] = self._fetches
+            manifest['sources'] = self._sources
+
+            os.makedirs(self.capture_dir, exist_ok=True)
+            stamp = dt.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join(self.capture_dir, f"{manifest['site_code']}_{stamp}.zip")
+            with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+                bundle.writestr('manifest.json', json.dumps(manifest, indent=2, default=str))
+                for file_name, data in self._files.items():
+                    bundle.writestr(file_name, data)
+
+            size = os.path.getsize(path)
+            logger.info(f"Captured {len(self._fetches)} responses ({size} bytes) to {path}")
+            print(f"Capture saved: {path}")
+            self._prune()
+            return path
+
+        except Exception as e:
+            logger.warning(f"Could not write capture bundle: {str(e)}")
+            return None
+
+        finally:
+            self._reset()
+
+    def _prune(self):
+        """Keep only the newest `keep` bundles"""
+        if self.keep <= 0:
+            return
+        bundles = [
+            os.path.join(self.capture_dir, file_name)
+            for file_name in os.listdir(self.capture_dir)
+            if file_name.endswith('.zip')
+        ]
+        bundles.sort(key=os.path.getmtime, reverse=True)
+        for path in bundles[self.keep:]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove old capture {path}: {str(e)}")
+
+    @staticmethod
+    def _frame_bytes(df: pl.DataFrame) -> bytes:
+        buffer = io.BytesIO()
+        df.write_parquet(buffer)
+        return buffer.getvalue()
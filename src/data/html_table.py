@@ -0,0 +1,101 @@
+import os
+import sys
+import polars as pl
+from lxml import etree
+from typing import Dict, List, Optional, Union
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.data.table_stream import TableStreamParser, sniff_delimiter, read_delimited, SNIFF_BYTES
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+def _first_table(root) -> Optional[etree._Element]:
+    """First top-level <table> in document order (same table as read_html(...)[0])"""
+    for table in root.iter('table'):
+        return table
+    return None
+
+
+def _table_rows(table) -> List[etree._Element]:
+    """Rows of the table itself, not of tables nested in its cells"""
+    return table.xpath('./tr|./thead/tr|./tbody/tr|./tfoot/tr')
+
+
+def read_html_table(body: Union[str, bytes], schema: Optional[Dict[str, pl.DataType]] = None,
+                    columns: Optional[List[str]] = None) -> pl.DataFrame:
+    """
+    Read the first <table> of an HTML document into Polars.
+
+    The document is parsed once with lxml and the rows are walked a single
+    time, collecting each cell's raw text; the columns are then built as
+    Polars string columns (only `columns` when given) and trimmed, nulled and
+    typed there in bulk. The first row is the header (repeated names are
+    suffixed like pandas does), empty cells become null and `schema` columns
+    are cast like the streaming parser does (bad values become null).
+    """
+    schema = schema or {}
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if not body.strip():
+        return pl.DataFrame()
+
+    root = etree.fromstring(body, etree.HTMLParser(encoding='utf-8', huge_tree=True))
+    table = _first_table(root) if root is not None else None
+    if table is None:
+        raise ValueError("No tables found")
+
+    rows = iter(_table_rows(table))
+    header_row = next(rows, None)
+    if header_row is None:
+        return pl.DataFrame()
+
+    header = TableStreamParser._unique_names(
+        [''.join(cell.itertext()).strip() for cell in header_row if cell.tag in ('td', 'th')]
+    )
+    if columns:
+        missing = [name for name in columns if name not in header]
+        if missing:
+            logger.warning(f"HTML table is missing columns: {missing}")
+        selected = [(index, name) for index, name in enumerate(header) if name in columns]
+    else:
+        selected = list(enumerate(header))
+
+    width = len(header)
+    values = []
+    for row in rows:
+        # Plain cells (no markup inside) are read without walking their children
+        cells = [
+            cell.text if len(cell) == 0 else ''.join(cell.itertext())
+            for cell in row.iterchildren('td', 'th')
+        ]
+        if not cells:
+            continue
+        if len(cells) != width:
+            cells = (cells + [None] * width)[:width]
+        values.append(cells)
+
+    by_column = list(zip(*values)) if values else [()] * width
+    df = pl.DataFrame([
+        pl.Series(name, by_column[index], dtype=pl.Utf8)
+        for index, name in selected
+    ])
+    return df.with_columns([
+        pl.col(name).str.strip_chars().replace('', None).cast(schema.get(name, pl.Utf8), strict=False)
+        for name in df.columns
+    ])
+
+
+def read_table(body: Union[str, bytes], schema: Optional[Dict[str, pl.DataType]] = None,
+               columns: Optional[List[str]] = None) -> pl.DataFrame:
+    """A whole downloaded table body, CSV/TSV export or HTML, read into Polars"""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    separator = sniff_delimiter(body[:SNIFF_BYTES])
+    if separator is not None:
+        return read_delimited(body, separator, schema, columns)
+    return read_html_table(body, schema, columns)
@@ -0,0 +1,52 @@
+import os
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import MAX_CONCURRENT_REQUESTS, HOST_CONNECTION_LIMIT
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class RequestLimiter:
+    """
+    Bounds upstream requests globally and per host.
+
+    Shared by every AsyncRequestHandler in a multi-site run so N sites never
+    put more than `max_concurrent` requests (and `per_host` per upstream host)
+    in flight. The host slot is taken first, so a request waiting on a busy
+    host does not hold one of the global slots.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS, per_host: int = HOST_CONNECTION_LIMIT):
+        self.max_concurrent = max_concurrent
+        self.per_host = per_host
+        self._global = asyncio.Semaphore(max_concurrent)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._active = 0
+        self.stats = {
+            'requests': 0,
+            'peak_active': 0,
+        }
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold a global and a per-host slot for one request"""
+        host = urlsplit(url).hostname
+        host_slot = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with host_slot:
+            async with self._global:
+                self._active += 1
+                self.stats['requests'] += 1
+                self.stats['peak_active'] = max(self.stats['peak_active'], self._active)
+                try:
+                    yield
+                finally:
+                    self._active -= 1
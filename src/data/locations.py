@@ -0,0 +1,66 @@
+import os
+import re
+import sys
+import polars as pl
+from typing import Optional, Sequence
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import LOCATION_GRAMMARS, LOCATION_FLOORS, LOCATION_MODS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+def _mapped(parts: pl.Expr, groups, floors: Optional[Sequence[str]], mods: Optional[Sequence[str]]) -> pl.Expr:
+    """True where the parsed location is on a floor / mod that is mapped to pick areas"""
+    mapped = pl.lit(True)
+    if floors and 'floor' in groups:
+        mapped = mapped & parts.struct.field('floor').is_in(list(floors))
+    if mods and 'mod' in groups:
+        mapped = mapped & parts.struct.field('mod').is_in(list(mods))
+    return mapped
+
+
+def with_location(frame: pl.LazyFrame, column: str, aisle: str, slot: str,
+                  grammars: Sequence[str] = LOCATION_GRAMMARS,
+                  floors: Optional[Sequence[str]] = LOCATION_FLOORS,
+                  mods: Optional[Sequence[str]] = LOCATION_MODS) -> pl.LazyFrame:
+    """
+    Add the aisle and slot (Int64) of a scannable ID column, using native
+    Polars string expressions (frame.pipe(with_location, column, aisle, slot)).
+
+    Each grammar is a regex with a named group `aisle` and optionally `slot`,
+    `floor` and `mod`; the first grammar that matches wins. Every
+    ID is parsed once per grammar into a temporary struct column, the parts
+    are read from there. Locations on floors / mods not mapped to pick areas
+    give null, as do IDs no grammar matches; a location without a slot keeps
+    its aisle.
+    """
+    parsed = [f'__{column}_location_{index}' for index in range(len(grammars))]
+    aisles, slots = [], []
+    for name, pattern in zip(parsed, grammars):
+        parts = pl.col(name)
+        groups = re.compile(pattern).groupindex
+        mapped = _mapped(parts, groups, floors, mods)
+        aisles.append(pl.when(mapped).then(parts.struct.field('aisle').cast(pl.Int64)))
+        # Grammars for aisle-only locations leave the slot null
+        slots.append(
+            pl.when(mapped).then(parts.struct.field('slot').cast(pl.Int64)) if 'slot' in groups
+            else pl.lit(None, dtype=pl.Int64)
+        )
+
+    return (
+        frame
+        .with_columns([
+            pl.col(column).str.extract_groups(pattern).alias(name)
+            for name, pattern in zip(parsed, grammars)
+        ])
+        .with_columns([
+            pl.coalesce(aisles).alias(aisle),
+            pl.coalesce(slots).alias(slot)
+        ])
+        .drop(parsed)
+    )
@@ -0,0 +1,148 @@
+import os
+import sys
+import polars as pl
+from datetime import date, datetime as dt, timedelta as td
+from typing import List, Optional, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import CACHE_DIR, LPI_HISTORY_DAYS, LPI_HISTORY_RETENTION_DAYS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class LpiHistoryStore:
+    """
+    Per-day store for historical LPI aggregates.
+
+    A closed day never changes, so each one is fetched once, reduced to
+    process_path / pick_area sums and kept as a parquet file per site and date.
+    The rolling summaries are rebuilt from those files, which keep unit and hour
+    totals (not rates) so the 7-day rates come out the same as one week query.
+    """
+    _instance = None
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.store_dir = os.path.join(cache_dir, 'lpi_history')
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    @classmethod
+    def get_instance(cls) -> 'LpiHistoryStore':
+        """Get singleton instance of LpiHistoryStore"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+
+
+    @staticmethod
+    def history_days(shift_start: dt, days: int = LPI_HISTORY_DAYS) -> List[date]:
+        """Closed days covered by the history window, oldest first"""
+        first = shift_start.date()
+        return [first - td(days=offset) for offset in range(days, 0, -1)]
+
+    def _path(self, site_code: str, day: date) -> str:
+        return os.path.join(self.store_dir, site_code, f"{day.isoformat()}.parquet")
+
+    def missing_days(self, site_code: str, days: List[date]) -> List[date]:
+        """Days in the window that still need to be fetched"""
+        return [day for day in days if not os.path.exists(self._path(site_code, day))]
+
+    @staticmethod
+    def aggregate_day(df: pl.DataFrame) -> pl.DataFrame:
+        """Reduce a normalized LPI frame to summable per-area totals"""
+        if df.height == 0:
+            return pl.DataFrame(schema={
+                'process_path': pl.Utf8,
+                'pick_area': pl.Utf8,
+                'cases_picked': pl.Int64,
+                'total_hours': pl.Float64,
+                'uph_sum': pl.Float64,
+                'uph_count': pl.UInt32,
+            })
+
+        return df.group_by(['process_path', 'pick_area']).agg([
+            pl.col('unit_count').sum().alias('cases_picked'),
+            pl.col('time_hours').sum().alias('total_hours'),
+            # Kept as sum/count so mean_cph can be recombined across days
+            pl.col('units_per_hr').sum().alias('uph_sum'),
+            pl.col('units_per_hr').count().alias('uph_count'),
+        ])
+
+    def save_day(self, site_code: str, day: date, aggregate: pl.DataFrame):
+        """Write one day's aggregate and prune days past retention"""
+        path = self._path(site_code, day)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            aggregate.write_parquet(path)
+            logger.info(f"LPI Historical : Stored {site_code} {day.isoformat()} ({aggregate.height} rows)")
+            self._prune(site_code, day)
+
+        except Exception as e:
+            logger.warning(f"Could not store LPI history for {site_code} {day.isoformat()}: {str(e)}")
+
+    def load_day(self, site_code: str, day: date) -> Optional[pl.DataFrame]:
+        """One stored day's aggregate, None if it was never fetched"""
+        path = self._path(site_code, day)
+        if not os.path.exists(path):
+            return None
+        return pl.read_parquet(path)
+
+    def _prune(self, site_code: str, newest: date):
+        cutoff = newest - td(days=LPI_HISTORY_RETENTION_DAYS)
+        site_dir = os.path.join(self.store_dir, site_code)
+        for file_name in os.listdir(site_dir):
+            try:
+                stored = date.fromisoformat(file_name.split('.')[0])
+            except ValueError:
+                continue
+            if stored < cutoff:
+                os.remove(os.path.join(site_dir, file_name))
+
+    def compose(self, site_code: str, days: List[date]) -> Optional[Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]]:
+        """
+        Build the rolling summaries from the stored days.
+
+        Returns:
+            (process_summary, process_area_summary, daily) or None if no day is stored.
+        """
+        frames = []
+        for day in days:
+            stored = self.load_day(site_code, day)
+            if stored is not None:
+                frames.append(stored.with_columns(pl.lit(day).alias('date')))
+
+        if not frames:
+            return None
+        if len(frames) < len(days):
+            logger.warning(f"LPI Historical : {len(days) - len(frames)} of {len(days)} days missing from history")
+
+        daily = pl.concat(frames, how='vertical_relaxed')
+        totals = [
+            pl.col('cases_picked').sum().alias('cases_picked'),
+            pl.col('total_hours').sum().alias('total_hours'),
+            pl.col('uph_sum').sum().alias('uph_sum'),
+            pl.col('uph_count').sum().alias('uph_count'),
+        ]
+        rates = [
+            pl.col('total_hours').round(2),
+            (pl.col('uph_sum') / pl.col('uph_count')).round(2).alias('mean_cph'),
+            (pl.col('cases_picked') / pl.col('total_hours')).round(2).alias('avg_cph'),
+        ]
+        columns = ['cases_picked', 'total_hours', 'mean_cph', 'avg_cph']
+
+        process_summary = (
+            daily.group_by('process_path').agg(totals)
+            .with_columns(rates)
+            .select(['process_path'] + columns)
+        )
+        process_area_summary = (
+            daily.group_by(['process_path', 'pick_area']).agg(totals)
+            .with_columns(rates)
+            .select(['process_path', 'pick_area'] + columns)
+            .sort('process_path', 'pick_area')
+        )
+        return process_summary, process_area_summary, daily
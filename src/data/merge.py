@@ -0,0 +1,203 @@
+import os
+import sys
+import polars as pl
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.data.projection import project, cpt_projection
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Frame that has to have rows for a source to count as present
+SOURCE_FRAMES = {
+    'Workforce': 'workforce_full',
+    'Rodeo': 'rodeo_full',
+    'LPI': 'lpi_full',
+    'Process': 'process_full',
+    'LPI(Hist)': 'process_summary_hist',
+}
+
+# Sources a level can be built on, in order of preference
+BASE_SOURCES = ('Rodeo', 'Workforce', 'LPI')
+
+# Sources that need a result (possibly empty) before anything is merged
+MERGE_SOURCES = ('Workforce', 'Rodeo', 'LPI', 'Process')
+
+
+# (source, result key, columns added, renamed from) per level, in output order.
+# Missing sources are added as typed nulls, so every level keeps this schema.
+PROCESS_SOURCES = (
+    ('Rodeo', 'cpt_process_summary', {
+        'cpt': pl.Utf8, 'process_path': pl.Utf8, 'total_cases': pl.UInt32, 'total_units': pl.Int64,
+        'hours_remaining': pl.Float64, 'case_density': pl.Float64
+    }, {}),
+    ('Workforce', 'process_summary', {
+        'process_path': pl.Utf8, 'total_pickers': pl.UInt32, 'active_pickers': pl.UInt32, 'active_percent': pl.Float64
+    }, {}),
+    ('LPI', 'process_summary', {
+        'process_path': pl.Utf8, 'cases_picked': pl.Int64, 'total_hours': pl.Float64, 'mean_cph': pl.Float64,
+        'avg_cph': pl.Float64
+    }, {}),
+    ('LPI(Hist)', 'process_summary_hist', {
+        'process_path': pl.Utf8, 'historical_cph': pl.Float64
+    }, {'historical_cph': 'avg_cph'}),
+)
+
+# Joined after the projection / rate columns
+PROCESS_DEMAND = (
+    ('Process', 'process_full', {
+        'process_path': pl.Utf8, 'status': pl.Utf8, 'prioritized_units': pl.Int64, 'non_prioritized_units': pl.Int64,
+        'picker_count': pl.Int64, 'units_in_scanner': pl.Int64, 'units_per_hour': pl.Int64,
+        'pick_rate_average': pl.Float64, 'unit_rate_target': pl.Int64
+    }, {}),
+)
+
+AREA_SOURCES = (
+    ('Rodeo', 'cpt_process_area_summary', {
+        'cpt': pl.Utf8, 'process_path': pl.Utf8, 'pick_area': pl.Utf8, 'total_cases': pl.UInt32,
+        'total_units': pl.Int64, 'hours_remaining': pl.Float64, 'case_density': pl.Float64
+    }, {}),
+    ('Workforce', 'process_area_summary', {
+        'process_path': pl.Utf8, 'pick_area': pl.Utf8, 'area_hc': pl.UInt32, 'area_active_hc': pl.UInt32,
+        'active_percent': pl.Float64
+    }, {}),
+    ('LPI', 'process_area_summary', {
+        'process_path': pl.Utf8, 'pick_area': pl.Utf8, 'cases_picked': pl.Int64, 'total_hours': pl.Float64,
+        'mean_cph': pl.Float64, 'avg_cph': pl.Float64
+    }, {}),
+    ('LPI(Hist)', 'process_area_summary_hist', {
+        'process_path': pl.Utf8, 'pick_area': pl.Utf8, 'historical_cph': pl.Float64
+    }, {'historical_cph': 'avg_cph'}),
+)
+
+
+def present_sources(processed_data: Dict[str, Any]) -> List[str]:
+    """Sources processed this refresh that have rows to merge"""
+    present = []
+    for source, frame_key in SOURCE_FRAMES.items():
+        result = processed_data.get(source)
+        # A failed normalizer returns a bare, empty DataFrame instead of its dict
+        if not isinstance(result, dict):
+            continue
+        frame = result.get(frame_key)
+        if isinstance(frame, pl.DataFrame) and frame.height > 0:
+            present.append(source)
+    return present
+
+
+def _columns(sources: Sequence[Tuple]) -> List[str]:
+    """Output columns of a source table, in order"""
+    names = []
+    for _, _, columns, _ in sources:
+        names.extend(name for name in columns if name not in names)
+    return names
+
+
+def _select(processed_data: Dict[str, Any], spec: Tuple) -> pl.LazyFrame:
+    """A present source's columns, typed as the merge expects"""
+    source, result_key, columns, renames = spec
+    return processed_data[source][result_key].lazy().select([
+        pl.col(renames.get(name, name)).cast(dtype).alias(name)
+        for name, dtype in columns.items()
+    ])
+
+
+def _join(merged: pl.LazyFrame, names: List[str], processed_data: Dict[str, Any], present: Sequence[str],
+          sources: Sequence[Tuple], keys: List[str]) -> pl.LazyFrame:
+    """Left-join each present source onto `merged` (columns `names`), typed nulls for missing ones"""
+    for spec in sources:
+        source, _, columns, _ = spec
+        if source in present:
+            merged = merged.join(_select(processed_data, spec), on=keys, how='left')
+        else:
+            merged = merged.with_columns([
+                pl.lit(None, dtype=dtype).alias(name)
+                for name, dtype in columns.items() if name not in names
+            ])
+        names.extend(name for name in columns if name not in names)
+    return merged
+
+
+def _level(processed_data: Dict[str, Any], present: Sequence[str], sources: Sequence[Tuple],
+           keys: List[str]) -> pl.LazyFrame:
+    """
+    One level of the merge: the first present base source (Rodeo, else
+    Workforce, else LPI) with every other source left-joined on `keys`. No
+    base source at all gives the level's columns with no rows.
+    """
+    base = next((spec for spec in sources if spec[0] in BASE_SOURCES and spec[0] in present), None)
+    if base is None:
+        merged, names = pl.LazyFrame(schema={key: pl.Utf8 for key in keys}), list(keys)
+    else:
+        merged, names = _select(processed_data, base), list(base[2])
+
+    merged = _join(merged, names, processed_data, present, [spec for spec in sources if spec is not base], keys)
+    # Same column order whichever source was the base
+    return merged.select(_columns(sources))
+
+
+def _no_projection() -> List[pl.Expr]:
+    """Without Rodeo demand or LPI labor nothing is projected to miss"""
+    return [
+        pl.lit(False, dtype=pl.Boolean).alias('projected_miss'),
+        pl.lit(None, dtype=pl.Float64).alias('slack_hours')
+    ]
+
+
+def merge_levels(processed_data: Dict[str, Any], present: Sequence[str], elapsed_hours: float,
+                 plan: Optional[pl.DataFrame]) -> Tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    The combined_data stage as one lazy query plan over whichever sources are
+    present: (process_level, area_level, cpt_projection).
+
+    Both levels always have the same columns, a missing source shows up as
+    typed nulls. They are collected together so Polars can share the common
+    work (the process level also feeds the CPT projection) and run them in
+    parallel. The CPT projection is only built with Rodeo data.
+    """
+    projected = 'Rodeo' in present and 'LPI' in present
+
+    process_level = _level(processed_data, present, PROCESS_SOURCES, ['process_path'])
+    process_level = (
+        (
+            process_level.pipe(project, elapsed_hours, plan, ['cpt', 'process_path']) if projected
+            else process_level.with_columns(_no_projection())
+        )
+        .with_columns([
+            # Calculate Picker Rate Average (PRA)
+            ((pl.when(pl.col('total_hours') > 0)
+                .then((pl.col('total_cases') / pl.col('total_hours')) * pl.col('case_density'))
+                .otherwise(0))
+                .round(2)
+                .alias('PRA'))
+        ])
+        .with_columns([
+            # Calculate Target Unit Rate (TUR)
+            (pl.when((pl.col('total_pickers') > 0) & (pl.col('PRA').is_not_null()))
+                .then(pl.col('PRA') / pl.col('total_pickers'))
+                .otherwise(0))
+                .round(2)
+                .alias('TUR')
+        ])
+    )
+    names = _columns(PROCESS_SOURCES) + ['projected_miss', 'slack_hours', 'PRA', 'TUR']
+    process_level = _join(process_level, names, processed_data, present, PROCESS_DEMAND, ['process_path'])
+
+    area_level = _level(processed_data, present, AREA_SOURCES, ['process_path', 'pick_area'])
+    area_level = (
+        area_level.pipe(project, elapsed_hours, plan, ['cpt', 'process_path', 'pick_area']) if projected
+        else area_level.with_columns(_no_projection())
+    )
+
+    queries = [process_level, area_level]
+    if 'Rodeo' in present:
+        # CPT-Level: any path missing, tightest path's slack
+        queries.append(cpt_projection(process_level, processed_data['Rodeo']['cpt_summary']))
+
+    frames = pl.collect_all(queries)
+    return frames[0], frames[1], frames[2] if len(frames) > 2 else pl.DataFrame()
@@ -0,0 +1,511 @@
+import io
+import os
+import re
+import csv
+import sys
+import json
+import pytz
+import random
+import asyncio
+import threading
+import argparse
+from datetime import datetime as dt, timedelta as td
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Optional: the mock server runs on aiohttp.web
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import TZ_MAPPING, MOCK_UPSTREAM_PORT, STREAM_CHUNK_BYTES
+from src.config.res_finder import ResourceFinder
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+find_resource = ResourceFinder.find_resource
+
+
+# Process paths with their share of the Rodeo backlog and typical units per hour
+PROCESS_PATHS = {
+    'PPTransSortable': (0.45, 180),
+    'PPTransNonSort': (0.25, 90),
+    'PPTransFracs': (0.15, 140),
+    'PPHOVReserve': (0.15, 120),
+}
+PRIORITY_FIELDS = ['fastTrack', 'minPriority', 'premium', 'sameNext', 'standard', 'superSavers']
+ROWS_PER_CHUNK = 2000
+# Rodeo body formats: the ItemList HTML table, or the delimited export
+RODEO_FORMATS = {
+    'html': 'text/html',
+    'csv': 'text/csv',
+    'tsv': 'text/tab-separated-values',
+}
+
+
+class SyntheticSite:
+    """
+    Synthetic upstream data for one site, built from its pick_areas.
+
+    Bin locations fall inside the site's pick area aisle/slot ranges (plus a
+    share that matches no area), associates are spread over the pick areas and
+    process paths, and the Rodeo backlog is spread over the next CPTs. The same
+    seed gives the same associates and backlog on every request.
+    """
+
+    def __init__(self, site_code: str, pick_areas: Dict[str, Dict[str, Any]],
+                 rodeo_rows: int = 10000, associates: int = 300, seed: int = 0, rodeo_format: str = 'html'):
+        self.site_code = site_code
+        self.tz = pytz.timezone(TZ_MAPPING.get(site_code, 'America/New_York'))
+        self.rodeo_rows = rodeo_rows
+        self.seed = seed
+        if rodeo_format not in RODEO_FORMATS:
+            raise ValueError(f"Unknown Rodeo format {rodeo_format}, expected one of {list(RODEO_FORMATS)}")
+        self.rodeo_format = rodeo_format
+
+        self.areas = self._area_ranges(pick_areas)
+        if not self.areas:
+            raise ValueError(f"No usable pick areas for {site_code}")
+
+        rng = random.Random(seed)
+        self.associates = [self._associate(rng, index) for index in range(associates)]
+
+        self._backlog_lock = threading.Lock()
+        self._backlog_hour = None
+        self._backlog_rows: List[Tuple[int, List[bytes]]] = []
+
+    @staticmethod
+    def _area_ranges(pick_areas: Dict[str, Dict[str, Any]]) -> List[Tuple[str, int, int, int, int]]:
+        """(name, start aisle, end aisle, start slot, end slot) for areas with numeric ranges"""
+        def number(value) -> Optional[int]:
+            match = re.search(r'\d+', str(value))
+            return int(match.group()) if match else None
+
+        areas = []
+        for name, area in pick_areas.items():
+            bounds = [number(area.get(key)) for key in ('Start Aisle', 'End Aisle', 'Start Slot', 'End Slot')]
+            if None in bounds:
+                continue
+            start_aisle, end_aisle, start_slot, end_slot = bounds
+            # Locations carry a 3 digit aisle
+            if end_aisle > 999 or start_aisle > end_aisle or start_slot > end_slot:
+                continue
+            areas.append((name, start_aisle, end_aisle, start_slot, min(end_slot, 999)))
+        return areas
+
+    @staticmethod
+    def _process_path(rng: random.Random) -> str:
+        return rng.choices(list(PROCESS_PATHS), weights=[share for share, _ in PROCESS_PATHS.values()])[0]
+
+    def _associate(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        area = rng.choice(self.areas)
+        return {
+            'employee_id': f"{100000000 + index}",
+            'user_id': f"picker{index:05d}",
+            'name': f"Picker, Test{index:05d}",
+            'manager_id': f"{900000000 + index % 25}",
+            'manager': f"Manager, Test{index % 25:02d}",
+            'process_path': self._process_path(rng),
+            'pick_area': area[0],
+            'active': rng.random() < 0.85,
+        }
+
+    def _location(self, rng: random.Random) -> str:
+        """Bin label in the P-1-<mod><aisle><level><slot> form the processor parses"""
+        if rng.random() < 0.03:
+            # Some backlog sits outside any mapped pick area
+            return f"P-1-Z{rng.randint(900, 999):03d}Z{rng.randint(10, 99)}"
+        _, start_aisle, end_aisle, start_slot, end_slot = rng.choice(self.areas)
+        return (f"P-1-{rng.choice('ABC')}{rng.randint(start_aisle, end_aisle):03d}"
+                f"{rng.choice('ABCDE')}{rng.randint(start_slot, end_slot)}")
+
+    # Picking Console
+
+    def workforce(self, now: dt) -> Dict[str, Any]:
+        """picking-console /workforce body"""
+        rng = random.Random(self.seed + 1)
+        pickers = []
+        for associate in self.associates:
+            last_seen = now - td(seconds=rng.randint(5, 1800))
+            pickers.append({
+                'active': associate['active'],
+                'batchEarlierExSD': (now + td(hours=rng.randint(1, 8))).isoformat(),
+                'batchId': f"B{rng.randint(10**7, 10**8 - 1)}",
+                'employeeId': associate['employee_id'],
+                'lastActivityTime': last_seen.isoformat(),
+                'lastContainerId': f"tsX{rng.randint(10**6, 10**7 - 1)}",
+                'lastSeenTime': last_seen.isoformat(),
+                'location': self._location(rng),
+                'manager': associate['manager'],
+                'name': associate['name'],
+                'pickArea': associate['pick_area'],
+                'processPath': associate['process_path'],
+                'userId': associate['user_id'],
+            })
+        return {'pickerStatusList': pickers}
+
+    def process_paths(self) -> Dict[str, Any]:
+        """picking-console /process-paths/information body"""
+        rng = random.Random(self.seed + 2)
+        pickers = {name: 0 for name in PROCESS_PATHS}
+        for associate in self.associates:
+            if associate['active']:
+                pickers[associate['process_path']] += 1
+
+        information = {}
+        for name, (share, rate) in PROCESS_PATHS.items():
+            units = int(self.rodeo_rows * share * 2)
+            prioritized = self._split(rng, units)
+            non_prioritized = self._split(rng, units // 4)
+            information[name] = {
+                'BatchCount': rng.randint(5, 200),
+                'ContainerUsePercent': round(rng.uniform(40, 95), 1),
+                'PickProcess': 'Transship',
+                'PickerCount': pickers[name],
+                'Status': 'Active',
+                'ToteCount': rng.randint(10, 400),
+                'UnitsInScanner': rng.randint(0, 500),
+                'UnitsInTotesCount': rng.randint(0, 5000),
+                'UnitsPerHour': int(rate * max(pickers[name], 1)),
+                'pickRateAverage': round(rng.gauss(rate, rate * 0.1), 2),
+                'unitRateTarget': rate,
+                'PrioritizedUnitsCounts': prioritized,
+                'NonPrioritizedUnitsCounts': non_prioritized,
+            }
+        return {'processPathInformationMap': information}
+
+    @staticmethod
+    def _split(rng: random.Random, total: int) -> Dict[str, int]:
+        weights = [rng.random() for _ in PRIORITY_FIELDS]
+        scale = sum(weights) or 1
+        return {field: int(total * weight / scale) for field, weight in zip(PRIORITY_FIELDS, weights)}
+
+    # FCLM
+
+    def productivity_page(self, span_type: str, day_key: str = '') -> str:
+        """FCLM process page with the filteredProductivityList script variable"""
+        days = {'Intraday': 0.6, 'Day': 1, 'Week': 7}.get(span_type, 1)
+        rng = random.Random(f"{self.seed}-{span_type}-{day_key}")
+
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for associate in self.associates:
+            if rng.random() < 0.2:
+                # Not every associate worked the span
+                continue
+            rate = PROCESS_PATHS[associate['process_path']][1]
+            seconds = int(rng.uniform(4, 10) * 3600 * days)
+            units = max(int(rng.gauss(rate, rate * 0.2) * seconds / 3600), 0)
+            groups.setdefault((associate['process_path'], associate['pick_area']), []).append({
+                'availability': 'AVAILABLE',
+                'eachCount': units,
+                'employeeId': associate['employee_id'],
+                'employeeName': associate['name'],
+                'isTokenized': False,
+                'managerId': associate['manager_id'],
+                'managerName': associate['manager'],
+                # DataProcessor reads this field as seconds (time_millis / 3600)
+                'timeMillis': seconds,
+                'unitCount': units,
+            })
+
+        productivity = [
+            {
+                'processName': 'Transship Pick',
+                'processAttributes': {
+                    'processId': '100115',
+                    'laborTrackingType': 'DIRECT',
+                    'attributes': {
+                        'CONTAINER_TYPE': 'TOTE',
+                        'GL_CODE': '0',
+                        'PICKING_PICK_AREA': pick_area,
+                        'PICKING_PROCESS_PATH': process_path,
+                        'PICK_PATH_GROUP': 'Transship',
+                        'WORK_FLOW': 'Transship',
+                        'SIZE_CATEGORY': 'Sortable' if 'Sortable' in process_path else 'NonSortable',
+                    },
+                    'processAttributes': None,
+                },
+                'associateProductivityList': associates,
+            }
+            for (process_path, pick_area), associates in sorted(groups.items())
+        ]
+
+        return ("<html><head><title>Process Inspector</title></head><body>\n"
+                "<script type=\"text/javascript\">\n"
+                f"var filteredProductivityList = {json.dumps(productivity)};\n"
+                "</script>\n</body></html>\n")
+
+    # Rodeo
+
+    RODEO_COLUMNS = [
+        'Transfer Request ID', 'Destination Warehouse', 'Need To Ship By Date', 'Process Path',
+        'Scannable ID', 'Outer Scannable ID', 'Outer Outer Scannable ID', 'Quantity',
+        'Dwell Time (hours)', 'Status', 'Work Pool', 'FN SKU', 'Pick Priority', 'Container Type',
+    ]
+
+    def _backlog(self, now: dt) -> List[Tuple[int, List[bytes]]]:
+        """
+        The Rodeo backlog as (cpt millis, encoded row chunks), oldest CPT first.
+        Built once per hour, every request (and every ExSD shard) reads the same rows.
+        """
+        local_now = now.astimezone(self.tz).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        with self._backlog_lock:
+            if self._backlog_hour == local_now:
+                return self._backlog_rows
+
+            rng = random.Random(self.seed + 3)
+            cpts = []
+            for hour in range(1, 25):
+                cpt = local_now + td(hours=hour)
+                cpts.append((cpt.strftime('%Y-%m-%d %H:%M:%S'), int(self.tz.localize(cpt).timestamp() * 1000)))
+            destinations = [site for site in TZ_MAPPING if site != self.site_code][:40] or ['XXX1']
+
+            buckets: Dict[int, List[List[str]]] = {cpt_millis: [] for _, cpt_millis in cpts}
+            for index in range(self.rodeo_rows):
+                process_path = self._process_path(rng)
+                cpt, cpt_millis = rng.choice(cpts)
+                if rng.random() < 0.9:
+                    outer, outer_outer = self._location(rng), ''
+                else:
+                    # Only the cart / pallet knows where the item is
+                    outer, outer_outer = f"csX{rng.randint(10**6, 10**7 - 1)}", self._location(rng)
+                buckets[cpt_millis].append([
+                    f"T{index:010d}",
+                    rng.choice(destinations),
+                    cpt,
+                    process_path,
+                    f"X00{rng.randint(10**7, 10**8 - 1)}",
+                    outer,
+                    outer_outer,
+                    str(rng.choices((1, 2, 3, 6), weights=(70, 15, 10, 5))[0]),
+                    str(round(rng.expovariate(0.5), 2)),
+                    "Eligible",
+                    "PickingNotYetPicked",
+                    f"X00{rng.randint(10**6, 10**7 - 1)}",
+                    str(rng.randint(1, 5)),
+                    "TOTE",
+                ])
+
+            self._backlog_rows = [
+                (cpt_millis, [self._encode_rows(rows[offset:offset + ROWS_PER_CHUNK])
+                              for offset in range(0, len(rows), ROWS_PER_CHUNK)])
+                for cpt_millis, rows in buckets.items()
+            ]
+            self._backlog_hour = local_now
+            logger.info(f"Mock Rodeo : Generated {self.rodeo_rows} backlog rows")
+            return self._backlog_rows
+
+    def _encode_rows(self, rows: List[List[str]]) -> bytes:
+        """Rows in the site's Rodeo format (HTML table rows or delimited lines)"""
+        if self.rodeo_format == 'html':
+            return ''.join(
+                "<tr>" + ''.join(f"<td>{value}</td>" for value in row) + "</tr>\n"
+                for row in rows
+            ).encode()
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=',' if self.rodeo_format == 'csv' else '\t', lineterminator='\r\n')
+        writer.writerows(rows)
+        return buffer.getvalue().encode()
+
+    def rodeo_chunks(self, now: dt, start_millis: Optional[int] = None, end_millis: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Rodeo ItemList for the ExSD window [start_millis, end_millis]
+        (the whole backlog when no window is given).
+        """
+        if self.rodeo_format == 'html':
+            header = ''.join(f"<th>{column}</th>" for column in self.RODEO_COLUMNS)
+            yield f"<html><body><table id=\"itemList\">\n<tr>{header}</tr>\n".encode()
+        else:
+            yield self._encode_rows([self.RODEO_COLUMNS])
+
+        for cpt_millis, chunks in self._backlog(now):
+            if start_millis is not None and cpt_millis < start_millis:
+                continue
+            if end_millis is not None and cpt_millis > end_millis:
+                continue
+            yield from chunks
+
+        if self.rodeo_format == 'html':
+            yield b"</table></body></html>\n"
+
+
+def load_pick_areas(site_code: str, site_info_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """pick_areas from a site_info JSON (the bundled one for the site by default)"""
+    path = site_info_path or find_resource(os.path.join("site_info", f"{site_code}_site_info.json"))
+    with open(path, 'r') as f:
+        return json.load(f)['pick_areas']
+
+
+def _per_source(values: Optional[List[str]], default: float) -> Dict[str, float]:
+    """Parse repeated `value` / `Source=value` options into {source or '*': value}"""
+    parsed = {'*': default}
+    for value in values or []:
+        if '=' in value:
+            source, number = value.split('=', 1)
+            parsed[source] = float(number)
+        else:
+            parsed['*'] = float(value)
+    return parsed
+
+
+class MockUpstream:
+    """
+    Local stand-in for every endpoint in build_urls().
+
+    Serves the picking-console workforce/process JSON, the FCLM process page
+    (Intraday, Week and Day spans) and the Rodeo ItemList table under the same
+    paths as the real hosts, so setting PICKASSIST_UPSTREAM to this server runs
+    the whole fetch -> process -> render path against it. Latency, error rate
+    and slow-drip bandwidth can be set per source (Workforce, Process, LPI,
+    LPI(Hist), Rodeo) or for all of them.
+    """
+
+    def __init__(self, site: SyntheticSite, latency: Dict[str, float], jitter: float = 0.0,
+                 error_rate: Optional[Dict[str, float]] = None, drip: Optional[Dict[str, float]] = None,
+                 seed: int = 0):
+        self.site = site
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate or {'*': 0.0}
+        # Bytes per second, 0 = as fast as possible
+        self.drip = drip or {'*': 0.0}
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _setting(settings: Dict[str, float], source: str) -> float:
+        return settings.get(source, settings['*'])
+
+    def app(self) -> 'web.Application':
+        app = web.Application()
+        app.router.add_get('/api/fcs/{site}/workforce', self._workforce)
+        app.router.add_get('/api/fcs/{site}/process-paths/information', self._process)
+        app.router.add_get('/ppa/inspect/process', self._lpi)
+        app.router.add_get('/{site}/ItemListCSV', self._rodeo)
+        return app
+
+    async def _workforce(self, request: 'web.Request') -> 'web.StreamResponse':
+        body = await asyncio.to_thread(lambda: json.dumps(self.site.workforce(dt.now(pytz.UTC))).encode())
+        return await self._serve(request, 'Workforce', 'application/json', [body])
+
+    async def _process(self, request: 'web.Request') -> 'web.StreamResponse':
+        body = json.dumps(self.site.process_paths()).encode()
+        return await self._serve(request, 'Process', 'application/json', [body])
+
+    async def _lpi(self, request: 'web.Request') -> 'web.StreamResponse':
+        span_type = request.query.get('spanType', 'Intraday')
+        source = 'LPI' if span_type == 'Intraday' else 'LPI(Hist)'
+        day_key = request.query.get('startDateDay') or request.query.get('startDateWeek') or ''
+        page = await asyncio.to_thread(self.site.productivity_page, span_type, day_key)
+        return await self._serve(request, source, 'text/html', [page.encode()])
+
+    async def _rodeo(self, request: 'web.Request') -> 'web.StreamResponse':
+        def millis(key: str) -> Optional[int]:
+            value = request.query.get(key)
+            return int(value) if value else None
+
+        chunks = self.site.rodeo_chunks(
+            dt.now(pytz.UTC),
+            millis('ExSDRange.RangeStartMillis'),
+            millis('ExSDRange.RangeEndMillis')
+        )
+        return await self._serve(request, 'Rodeo', RODEO_FORMATS[self.site.rodeo_format], chunks)
+
+    async def _serve(self, request: 'web.Request', source: str, content_type: str, chunks) -> 'web.StreamResponse':
+        """Apply latency / errors / drip, then stream the body"""
+        stats = self.stats.setdefault(source, {'requests': 0, 'errors': 0, 'bytes': 0})
+        stats['requests'] += 1
+
+        delay = self._setting(self.latency, source) + self.rng.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.rng.random() < self._setting(self.error_rate, source):
+            stats['errors'] += 1
+            logger.info(f"Mock {source} : injected 503")
+            return web.Response(status=503, text=f"Mock upstream error for {source}")
+
+        response = web.StreamResponse(status=200)
+        response.content_type = content_type
+        if content_type.startswith('text/'):
+            # JSON goes out as plain application/json, like picking-console
+            response.charset = 'utf-8'
+        await response.prepare(request)
+
+        drip = self._setting(self.drip, source)
+        iterator = iter(chunks)
+        while True:
+            # Rodeo rows are generated off the loop so other sources keep being served
+            chunk = await asyncio.to_thread(next, iterator, None)
+            if chunk is None:
+                break
+            for offset in range(0, len(chunk), STREAM_CHUNK_BYTES):
+                piece = chunk[offset:offset + STREAM_CHUNK_BYTES]
+                await response.write(piece)
+                stats['bytes'] += len(piece)
+                if drip > 0:
+                    await asyncio.sleep(len(piece) / drip)
+
+        await response.write_eof()
+        logger.info(f"Mock {source} : served {stats['bytes']} bytes total over {stats['requests']} requests")
+        return response
+
+    def summary(self) -> str:
+        return ', '.join(
+            f"{source}: {stats['requests']} requests, {stats['errors']} errors, {stats['bytes']} bytes"
+            for source, stats in self.stats.items()
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock picking-console / FCLM / Rodeo upstream with synthetic data")
+    parser.add_argument('--site', default='SAV7', help="Site code (pick areas from its site_info JSON)")
+    parser.add_argument('--site-info', help="site_info JSON to take pick areas from instead of the bundled one")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=MOCK_UPSTREAM_PORT)
+    parser.add_argument('--rodeo-rows', type=int, default=10000, help="Rodeo ItemList rows (1k - 1M)")
+    parser.add_argument('--associates', type=int, default=300, help="Associates in workforce / LPI")
+    parser.add_argument('--rodeo-format', choices=list(RODEO_FORMATS), default='html', help="Rodeo ItemList body format")
+    parser.add_argument('--latency', action='append', help="Seconds before responding, SECONDS or Source=SECONDS (repeatable)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Random extra latency up to this many seconds")
+    parser.add_argument('--error-rate', action='append', help="Share of requests answered with 503, RATE or Source=RATE (repeatable)")
+    parser.add_argument('--drip', action='append', help="Slow-drip bandwidth in bytes/s, BPS or Source=BPS (repeatable)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if web is None:
+        print("aiohttp is required for the mock upstream server")
+        return
+
+    site_code = args.site.upper()
+    site = SyntheticSite(
+        site_code, load_pick_areas(site_code, args.site_info),
+        rodeo_rows=args.rodeo_rows, associates=args.associates, seed=args.seed,
+        rodeo_format=args.rodeo_format
+    )
+    mock = MockUpstream(
+        site,
+        latency=_per_source(args.latency, 0.0),
+        jitter=args.jitter,
+        error_rate=_per_source(args.error_rate, 0.0),
+        drip=_per_source(args.drip, 0.0),
+        seed=args.seed,
+    )
+
+    print(f"Mock upstream for {site_code}: {len(site.areas)} pick areas, "
+          f"{len(site.associates)} associates, {args.rodeo_rows} Rodeo rows")
+    print(f"Run PickAssist with PICKASSIST_UPSTREAM=http://{args.host}:{args.port}")
+    try:
+        web.run_app(mock.app(), host=args.host, port=args.port, print=None)
+    finally:
+        print(mock.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import polars as pl
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import SITES, MAX_CONCURRENT_REQUESTS, HOST_CONNECTION_LIMIT
+from src.config.chronos import TimeManager
+from src.config.site_build import SiteBuilder
+from src.data.processor import DataProcessor
+from src.data.limiter import RequestLimiter
+from src.data.transport import AsyncTransport
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+@dataclass
+class SiteContext:
+    site_code: str
+    shift_info: Dict[str, Any]
+    site_builder: SiteBuilder
+    processor: DataProcessor
+    results: Optional[Dict[str, Any]] = None
+    failed: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+class MultiSiteMonitor:
+    """
+    Fetches and processes several sites in one process.
+
+    Each site gets its own shift info, SiteBuilder and DataProcessor instead of
+    the app singletons, so nothing here changes the site shown in the UI. All
+    sites share one RequestLimiter (global and per-host limits) and the pooled
+    transport, and the per-site results roll up into a regional summary.
+    """
+
+    def __init__(self, site_codes: List[str], start_hour: int, end_hour: int,
+                 max_concurrent: int = MAX_CONCURRENT_REQUESTS, per_host: int = HOST_CONNECTION_LIMIT):
+        self.site_codes = site_codes
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+        self.max_concurrent = max_concurrent
+        self.per_host = per_host
+        self.limiter = None
+        self.contexts: Dict[str, SiteContext] = {}
+
+
+
+    def _build_context(self, site_code: str) -> SiteContext:
+        shift_info = TimeManager.build_shift_info(site_code, self.start_hour, self.end_hour)
+        site_builder = SiteBuilder.for_site(shift_info)
+        processor = DataProcessor(
+            shift_info=shift_info,
+            site_info=site_builder.get_site_info(),
+            limiter=self.limiter
+        )
+        return SiteContext(site_code, shift_info, site_builder, processor)
+
+    async def _run_site(self, context: SiteContext):
+        start = time.perf_counter()
+        try:
+            results = await context.processor.process_incoming_data()
+            if isinstance(results, tuple) and len(results) == 2:
+                context.results, context.failed = results
+            else:
+                context.results = results or context.processor.get_results()
+
+        except Exception as e:
+            context.error = str(e)
+            logger.warning(f"{context.site_code} : Refresh failed: {str(e)}")
+        finally:
+            context.seconds = time.perf_counter() - start
+            print(f"{context.site_code} : Done in {context.seconds:.1f}s")
+
+    async def run(self) -> pl.DataFrame:
+        """Refresh every site concurrently and return the regional summary"""
+        # Semaphores belong to the running loop
+        self.limiter = RequestLimiter(self.max_concurrent, self.per_host)
+
+        for site_code in self.site_codes:
+            if site_code in self.contexts:
+                context = self.contexts[site_code]
+                context.shift_info = TimeManager.build_shift_info(site_code, self.start_hour, self.end_hour)
+                context.processor.update_shift_info(context.shift_info)
+                context.processor.request_handler.limiter = self.limiter
+                continue
+            try:
+                self.contexts[site_code] = self._build_context(site_code)
+            except Exception as e:
+                logger.warning(f"{site_code} : Could not set up site: {str(e)}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(self._run_site(context) for context in self.contexts.values()))
+        elapsed = time.perf_counter() - start
+
+        logger.info(f"Multi-site refresh: {len(self.contexts)} sites in {elapsed:.1f}s, "
+                    f"{self.limiter.stats['requests']} requests, peak {self.limiter.stats['peak_active']} in flight")
+        return self.regional_summary()
+
+    @staticmethod
+    def _value(results: Optional[Dict], source: str, group: str, key: str):
+        try:
+            return results[source][group][key]
+        except (KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _historical_rate(results: Optional[Dict]) -> Optional[float]:
+        try:
+            hist = results['LPI(Hist)']['process_summary_hist']
+            hours = hist['total_hours'].sum()
+            return round(hist['cases_picked'].sum() / hours, 2) if hours else None
+        except (KeyError, TypeError):
+            return None
+
+    def regional_summary(self) -> pl.DataFrame:
+        """One row per site plus a REGION total row"""
+        rows = []
+        for site_code, context in self.contexts.items():
+            results = context.results
+            if context.error:
+                status = 'error'
+            elif context.failed:
+                status = f"partial ({', '.join(context.failed)})"
+            else:
+                status = 'ok'
+
+            rows.append({
+                'site_code': site_code,
+                'status': status,
+                'refresh_seconds': round(context.seconds, 2),
+                'hours_remaining': round(context.shift_info['hours_remaining'].total_seconds() / 3600, 2),
+                'picks_remaining': self._value(results, 'Rodeo', 'picks', 'all_picks_rem'),
+                'hov_picks_remaining': self._value(results, 'Rodeo', 'picks', 'hov_picks_rem'),
+                'total_headcount': self._value(results, 'Workforce', 'headcounts', 'total_headcount'),
+                'active_headcount': self._value(results, 'Workforce', 'headcounts', 'active_headcount'),
+                'cases_picked': self._value(results, 'LPI', 'combined', 'combined_vol'),
+                'labor_hours': self._value(results, 'LPI', 'combined', 'combined_hrs'),
+                'cph': self._value(results, 'LPI', 'combined', 'combined_rate'),
+                'historical_cph': self._historical_rate(results),
+            })
+
+        schema = {
+            'site_code': pl.Utf8,
+            'status': pl.Utf8,
+            'refresh_seconds': pl.Float64,
+            'hours_remaining': pl.Float64,
+            'picks_remaining': pl.Int64,
+            'hov_picks_remaining': pl.Int64,
+            'total_headcount': pl.Int64,
+            'active_headcount': pl.Int64,
+            'cases_picked': pl.Int64,
+            'labor_hours': pl.Float64,
+            'cph': pl.Float64,
+            'historical_cph': pl.Float64,
+        }
+        summary = pl.DataFrame(rows, schema=schema, strict=False)
+        if summary.height == 0:
+            return summary
+
+        region = summary.select([
+            pl.lit('REGION').alias('site_code'),
+            pl.format('{}/{} ok', (pl.col('status') == 'ok').sum(), pl.len()).alias('status'),
+            pl.col('refresh_seconds').max(),
+            pl.col('hours_remaining').mean().round(2),
+            pl.col('picks_remaining').sum(),
+            pl.col('hov_picks_remaining').sum(),
+            pl.col('total_headcount').sum(),
+            pl.col('active_headcount').sum(),
+            pl.col('cases_picked').sum(),
+            pl.col('labor_hours').sum().round(2),
+            # Regional rate from totals, not an average of site rates
+            (pl.col('cases_picked').sum() / pl.col('labor_hours').sum()).round(2).alias('cph'),
+            pl.lit(None, dtype=pl.Float64).alias('historical_cph'),
+        ]).cast(schema)
+        return pl.concat([summary, region], how='vertical')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh several sites at once and print a regional summary")
+    parser.add_argument('--sites', nargs='+', default=SITES, help="Site codes (default: all known sites)")
+    parser.add_argument('--start', type=int, required=True, help="Shift start hour (0-23)")
+    parser.add_argument('--end', type=int, required=True, help="Shift end hour (0-23)")
+    parser.add_argument('--max-concurrent', type=int, default=MAX_CONCURRENT_REQUESTS, help="Requests in flight across all sites")
+    parser.add_argument('--per-host', type=int, default=HOST_CONNECTION_LIMIT, help="Requests in flight per upstream host")
+    args = parser.parse_args()
+
+    monitor = MultiSiteMonitor(
+        [site.upper() for site in args.sites], args.start, args.end,
+        max_concurrent=args.max_concurrent, per_host=args.per_host
+    )
+
+    async def run_once():
+        try:
+            return await monitor.run()
+        finally:
+            # Close pooled connections before the loop goes away
+            await AsyncTransport.reset_instance()
+
+    summary = asyncio.run(run_once())
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
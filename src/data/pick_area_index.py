@@ -0,0 +1,114 @@
+import os
+import sys
+import polars as pl
+from typing import List, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class PickAreaIndex:
+    """
+    Aisle / slot -> pick area lookup for a whole column at once.
+
+    Built once per site from the pick areas table. The aisle axis is cut into
+    elementary segments at every area's start and end; inside a segment the
+    slot axis is cut into pieces, each resolved to the first area (table
+    order) covering it, so overlaps keep the old first-match semantics. A
+    piece is keyed by segment * slot span + slot, which makes the lookup two
+    sorted searches: aisle -> segment, then key -> piece.
+    """
+
+    def __init__(self, pick_areas: pl.DataFrame):
+        self.areas = self._bounds(pick_areas)
+        self._build()
+        logger.info(f"Pick area index: {len(self.areas)} areas, {len(self._segment_starts)} aisle segments, "
+                    f"{len(self._piece_names)} slot pieces")
+
+    @staticmethod
+    def _bounds(pick_areas: pl.DataFrame) -> List[Tuple[str, int, int, int, int]]:
+        """(name, start aisle, end aisle, start slot, end slot) of every usable area, in table order"""
+        if pick_areas is None or pick_areas.is_empty():
+            return []
+
+        bounds = (
+            pick_areas
+            .select([
+                pl.col('Name').cast(pl.Utf8),
+                # Aisles can be strings like "A101"
+                pl.col('Start Aisle').cast(pl.Utf8).str.extract_all(r'\d+').list.first().cast(pl.Int64),
+                pl.col('End Aisle').cast(pl.Utf8).str.extract_all(r'\d+').list.first().cast(pl.Int64),
+                pl.col('Start Slot').cast(pl.Int64, strict=False),
+                pl.col('End Slot').cast(pl.Int64, strict=False)
+            ])
+            .rows()
+        )
+        # Areas with a missing bound never matched a row
+        return [
+            area for area in bounds
+            if None not in area and area[1] <= area[2] and area[3] <= area[4]
+        ]
+
+    def _build(self):
+        """Cut the areas into aisle segments and first-match slot pieces"""
+        self._segment_starts: List[int] = []
+        self._piece_starts: List[int] = []
+        self._piece_ends: List[int] = []
+        self._piece_segments: List[int] = []
+        self._piece_names: List[str] = []
+        if not self.areas:
+            self._slot_min, self._slot_span = 0, 1
+            return
+
+        self._slot_min = min(area[3] for area in self.areas)
+        self._slot_span = max(area[4] for area in self.areas) - self._slot_min + 1
+
+        cuts = sorted({area[1] for area in self.areas} | {area[2] + 1 for area in self.areas})
+        for segment, (start, end) in enumerate(zip(cuts, cuts[1:])):
+            self._segment_starts.append(start)
+            covering = [area for area in self.areas if area[1] <= start and area[2] >= end - 1]
+            if not covering:
+                continue
+
+            slot_cuts = sorted({area[3] for area in covering} | {area[4] + 1 for area in covering})
+            for slot_start, slot_end in zip(slot_cuts, slot_cuts[1:]):
+                name = next((area[0] for area in covering if area[3] <= slot_start and area[4] >= slot_end - 1), None)
+                if name is None:
+                    continue
+                base = segment * self._slot_span - self._slot_min
+                if (self._piece_names and self._piece_names[-1] == name
+                        and self._piece_segments[-1] == segment and self._piece_ends[-1] == base + slot_start - 1):
+                    # Adjacent piece of the same area
+                    self._piece_ends[-1] = base + slot_end - 1
+                    continue
+                self._piece_starts.append(base + slot_start)
+                self._piece_ends.append(base + slot_end - 1)
+                self._piece_segments.append(segment)
+                self._piece_names.append(name)
+        # The last cut only closes the last segment
+        self._segment_starts.append(cuts[-1])
+
+    def assign(self, aisle: str, slot: str) -> pl.Expr:
+        """Pick area name for the aisle / slot columns (null where no area covers the location)"""
+        if not self._piece_names:
+            return pl.lit(None, dtype=pl.Utf8)
+
+        segment = pl.lit(pl.Series(self._segment_starts, dtype=pl.Int64)).search_sorted(pl.col(aisle), side='right').cast(pl.Int64) - 1
+        key = segment * self._slot_span + pl.col(slot) - self._slot_min
+        piece = pl.lit(pl.Series(self._piece_starts, dtype=pl.Int64)).search_sorted(key, side='right').cast(pl.Int64) - 1
+        found = piece.clip(0)
+
+        return (
+            pl.when(
+                pl.col(aisle).is_not_null() & pl.col(slot).is_not_null() & (piece >= 0)
+                & (pl.lit(pl.Series(self._piece_segments, dtype=pl.Int64)).gather(found) == segment)
+                & (pl.lit(pl.Series(self._piece_ends, dtype=pl.Int64)).gather(found) >= key)
+            )
+            .then(pl.lit(pl.Series(self._piece_names, dtype=pl.Utf8)).gather(found))
+            .otherwise(None)
+        )
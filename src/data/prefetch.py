@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import PREFETCH_DEFAULT_LEAD_SECONDS, PREFETCH_MARGIN_SECONDS, PREFETCH_MAX_AGE_SECONDS, PREFETCH_SAMPLES
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class RefreshPrefetcher:
+    """
+    Gets the next scheduled refresh ready before its timer fires.
+
+    The prefetch starts lead_seconds() ahead of the refresh: the 90th
+    percentile of recently measured refresh durations (fetch + normalize)
+    plus a margin. It runs into a staged DataProcessor (DataProcessor.stage()),
+    so the tabs keep showing the current data until take() commits the staged
+    results. A result older than `max_age` is discarded instead and its
+    sources released, so the regular refresh fetches them again.
+    """
+
+    def __init__(self, max_age: float = PREFETCH_MAX_AGE_SECONDS, samples: int = PREFETCH_SAMPLES):
+        self.max_age = max_age
+        self._durations = deque(maxlen=samples)
+        self._reset()
+
+    def _reset(self):
+        self.staged = None
+        self.sources: Optional[List[str]] = None
+        self.started_at: Optional[float] = None
+        self.errors = ""
+        self.running = False
+
+
+
+    def record_duration(self, seconds: float):
+        """Add a measured refresh duration (regular or prefetched)"""
+        self._durations.append(seconds)
+
+    def lead_seconds(self) -> float:
+        """How long before a refresh is due to start its prefetch"""
+        if not self._durations:
+            return PREFETCH_DEFAULT_LEAD_SECONDS
+        durations = sorted(self._durations)
+        p90 = durations[min(int(len(durations) * 0.9), len(durations) - 1)]
+        return p90 + PREFETCH_MARGIN_SECONDS
+
+    @property
+    def ready(self) -> bool:
+        return self.staged is not None and not self.running
+
+    def age(self) -> Optional[float]:
+        """Seconds since the prefetched data was requested"""
+        return time.monotonic() - self.started_at if self.started_at is not None else None
+
+    def begin(self, processor, sources: Optional[List[str]]):
+        """Start a prefetch for `sources`, returns the staged processor to run it on"""
+        self._reset()
+        self.staged = processor.stage()
+        self.sources = sources
+        self.started_at = time.monotonic()
+        self.running = True
+        return self.staged
+
+    def complete(self, duration: float, errors: str = ""):
+        """The staged run finished"""
+        self.running = False
+        self.errors = errors
+        self.record_duration(duration)
+        logger.info(f"Prefetch ready in {duration:.1f}s ({', '.join(self.sources) if self.sources else 'all sources'})")
+
+    def take(self, processor) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Commit a ready, fresh prefetch into `processor`.
+        Returns (results, error summary), None when there was nothing usable.
+        """
+        if not self.ready:
+            return None
+
+        age = self.age()
+        if age > self.max_age:
+            logger.info(f"Prefetch is {age:.0f}s old (limit {self.max_age}s), discarding")
+            self.discard(processor)
+            return None
+        if self.staged.site_code != processor.site_code or self.staged.request_handler is not processor.request_handler:
+            # Site changed (or the processor was rebuilt) since the prefetch started
+            logger.info("Prefetch belongs to a replaced processor, discarding")
+            self._reset()
+            return None
+
+        processor.commit(self.staged)
+        results, errors = processor.get_results(), self.errors
+        logger.info(f"Swapped in prefetched results ({age:.0f}s old)")
+        self._reset()
+        return results, errors
+
+    def discard(self, processor=None):
+        """Drop the staged result, its sources become due again"""
+        if processor is not None and self.sources:
+            processor.scheduler.release(self.sources)
+        self._reset()
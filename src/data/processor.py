@@ -1,22 +1,28 @@
 import os
-import re
 import sys
-import pytz
-import lxml
 import json
 import asyncio
-import html5lib
 import polars as pl
-import pandas as pd
-from datetime import datetime as dt
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Union
 from requests.exceptions import ConnectionError, RequestException
 
 
 # Module Path Fix
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from src.config.chronos import TimeManager
+from src.config.constants import RODEO_CUBE_DIMENSIONS, RODEO_CUBE_EXTRA_DIMENSIONS, USE_INCREMENTAL_RODEO
+from src.config.constants import USE_PROGRESSIVE_MERGE, PROGRESSIVE_MIN_SOURCES
 from src.data.areq import AsyncRequestHandler
+from src.data.lpi_history import LpiHistoryStore
+from src.data.scheduler import SourceScheduler
+from src.data.table_stream import RODEO_SCHEMA, RODEO_COLUMNS
+from src.data.html_table import read_table
+from src.data.locations import with_location
+from src.data.pick_area_index import PickAreaIndex
+from src.data.projection import plan_table
+from src.data.merge import MERGE_SOURCES, present_sources, merge_levels
+from src.data.rollup import RollupCube
+from src.data.rodeo_delta import RodeoDelta, ROW_KEY
 from src.config.site_build import SiteBuilder
 from src.utils.logger import CustomLogger
 
@@ -32,18 +38,31 @@ class DataProcessor:
     
 
 
-    def __init__(self):
-        self.shift_info = TimeManager.get_instance().get_shift_info()
-        self.site_info = SiteBuilder.get_instance().get_site_info()
+    def __init__(self, shift_info: Optional[Dict] = None, site_info: Optional[Dict] = None, limiter=None, request_handler=None):
+        # A site context can be passed in (multi-site mode), otherwise the active site is used
+        self._own_context = shift_info is not None
+        self.shift_info = shift_info or TimeManager.get_instance().get_shift_info()
+        self.site_info = site_info or SiteBuilder.get_instance().get_site_info()
 
         self.site_code = self.shift_info['site_code']
         self.timezone = self.shift_info['timezone']
         self.pick_areas = self.site_info['pick_areas']
+        # Built by SiteBuilder once per site, site info from elsewhere (captures, tests) gets its own
+        self.pick_area_index = self.site_info.get('pick_area_index') or PickAreaIndex(self.pick_areas)
         
-        self.request_handler = AsyncRequestHandler()
+        # Anything with stream_requests() can stand in for the network (see replay.py)
+        self.request_handler = request_handler or AsyncRequestHandler(
+            shift_info=self.shift_info if self._own_context else None,
+            limiter=limiter
+        )
         self.processed_data = {}
+        # Per-source fetch times, results of sources that are not due are kept
+        self.scheduler = SourceScheduler()
+        # Last Rodeo snapshot, only new rows are enriched on the next refresh
+        self.rodeo_delta = RodeoDelta(self._get_column_renames('Rodeo'))
 
-        DataProcessor._initialized = True
+        if not self._own_context:
+            DataProcessor._initialized = True
 
 
 
@@ -60,6 +79,34 @@ class DataProcessor:
         cls._instance = None
         cls._initialized = False
 
+    def stage(self) -> 'DataProcessor':
+        """
+        Processor for a background (prefetch) run: same site, request handler and
+        scheduler, but its own copy of processed_data, so get_results() keeps
+        returning the current data until commit().
+        """
+        staged = DataProcessor(shift_info=self.shift_info, site_info=self.site_info, request_handler=self.request_handler)
+        staged.processed_data = dict(self.processed_data)
+        staged.scheduler = self.scheduler
+        staged.rodeo_delta = self.rodeo_delta
+        return staged
+
+    def commit(self, staged: 'DataProcessor'):
+        """Take over the results of a staged run"""
+        self.processed_data = staged.processed_data
+
+    def update_shift_info(self, shift_info: Optional[Dict] = None):
+        """Pick up the current shift clock and site plan without dropping processed data"""
+        self.shift_info = shift_info or TimeManager.get_instance().get_shift_info()
+        self.timezone = self.shift_info['timezone']
+        if self._own_context:
+            self.request_handler.shift_info = self.shift_info
+        else:
+            # Plan and pick area edits made mid-shift
+            self.site_info = SiteBuilder.get_instance().get_site_info()
+            self.pick_areas = self.site_info['pick_areas']
+            self.pick_area_index = self.site_info.get('pick_area_index') or PickAreaIndex(self.pick_areas)
+
 
 
     def get_results(self) -> Dict[str, Any]:
@@ -119,20 +166,43 @@ class DataProcessor:
         """
         return self.processed_data
 
-    async def process_incoming_data(self):
-        """Process data streams with maximum concurrency"""
+    async def process_incoming_data(self, sources: Optional[List[str]] = None,
+                                    on_partial: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Process data streams with maximum concurrency
+
+        Args:
+            sources: Sources to fetch (see SourceScheduler), None for all.
+                     Earlier results of the other sources are reused in the merge.
+            on_partial: Called with provisional results (see _publish_partial)
+                        while slower sources are still processing.
+        """
         processing_tasks = {}
         error_occurred = False
+        requested = list(self.scheduler.cadence) if sources is None else list(sources)
+        # Sources processed this refresh
+        landed = {}
+        progressive = USE_PROGRESSIVE_MERGE and on_partial is not None
+
+        if sources is not None and not sources:
+            logger.info("No sources due, nothing to refresh")
+            return self.processed_data
+
+        capture = getattr(self.request_handler, 'capture', None)
+        if capture is not None:
+            capture.begin(self.shift_info, self.site_info, sources)
 
         try:
             # Start processing each response as soon as it arrives
-            async for name, response in self.request_handler.stream_requests():
+            async for name, response in self.request_handler.stream_requests(sources):
                 if response is not None:
                     logger.info(f"Received {name} data :: Status Code: {response['status_code']}")
                     
                     if response['status_code'] != 200:
                         error_msg = response.get('content', 'Unknown error')
                         logger.error(f"Error in {name}: {error_msg}")
+                        # Due again on the next scheduled refresh
+                        self.scheduler.release([name])
                         # Set error flag but don't raise
                         error_occurred = True
                         # Store error information for later use
@@ -162,10 +232,12 @@ class DataProcessor:
 
                     # Create processing task immediately
                     processing_tasks[name] = asyncio.create_task(
-                        self._route_processing(name, response['content'])
+                        self._route_progressive(name, response['content'], requested, landed, on_partial)
+                        if progressive else self._route_processing(name, response['content'])
                     )
                 else:
                     logger.warning(f"Received None response for {name}")
+                    self.scheduler.release([name])
 
             # Wait for all processing to complete only at the end
             if processing_tasks:
@@ -175,12 +247,18 @@ class DataProcessor:
                     return_exceptions=True
                 )
                 
+                if progressive:
+                    # A partial snapshot may be on screen, finish in a copy
+                    self.processed_data = dict(self.processed_data)
+
                 # Store results maintaining order
                 for name, result in zip(processing_tasks.keys(), results):
                     if isinstance(result, Exception):
                         logger.error(f"Error processing {name}: {str(result)}")
+                        self.scheduler.release([name])
                     else:
                         self.processed_data[name] = result
+                        landed[name] = result
                         logger.info(f"Successfully processed {name} data")
                         
                         
@@ -189,389 +267,10 @@ class DataProcessor:
                 processing_tasks.clear()  # Remove all tasks from the dictionary
 
                 try:
-                    if all(key in self.processed_data for key in ['Workforce', 'Rodeo', 'LPI', 'Process']):
-                        required_keys = {
-                            'Workforce': 'workforce_full',
-                            'Rodeo': 'rodeo_full',
-                            'LPI': 'lpi_full',
-                            'Process': 'process_full'
-                        }
-                        missing_keys = [key for key, sub_key in required_keys.items() if key not in self.processed_data or self.processed_data[key][sub_key].height < 1]
-
-                        # Granularity: CPT[Process Path[Pick Area[Bin]]]
-
-                        # COLUMNS :
-                            # Process Level:
-                                # Workforce: ['process_path', 'total_pickers', 'active_pickers', 'active_percent']
-                                # LPI & Hist: ['process_path', 'cases_picked', 'total_hours', 'mean_cph', 'avg_cph', 'historical_cph']
-                                # Rodeo: ['cpt', 'process_path', 'total_cases', 'total_units', 'hours_remaining', 'case_density']
-                                # Process: ['process_path', 'status', 'prioritized_units', 'non_prioritized_units', 'picker_count', 'units_in_scanner', 'units_per_hour', 'pick_rate_average', 'unit_rate_target']
-
-                            # Area Level:
-                                # Workforce: ['process_path', 'pick_area', 'area_hc', 'area_active_hc', 'active_percent']
-                                # LPI & Hist: ['process_path', 'pick_area', 'cases_picked', 'total_hours', 'mean_cph', 'avg_cph', 'historical_cph']
-                                # Rodeo: ['cpt', 'process_path', 'pick_area', 'total_cases', 'total_units', 'hours_remaining', 'case_density']
-
-                        # Rodeo:
-                            # Highest Level: CPT
-                            # Lowest Level: Bin
-                            # Focus: CPTs, Process/Case demand, and Density
-                        # Workforce:
-                            # Highest Level: Process Path
-                            # Lowest Level: Pick Area
-                            # Focus: Associate activity
-                        # LPI:
-                            # Highest Level: Process Path
-                            # Lowest Level: Pick Area
-                            # Focus: Volume, Labor, and Rates
-                        # Process:
-                            # Highest Level: Process Path
-                            # Lowest Level: Process Path
-                            # Focus: Process/Unit demand
-
-                        # Best Case: All Info (CPT/Path/Area/Bin Level)
-                            # AVAILABLE INFO:
-                            # - CPTs, Process/Case Demand, Density, Process/Unit Demand,
-                            #   Labor Hours, Processed Volume, Rates, Associate Activity
-
-                        # No Rodeo: Workforce, LPI, and Process (Path/Area Level)
-                            # - No CPTs, Case demand, or Density (out of work or external connection)
-                            # AVAILABLE INFO:
-                            # - Process/Unit demand, Labor Hours, Processed Volume, 
-                            #   Rates, Associate Activity
-
-                        # No Workforce: Rodeo, and LPI(CPT/Path/Area Level)
-                            # - No Associate Activity (pre-shift or break)
-                            # AVAILABLE INFO:
-                            # - CPTs, Case Demand, Labor Hours, Processed Volume, Rates
-
-                        # No LPI: Rodeo, Workforce, and Process (CPT/Path/Area/Bin Level)
-                            # - No Labor Hours, Processed Volume, or Rates (pre-shift)
-                            # AVAILABLE INFO:
-                            # - CPTs, Process/Case Demand, Density, Process/Unit Demand,
-                            #   Associate Activity
-
-                        # No Process: Rodeo, Workforce, and LPI (Path/Area Level, Labor and Units)
-                            # - No Process/Unit Demand (out of work or picking console down)
-                            # AVAILABLE INFO:
-                            # - CPTs, Case Demand, Labor Hours, Processed Volume, Rates,
-                            #   Associate Activity
-
-                        # No Rodeo = Out of Work or External Connection
-                        # No Workforce = Pre-Shift or Break
-                        # No LPI = Pre-Shift (rerun for historical?)
-                        # No Process = Out of Work or Bad Connection
-                        # No Workforce AND No LPI = Pre-Shift
-                        
-                        # Functional Cases
-                         # - No LPI or No Workforce
-                         # - No Rodeo
-                        
-                        elapsed_hours = self.shift_info['elapsed_time'].seconds / 3600
-
-                        if not missing_keys:
-
-                            logger.info("All required data is present")
-                            rodeo_state = 'See Rodeo[cpt_summary]'
-
-                            process_level_merge = (
-                                # Start with Rodeo data as base
-                                self.processed_data['Rodeo']['cpt_process_summary']
-                                # Join with Workforce data
-                                .join(
-                                    # ['process_path', 'total_pickers', 'active_pickers', 'active_percent']
-                                    self.processed_data['Workforce']['process_summary'],
-                                    on=['process_path'],
-                                    how='left'
-                                )
-                                # Join with LPI data
-                                .join(
-                                    self.processed_data['LPI']['process_summary'],
-                                    on=['process_path'],
-                                    how='left'
-                                )
-                                .join(
-                                    self.processed_data['LPI(Hist)']['process_summary_hist'].select(
-                                        ['process_path', pl.col('avg_cph').alias('historical_cph')]
-                                    ),
-                                    on=['process_path'],
-                                    how='left'
-                                )
-                                .with_columns([
-
-
-                                    # Calculate Process-Level Alignments
-                                    pl.struct(['cpt', 'process_path', 'total_hours', 'hours_remaining', 'total_cases', 'avg_cph'])
-                                        .map_elements(lambda x: self._calculate_alignment(
-                                            cpt=x['cpt'],
-                                            process_path=x['process_path'],
-                                            time_spent=x['total_hours'],
-                                            time_passed=elapsed_hours,
-                                            time_remaining=x['hours_remaining'],
-                                            work_remaining=x['total_cases'],
-                                            current_rate=x['avg_cph']
-                                        ))
-                                        .alias('projected_miss'),
-
-                                   # Calculate Picker Rate Average (PRA)
-                                    ((pl.when(pl.col('total_hours') > 0)
-                                        .then((pl.col('total_cases') / pl.col('total_hours')) * pl.col('case_density'))
-                                        .otherwise(0))
-                                        .round(2)
-                                        .alias('PRA'))
-                                ])
-                                .with_columns([
-                                    # Calculate Target Unit Rate (TUR)
-                                    (pl.when((pl.col('total_pickers') > 0) & (pl.col('PRA').is_not_null()))
-                                        .then(pl.col('PRA') / pl.col('total_pickers'))
-                                        .otherwise(0))
-                                        .round(2)
-                                        .alias('TUR')
-                                ])
-                                
-                            )
-
-
-                            # Join with Process data
-                            if 'Process' not in missing_keys:
-                                process_level_merge = (
-                                    process_level_merge.join(
-                                    self.processed_data['Process']['process_full'],
-                                    on=['process_path'],
-                                    how='left'
-                                    )
-                                )
-
-                            # Pick Area Level Merge
-                            area_level_merge = (
-                                # Start with Rodeo data as base
-                                self.processed_data['Rodeo']['cpt_process_area_summary']
-                                # Join with Workforce data
-                                .join(
-                                    # 
-                                    self.processed_data['Workforce']['process_area_summary'],
-                                    on=['process_path', 'pick_area'],
-                                    how='left'
-                                )
-                                # Join with LPI data
-                                .join(
-                                    self.processed_data['LPI']['process_area_summary'],
-                                    on=['process_path', 'pick_area'],
-                                    how='left'
-                                )
-                            
-                                .join(
-                                    self.processed_data['LPI(Hist)']['process_area_summary_hist'].select(
-                                        ['process_path', 'pick_area', pl.col('avg_cph').alias('historical_cph')]
-                                    ),
-                                    on=['process_path', 'pick_area'],
-                                    how='left'
-                                )
-                                    
-                            )
-
-                        else:
-                            logger.warning(f"Missing data: {missing_keys}")
-                            # Functional Cases
-                            # - No LPI or No Workforce
-                            # - No Rodeo
-                                
-                            if ('LPI' in missing_keys or 'Workforce' in missing_keys) and 'Rodeo' not in missing_keys:
-                                # - No LPI and No Workforce
-                                logger.warning("LPI or Workforce data missing\nPre-shift: Focusing Demand")
-                                rodeo_state = 'See Rodeo[cpt_summary]'
-
-                                if 'LPI' in missing_keys:
-                                    # Join with Workforce data
-                                    process_level_merge = (
-                                        # Start with Rodeo data as base
-                                        self.processed_data['Rodeo']['cpt_process_summary']
-                                        .join(
-                                            self.processed_data['Workforce']['process_summary'],
-                                            on=['process_path'],
-                                            how='left'
-                                        )
-
-                                        .join(
-                                            self.processed_data['LPI(Hist)']['process_summary_hist'].select(
-                                                ['process_path', pl.col('avg_cph').alias('historical_cph')]
-                                            ),
-                                            on=['process_path'],
-                                            how='left'
-                                        )
-
-                                        .with_columns([
-                                            # Add null-filled columns for LPI Data
-                                            # LPI & Hist: ['process_path', 'cases_picked', 'total_hours', 'mean_cph', 'avg_cph', 'historical_cph']
-                                            pl.lit(0).cast(pl.Float64).alias('cases_picked'),
-                                            pl.lit(0).cast(pl.Float64).alias('total_hours'),
-                                            pl.lit(None).cast(pl.Float64).alias('avg_cph'),
-                                            pl.lit(False).cast(pl.Boolean).alias('projected_miss'),
-                                            pl.lit(0).cast(pl.Float64).alias('PRA'),
-                                            pl.lit(0).cast(pl.Float64).alias('TUR')
-                                        ])
-                                    )
-
-                                    area_level_merge = (
-                                        # Start with Rodeo data as base
-                                        self.processed_data['Rodeo']['cpt_process_area_summary']
-                                        .join(
-                                            self.processed_data['Workforce']['process_area_summary'],
-                                            on=['process_path', 'pick_area'],
-                                            how='left'
-                                        )
-
-                                        .join(
-                                            self.processed_data['LPI(Hist)']['process_area_summary_hist'].select(
-                                                ['process_path', 'pick_area', pl.col('avg_cph').alias('historical_cph')]
-                                            ),
-                                            on=['process_path', 'pick_area'],
-                                            how='left'
-                                        )
-
-                                        .with_columns([
-                                            # Add null-filled columns for LPI Data
-                                            # LPI & Hist: ['process_path', 'pick_area', 'cases_picked', 'total_hours', 'mean_cph', 'avg_cph', 'historical_cph']
-                                            pl.lit(0).cast(pl.Float64).alias('cases_picked'),
-                                            pl.lit(0).cast(pl.Float64).alias('total_hours'),
-                                            pl.lit(None).cast(pl.Float64).alias('avg_cph'),
-                                            pl.lit(False).cast(pl.Boolean).alias('projected_miss'),
-                                            pl.lit(0).cast(pl.Float64).alias('PRA'),
-                                            pl.lit(0).cast(pl.Float64).alias('TUR')
-                                        ])
-                                    )
-
-
-                                elif 'Workforce' in missing_keys:
-                                    # Join with LPI data
-                                    process_level_merge = (
-                                        # Start with Rodeo data as base
-                                        self.processed_data['Rodeo']['cpt_process_summary']
-                                        .join(
-                                            self.processed_data['LPI']['process_summary'],
-                                            on=['process_path'],
-                                            how='left'
-                                        )
-
-                                        .join(
-                                            self.processed_data['LPI(Hist)']['process_summary_hist'].select(
-                                                ['process_path', pl.col('avg_cph').alias('historical_cph')]
-                                            ),
-                                            on=['process_path'],
-                                            how='left'
-                                        )
-
-                                        .with_columns([
-                                            # Add null-filled columns for Workforce Data
-                                            # Workforce: ['process_path', 'total_pickers', 'active_pickers', 'active_percent']
-                                            pl.lit(0).cast(pl.Float64).alias('total_pickers'),
-                                            pl.lit(0).cast(pl.Float64).alias('active_pickers'),
-                                            pl.lit(0).cast(pl.Float64).alias('active_percent'),
-                                            pl.lit(False).cast(pl.Boolean).alias('projected_miss'),
-                                            pl.lit(0).cast(pl.Float64).alias('PRA'),
-                                            pl.lit(0).cast(pl.Float64).alias('TUR')
-                                        ])
-                                    )
-
-                                    # Join with LPI data
-                                    area_level_merge = (
-                                        # Start with Rodeo data as base
-                                        self.processed_data['Rodeo']['cpt_process_area_summary']
-                                        .join(
-                                            self.processed_data['LPI']['process_area_summary'],
-                                            on=['process_path', 'pick_area'],
-                                            how='left'
-                                        )
-
-                                        .join(
-                                            self.processed_data['LPI(Hist)']['process_area_summary_hist'].select(
-                                                ['process_path', 'pick_area', pl.col('avg_cph').alias('historical_cph')]
-                                            ),
-                                            on=['process_path', 'pick_area'],
-                                            how='left'
-                                        )
-
-                                        .with_columns([
-                                            # Add null-filled columns for Workforce Data
-                                            # Workforce: ['process_path', 'pick_area', 'area_hc', 'area_active_hc', 'active_percent']
-                                            pl.lit(0).cast(pl.Float64).alias('area_hc'),
-                                            pl.lit(0).cast(pl.Float64).alias('area_active_hc'),
-                                            pl.lit(0).cast(pl.Float64).alias('active_percent'),
-                                            pl.lit(False).cast(pl.Boolean).alias('projected_miss'),
-                                            pl.lit(0).cast(pl.Float64).alias('PRA'),
-                                            pl.lit(0).cast(pl.Float64).alias('TUR')
-                                        ])
-                                    )
-
-
-
-                                # Join with Process data
-                                if 'Process' not in missing_keys:
-                                    process_level_merge = (
-                                        process_level_merge.join(
-                                        self.processed_data['Process']['process_full'],
-                                        on=['process_path'],
-                                        how='left'
-                                        )
-                                    )
-
-
-                            elif 'Rodeo' in missing_keys and 'LPI' not in missing_keys and 'Workforce' not in missing_keys:
-                                # - No Rodeo
-                                logger.warning("No Rodeo data to merge\nNodeo: Focusing Workforce")
-                                rodeo_state = 'No Rodeo'
-                                # Process Path Level Merge
-                                process_level_merge = (
-                                    # Start with Workforce
-                                    self.processed_data['Workforce']['process_summary']
-                                    # Join with LPI data
-                                    .join(
-                                        self.processed_data['LPI']['process_summary'],
-                                        on=['process_path'],
-                                        how='left'
-                                    )
-                                )
-                                # Join with Process data
-                                if 'Process' not in missing_keys:
-                                    process_level_merge = (
-                                        process_level_merge.join(
-                                        self.processed_data['Process']['process_full'],
-                                        on=['process_path'],
-                                        how='left'
-                                        )
-                                    )
-                                
-
-                                # Pick Area Level Merge
-                                area_level_merge = (
-                                    # Start with Rodeo data as base
-                                    self.processed_data['Workforce']['process_area_summary']
-                                
-                                    # Join with LPI data
-                                    .join(
-                                        self.processed_data['LPI']['process_area_summary'],
-                                        on=['process_path', 'pick_area'],
-                                        how='left'
-                                    )
-                                )
-
-                            else:
-                                # - No Workforce AND No LPI
-                                logger.warning("Not enough information to merge")
-                                rodeo_state = 'No Rodeo'
-                                # Process Path Level Merge
-                                process_level_merge = pl.DataFrame()
-
-                                # Pick Area Level Merge
-                                area_level_merge = pl.DataFrame()
-
-
-                        # Store merged results
-                        self.processed_data['combined_data'] = {
-                            'cpt_level' : rodeo_state,
-                            'process_level': process_level_merge,
-                            'area_level': area_level_merge
-                        }
+                    if all(key in self.processed_data for key in MERGE_SOURCES):
+                        self.processed_data['combined_data'] = self._combine(
+                            self.processed_data, self._completeness(requested, landed)
+                        )
 
                         logger.info("Completed all data level merges")
                         if error_occurred:
@@ -587,8 +286,166 @@ class DataProcessor:
             raise
         except Exception as e:
             raise RequestException(f"Processing error: {str(e)}")
+        finally:
+            if capture is not None:
+                # Written after processing so stored LPI history days are included
+                await asyncio.to_thread(capture.finish)
             
 
+    def _combine(self, processed_data: Dict[str, Any], completeness: Dict[str, bool]) -> Dict[str, Any]:
+        """
+        Merge the source results into combined_data.
+
+        Args:
+            processed_data: Source results, every MERGE_SOURCES key present (possibly empty)
+            completeness: Per source, False while this refresh is still waiting on it
+        """
+        present = present_sources(processed_data)
+        missing_keys = [key for key in MERGE_SOURCES if key not in present]
+
+        # Granularity: CPT[Process Path[Pick Area[Bin]]]
+
+        # COLUMNS :
+            # Process Level:
+                # Workforce: ['process_path', 'total_pickers', 'active_pickers', 'active_percent']
+                # LPI & Hist: ['process_path', 'cases_picked', 'total_hours', 'mean_cph', 'avg_cph', 'historical_cph']
+                # Rodeo: ['cpt', 'process_path', 'total_cases', 'total_units', 'hours_remaining', 'case_density']
+                # Process: ['process_path', 'status', 'prioritized_units', 'non_prioritized_units', 'picker_count', 'units_in_scanner', 'units_per_hour', 'pick_rate_average', 'unit_rate_target']
+
+            # Area Level:
+                # Workforce: ['process_path', 'pick_area', 'area_hc', 'area_active_hc', 'active_percent']
+                # LPI & Hist: ['process_path', 'pick_area', 'cases_picked', 'total_hours', 'mean_cph', 'avg_cph', 'historical_cph']
+                # Rodeo: ['cpt', 'process_path', 'pick_area', 'total_cases', 'total_units', 'hours_remaining', 'case_density']
+
+        # Rodeo:
+            # Highest Level: CPT
+            # Lowest Level: Bin
+            # Focus: CPTs, Process/Case demand, and Density
+        # Workforce:
+            # Highest Level: Process Path
+            # Lowest Level: Pick Area
+            # Focus: Associate activity
+        # LPI:
+            # Highest Level: Process Path
+            # Lowest Level: Pick Area
+            # Focus: Volume, Labor, and Rates
+        # Process:
+            # Highest Level: Process Path
+            # Lowest Level: Process Path
+            # Focus: Process/Unit demand
+
+        # Best Case: All Info (CPT/Path/Area/Bin Level)
+            # AVAILABLE INFO:
+            # - CPTs, Process/Case Demand, Density, Process/Unit Demand,
+            #   Labor Hours, Processed Volume, Rates, Associate Activity
+
+        # No Rodeo: Workforce, LPI, and Process (Path/Area Level)
+            # - No CPTs, Case demand, or Density (out of work or external connection)
+            # AVAILABLE INFO:
+            # - Process/Unit demand, Labor Hours, Processed Volume, 
+            #   Rates, Associate Activity
+
+        # No Workforce: Rodeo, and LPI(CPT/Path/Area Level)
+            # - No Associate Activity (pre-shift or break)
+            # AVAILABLE INFO:
+            # - CPTs, Case Demand, Labor Hours, Processed Volume, Rates
+
+        # No LPI: Rodeo, Workforce, and Process (CPT/Path/Area/Bin Level)
+            # - No Labor Hours, Processed Volume, or Rates (pre-shift)
+            # AVAILABLE INFO:
+            # - CPTs, Process/Case Demand, Density, Process/Unit Demand,
+            #   Associate Activity
+
+        # No Process: Rodeo, Workforce, and LPI (Path/Area Level, Labor and Units)
+            # - No Process/Unit Demand (out of work or picking console down)
+            # AVAILABLE INFO:
+            # - CPTs, Case Demand, Labor Hours, Processed Volume, Rates,
+            #   Associate Activity
+
+        # No Rodeo = Out of Work or External Connection
+        # No Workforce = Pre-Shift or Break
+        # No LPI = Pre-Shift (rerun for historical?)
+        # No Process = Out of Work or Bad Connection
+        # No Workforce AND No LPI = Pre-Shift
+        
+        # Functional Cases
+         # - No LPI or No Workforce
+         # - No Rodeo
+        
+        elapsed_hours = self.shift_info['elapsed_time'].seconds / 3600
+        # Loaded plan as a table for the projection kernel (None without a plan)
+        plan = plan_table(self.site_info['plan_data'])
+
+        if not missing_keys:
+            logger.info("All required data is present")
+        else:
+            logger.warning(f"Missing data: {missing_keys}")
+            # Functional Cases
+            # - No LPI or No Workforce
+            # - No Rodeo
+            if ('LPI' in missing_keys or 'Workforce' in missing_keys) and 'Rodeo' not in missing_keys:
+                logger.warning("LPI or Workforce data missing\nPre-shift: Focusing Demand")
+            elif 'Rodeo' in missing_keys and 'LPI' not in missing_keys and 'Workforce' not in missing_keys:
+                logger.warning("No Rodeo data to merge\nNodeo: Focusing Workforce")
+            elif 'Rodeo' in missing_keys:
+                logger.warning("Not enough information to merge")
+        rodeo_state = 'See Rodeo[cpt_summary]' if 'Rodeo' in present else 'No Rodeo'
+
+        # One lazy plan over the present sources, missing ones as typed null columns
+        process_level_merge, area_level_merge, cpt_level_projection = merge_levels(
+            processed_data, present, elapsed_hours, plan
+        )
+
+
+        return {
+            'cpt_level' : rodeo_state,
+            'process_level': process_level_merge,
+            'area_level': area_level_merge,
+            'cpt_projection': cpt_level_projection,
+            'completeness': completeness
+        }
+
+    def _completeness(self, requested: List[str], landed: Dict[str, Any]) -> Dict[str, bool]:
+        """Per source, True unless it was requested this refresh and has not been processed (yet)"""
+        return {name: name not in requested or name in landed for name in self.scheduler.cadence}
+
+    async def _route_progressive(self, name: str, data: Any, requested: List[str], landed: Dict[str, Any],
+                                 on_partial: Callable[[Dict[str, Any]], None]):
+        """Process a source, then publish provisional results if enough has landed"""
+        result = await self._route_processing(name, data)
+        landed[name] = result
+        self._publish_partial(requested, landed, on_partial)
+        return result
+
+    def _publish_partial(self, requested: List[str], landed: Dict[str, Any],
+                         on_partial: Callable[[Dict[str, Any]], None]):
+        """
+        Merge what this refresh has processed so far with the last results of
+        the pending sources and hand it to on_partial, once the
+        PROGRESSIVE_MIN_SOURCES have landed. combined_data['completeness']
+        tells which sources are still pending. Nothing is published when no
+        source is pending (the full merge follows) or a merge source has
+        never been processed at all.
+        """
+        pending = [name for name in requested if name not in landed]
+        if not pending or any(name in pending for name in PROGRESSIVE_MIN_SOURCES):
+            return
+
+        snapshot = {**self.processed_data, **landed}
+        if not all(key in snapshot for key in MERGE_SOURCES):
+            return
+
+        try:
+            snapshot['combined_data'] = self._combine(snapshot, self._completeness(requested, landed))
+        except Exception as e:
+            logger.error(f"Error merging partial results: {str(e)}")
+            return
+
+        # Swapped in whole, readers never see a half-updated dict
+        self.processed_data = snapshot
+        logger.info(f"Published partial results, waiting on {', '.join(pending)}")
+        on_partial(snapshot)
+
     async def _route_processing(self, name: str, data: Any) -> Optional[pl.DataFrame]:
         """Route data to appropriate processor"""
         processors = {
@@ -927,112 +784,90 @@ class DataProcessor:
                 "combined_hrs": 0
             },"""
         try:
-            if df['process_path'].str.contains('PPHOVRESERVE').any():
-
-                hov_rate = (
-                    df.lazy()
-                    .filter(pl.col('process_path').str.contains('PPHOVRESERVE'))
-                    .select([
-                        (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2).alias("avg_cph")
-                    ])
-                    .collect()
-                    .get_column('avg_cph')[0]
-                )
-                hov_vol = (
-                    df.lazy()
-                    .filter(pl.col('process_path').str.contains('PPHOVRESERVE'))
-                    .select([pl.col('unit_count').sum().alias("vol")])
-                    .collect()
-                    .get_column('vol')[0]
-                )
-                hov_hrs = (
-                    df.lazy()
-                    .filter(pl.col('process_path').str.contains('PPHOVRESERVE'))
-                    .select([pl.col('time_hours').sum().round(2).alias("hrs")])
-                    .collect()
-                    .get_column('hrs')[0]
-                )
-
-            else:
-
-                hov_rate = 0
-                hov_vol = 0
-                hov_hrs = 0
-
-            # Invert our filter with '~' to catch the other side
-            non_hov_rate = (
+            # One pass over lpi_full, aggregated to the finest grain (path x area);
+            # every summary and total is rolled up from these few thousand rows
+            logger.debug(f"LPI : Aggregating by Pick Area within Process Path")
+            partials = (
                 df.lazy()
-                .filter(~pl.col('process_path').str.contains('PPHOVRESERVE'))
-                .select([
-                    (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2).alias("avg_cph")
+                .group_by(['process_path', 'pick_area'])
+                .agg([
+                    pl.col('unit_count').sum().alias('cases_picked'),
+                    pl.col('time_hours').sum().alias('total_hours'),
+                    # Sum and count so the mean can be rolled up to process paths
+                    pl.col('units_per_hr').sum().alias('rate_sum'),
+                    pl.col('units_per_hr').count().alias('rate_count')
                 ])
-                .collect()
-                .get_column('avg_cph')[0]
-            )
-            non_hov_vol = (
-                df.lazy()
-                .filter(~pl.col('process_path').str.contains('PPHOVRESERVE'))
-                .select([pl.col('unit_count').sum().alias("vol")])
-                .collect()
-                .get_column('vol')[0]
-            )
-            non_hov_hrs = (
-                df.lazy()
-                .filter(~pl.col('process_path').str.contains('PPHOVRESERVE'))
-                .select([pl.col('time_hours').sum().round(2).alias("hrs")])
-                .collect()
-                .get_column('hrs')[0]
-            )
-
-
-            combined_rate = (
-                df.lazy()
-                .select([
-                    (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2).alias("avg_cph")
+                # HOV tagged once per path / area instead of once per query and row
+                .with_columns([
+                    pl.col('process_path').str.contains('PPHOVRESERVE').alias('is_hov')
                 ])
                 .collect()
-                .get_column('avg_cph')[0]
-            )
-            combined_vol = (
-                df.lazy()
-                .select([pl.col('unit_count').sum().alias("vol")])
-                .collect()
-                .get_column('vol')[0]
-            )
-            combined_hrs = (
-                df.lazy()
-                .select([pl.col('time_hours').sum().round(2).alias("hrs")])
-                .collect()
-                .get_column('hrs')[0]
+                .lazy()
             )
 
-            # First level grouping by Process Path
-            logger.debug(f"LPI : Grouping by process path")
-            process_summary = df.group_by('process_path').agg([
-                # Volume / Hours / Rate
-                pl.col('unit_count').sum().alias("cases_picked"),
-                pl.col('time_hours').sum().alias("total_hours").round(2),
-
-                # Method 1 (arithmetic mean of rates):
-                # (100 + 100 + 100) / 3 = 100 units/hr
-                pl.col('units_per_hr').mean().alias("mean_cph").round(2),
+            def _rates(frame: pl.LazyFrame, keys: List[str]) -> pl.LazyFrame:
+                return frame.with_columns([
+                    pl.col('total_hours').round(2),
 
-                # Method 2 (total units / total hours): *preferred*
-                # (100 + 50 + 10) / (1 + 0.5 + 0.1) = 160/1.6 = 100 units/hr
-                (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2).alias("avg_cph")
+                    # Method 1 (arithmetic mean of rates):
+                    # (100 + 100 + 100) / 3 = 100 units/hr
+                    pl.when(pl.col('rate_count') > 0)
+                        .then(pl.col('rate_sum') / pl.col('rate_count'))
+                        .round(2)
+                        .alias('mean_cph'),
+
+                    # Method 2 (total units / total hours): *preferred*
+                    # (100 + 50 + 10) / (1 + 0.5 + 0.1) = 160/1.6 = 100 units/hr
+                    (pl.col('cases_picked') / pl.col('total_hours')).round(2).alias('avg_cph')
+                ]).select(keys + ['cases_picked', 'total_hours', 'mean_cph', 'avg_cph'])
+
+            def _totals(prefix: str, rows: pl.Expr) -> List[pl.Expr]:
+                volume = pl.col('cases_picked').filter(rows).sum()
+                hours = pl.col('total_hours').filter(rows).sum()
+                return [
+                    (volume / hours).round(2).alias(f"{prefix}_rate"),
+                    volume.alias(f"{prefix}_vol"),
+                    hours.round(2).alias(f"{prefix}_hrs")
+                ]
+
+            process_area_summary, process_summary, totals = pl.collect_all([
+                # Second level grouping by Pick Area within Process Path
+                partials
+                    .sort('process_path', 'pick_area')
+                    .pipe(_rates, ['process_path', 'pick_area']),
+
+                # First level grouping by Process Path
+                partials
+                    .group_by('process_path')
+                    .agg(pl.col(['cases_picked', 'total_hours', 'rate_sum', 'rate_count']).sum())
+                    .pipe(_rates, ['process_path']),
+
+                # HOV / non-HOV / combined rate, volume and hours
+                partials.select(
+                    [pl.col('is_hov').any().alias('has_hov')]
+                    + _totals('hov', pl.col('is_hov'))
+                    + _totals('non_hov', ~pl.col('is_hov'))
+                    + _totals('combined', pl.lit(True))
+                )
             ])
+            totals = totals.row(0, named=True)
 
-            # Second level grouping by Pick Area within Process Path
-            logger.debug(f"LPI : Grouping by Pick Area within Process Path")
-            process_area_summary = df.group_by([
-                'process_path', 'pick_area'
-            ]).agg([
-                # Volume / Hours / Rate
-                pl.col('unit_count').sum().alias("cases_picked"),
-                pl.col('time_hours').sum().alias("total_hours").round(2),
-                pl.col('units_per_hr').mean().alias("mean_cph").round(2),
-                (pl.col('unit_count').sum() / pl.col('time_hours').sum()).round(2).alias("avg_cph")
-            ]).sort('process_path', 'pick_area')
+            if totals['has_hov']:
+                hov_rate = totals['hov_rate']
+                hov_vol = totals['hov_vol']
+                hov_hrs = totals['hov_hrs']
+            else:
+                hov_rate = 0
+                hov_vol = 0
+                hov_hrs = 0
+
+            non_hov_rate = totals['non_hov_rate']
+            non_hov_vol = totals['non_hov_vol']
+            non_hov_hrs = totals['non_hov_hrs']
+
+            combined_rate = totals['combined_rate']
+            combined_vol = totals['combined_vol']
+            combined_hrs = totals['combined_hrs']
 
 
             print(f"LPI : Grouped Data")
@@ -1085,12 +920,16 @@ class DataProcessor:
             return lpi
 
 
-    async def _normalize_lpi_hist(self, data: str) -> pl.DataFrame:
+    async def _normalize_lpi_hist(self, data: Union[str, Dict]) -> pl.DataFrame:
         """Process LPI data"""
         print(f"Processing Historical LPI data")
         logger.info(f"Processing Historical LPI data")
 
         try:
+            # Day-by-day history, only the newly fetched days need parsing
+            if isinstance(data, dict) and 'pages' in data:
+                return await self._compose_lpi_hist(data)
+
             # Extract JSON from LPI response if it's a string
             if isinstance(data, str):
                 if 'filteredProductivityList = ' in data:
@@ -1106,44 +945,8 @@ class DataProcessor:
                     }
                     return lpi_hist
 
-            df = pl.DataFrame(data)
-            
             # Apply transformations and type casting
-            df_task = asyncio.to_thread(
-                lambda: df.lazy()
-                    .unnest('processAttributes')  # Unnest process attributes
-                    .unnest('attributes')         # Unnest the nested attributes
-                    .explode('associateProductivityList')  # Explode the list of associates
-                    .unnest('associateProductivityList')  # Unnest the associate data
-                    .rename(self._get_column_renames('LPI'))  # Rename columns before casting
-                    .with_columns(
-                        self._get_column_type_casts('LPI')
-                    )
-                    .drop([
-                        'processName','process_id','labor_tracking_type',
-                        'gl_code','pick_path_group','work_flow','is_tokenized',
-                        'availability','processAttributes'
-                    ])
-
-                    .with_columns([
-                        # Convert Millis to Hours
-                        (pl.col("time_millis") / 3600)
-                        .round(2)
-                        .alias("time_hours")
-                    ])
-
-                    .with_columns([
-                        # Calculate Units per Hour
-                        (pl.when(pl.col("time_hours") > 0)
-                            .then(pl.col("unit_count") / pl.col("time_hours"))
-                            .otherwise(0))
-                        .round(2)
-                        .alias("units_per_hr")
-                    ])
-
-
-                    .collect()
-            )
+            df_task = asyncio.to_thread(self._lpi_hist_frame, data)
             # Get DataFrame result
             df = await df_task
 
@@ -1163,6 +966,84 @@ class DataProcessor:
             logger.error(f"LPI Hist normalizing error: {str(e)}\nTraceback: ", exc_info=True)
             return pl.DataFrame()
 
+    def _lpi_hist_frame(self, data: List[Dict]) -> pl.DataFrame:
+        """Flatten an FCLM productivity list to one row per associate"""
+        return (
+            pl.DataFrame(data).lazy()
+                .unnest('processAttributes')  # Unnest process attributes
+                .unnest('attributes')         # Unnest the nested attributes
+                .explode('associateProductivityList')  # Explode the list of associates
+                .unnest('associateProductivityList')  # Unnest the associate data
+                .rename(self._get_column_renames('LPI'))  # Rename columns before casting
+                .with_columns(
+                    self._get_column_type_casts('LPI')
+                )
+                .drop([
+                    'processName','process_id','labor_tracking_type',
+                    'gl_code','pick_path_group','work_flow','is_tokenized',
+                    'availability','processAttributes'
+                ])
+
+                .with_columns([
+                    # Convert Millis to Hours
+                    (pl.col("time_millis") / 3600)
+                    .round(2)
+                    .alias("time_hours")
+                ])
+
+                .with_columns([
+                    # Calculate Units per Hour
+                    (pl.when(pl.col("time_hours") > 0)
+                        .then(pl.col("unit_count") / pl.col("time_hours"))
+                        .otherwise(0))
+                    .round(2)
+                    .alias("units_per_hr")
+                ])
+
+                .collect()
+        )
+
+    async def _compose_lpi_hist(self, data: Dict) -> Dict[str, Any]:
+        """Store newly fetched history days, then build the rolling summaries"""
+        history = LpiHistoryStore.get_instance()
+        site_code = data['site_code']
+
+        for day, page in data['pages'].items():
+            if not isinstance(page, str) or 'filteredProductivityList = ' not in page:
+                # Not stored, so the day is fetched again next refresh
+                logger.warning(f"LPI Historical : {day.isoformat()} page doesn't contain expected string pattern")
+                continue
+
+            json_str = page.split('filteredProductivityList = ')[1].split(';')[0]
+            rows = json.loads(json_str)
+            if not rows:
+                # FCLM may not have finalized the day yet, fetch it again next refresh
+                logger.warning(f"LPI Historical : {day.isoformat()} has no productivity rows yet, not stored")
+                continue
+            df = await asyncio.to_thread(self._lpi_hist_frame, rows)
+            await asyncio.to_thread(history.save_day, site_code, day, history.aggregate_day(df))
+
+        composed = await asyncio.to_thread(history.compose, site_code, data['days'])
+        if composed is None:
+            logger.warning("Historical LPI : No stored days\nNo Labor - Check shift times / Authentication")
+            print("Historical LPI : No stored days\nNo Labor - Check shift times / Authentication")
+            return {
+                "lpi_full" : pl.DataFrame(),
+                "daily_area_summary_hist": pl.DataFrame(),
+                "process_summary_hist": pl.DataFrame(),
+                "process_area_summary_hist": pl.DataFrame(),
+            }
+
+        process_summary, process_area_summary, daily = composed
+        print(f"LPI Historical : Composed {daily['date'].n_unique()} Days")
+        logger.info(f"LPI Historical : Composed {daily['date'].n_unique()} days")
+        return {
+            "lpi_full": pl.DataFrame(),
+            "daily_area_summary_hist": daily,
+            "process_summary_hist": process_summary,
+            "process_area_summary_hist": process_area_summary
+        }
+
 
     async def _group_lpi_hist(self, df: pl.DataFrame):
         """Group and aggregate LPI data"""
@@ -1222,147 +1103,41 @@ class DataProcessor:
  ## ##   ##  ##  
  ##  ##   ####   
 #RODEO
-    async def _normalize_rodeo(self, data: str) -> pl.DataFrame:
+    async def _normalize_rodeo(self, data: Union[str, pl.DataFrame]) -> pl.DataFrame:
         """Process Rodeo data"""
 
 
         print(f"Processing Rodeo data")
         logger.info(f"Processing Rodeo data")
 
-        # First, extract numeric values from Start/End Aisle columns
-        # Ensure consistent integer types in pick areas
-        pick_areas = (
-            self.pick_areas
-            .select([
-                pl.col('Name'),
-                pl.col('Start Aisle'),
-                pl.col('End Aisle'),
-                pl.col('Start Slot'),
-                pl.col('End Slot')
-            ])
-            .with_columns([
-                # Convert aisle strings to integers
-                pl.col('Start Aisle').str.extract_all(r'\d+').list.first().cast(pl.Int64),
-                pl.col('End Aisle').str.extract_all(r'\d+').list.first().cast(pl.Int64),
-                # Convert slot strings to integers
-                pl.col('Start Slot').cast(pl.Int64),
-                pl.col('End Slot').cast(pl.Int64)
-            ])
-        )
-        
-        def extract_aisle(id_str: str) -> Optional[int]:
-            if not isinstance(id_str, str) or not id_str.startswith('P-1-'):
-                return None
-            pattern = r'P-1-[A-Z](\d{3})'
-            match = re.search(pattern, id_str)
-            return int(match.group(1)) if match else None
-
-        def extract_slot(id_str: str) -> Optional[int]:
-            if not isinstance(id_str, str) or not id_str.startswith('P-1-'):
-                return None
-            pattern = r'P-1-[A-Z]\d{3}[A-Z](\d{2,3})'
-            match = re.search(pattern, id_str)
-            return int(match.group(1)) if match else None
-            
-        # Find the matching pick area
-        def find_pick_area(aisle: Optional[int], slot: Optional[int]) -> Optional[str]:
-            if aisle is None or slot is None:
-                return None
-            
-            try:
-                # Now comparing integers with integers
-                matches = pick_areas.filter(
-                    (pl.col('Start Aisle') <= aisle) & 
-                    (pl.col('End Aisle') >= aisle) &
-                    (pl.col('Start Slot') <= slot) &
-                    (pl.col('End Slot') >= slot)
-                )
-                return matches['Name'][0] if matches.height > 0 else None
-                
-            except Exception as e:
-                logger.error(f"Error in find_pick_area: {str(e)}")
-                return None
-            
         try:
-            # Convert HTML to DataFrame
-            df = await asyncio.to_thread(lambda: pl.from_pandas(pd.read_html(data)[0]))
+            if isinstance(data, pl.DataFrame):
+                # Already parsed into batches while streaming
+                df = data
+            else:
+                # ItemListCSV export or HTML table, typed like the streamed batches
+                df = await asyncio.to_thread(read_table, data, RODEO_SCHEMA, RODEO_COLUMNS)
             
             if df.height < 1:
                 return {"rodeo_full": pl.DataFrame()}
-            df_task = asyncio.to_thread(
-                lambda: df.lazy()
-                    .drop(['Status', 'Work Pool', 'FN SKU', 'Pick Priority', 'Container Type'])
-                    # Extract and process locations - cast to Int64 immediately
-                    .with_columns([
-                        pl.col('Outer Scannable ID')
-                            .map_elements(extract_aisle)
-                            .cast(pl.Int64)
-                            .alias('primary_aisle'),
-                        pl.col('Outer Scannable ID')
-                            .map_elements(extract_slot)
-                            .cast(pl.Int64)
-                            .alias('primary_slot'),
-                        pl.col('Outer Outer Scannable ID')
-                            .map_elements(extract_aisle)
-                            .cast(pl.Int64)
-                            .alias('secondary_aisle'),
-                        pl.col('Outer Outer Scannable ID')
-                            .map_elements(extract_slot)
-                            .cast(pl.Int64)
-                            .alias('secondary_slot')
-                    ])
-                    # Coalesce with proper null handling
-                    .with_columns([
-                        pl.coalesce([
-                            pl.col('primary_aisle'),
-                            pl.col('secondary_aisle')
-                        ]).fill_null(-1).alias('Aisle'),
-                        pl.coalesce([
-                            pl.col('primary_slot'),
-                            pl.col('secondary_slot')
-                        ]).fill_null(-1).alias('Slot')
-                    ])
-                    .drop(['primary_aisle', 'primary_slot', 'secondary_aisle', 'secondary_slot'])
-
-                    .with_columns([
-                        pl.struct(['Aisle', 'Slot'])
-                            .map_elements(lambda x: find_pick_area(x['Aisle'], x['Slot']))
-                            .alias('Pick Area')
-                    ])
-
-                    # Process remaining columns
-                    .with_columns([
-                        pl.col('Process Path').str.to_uppercase(),
-                        pl.col('Pick Area').str.to_uppercase()
-                    ])
-
-
-                    .sort('Need To Ship By Date')
-
-                    .with_columns([
-                        pl.col('Need To Ship By Date')
-                            .str.strptime(pl.Datetime, format='%Y-%m-%d %H:%M:%S')
-                            .dt.replace_time_zone(self.timezone)
-                            .dt.strftime('%m-%d %H:%M')
-                            .alias('CPT')
-                    ])
-                    .rename(self._get_column_renames('Rodeo'))
-
-                    .with_columns([
-                        pl.when(pl.col('process_path').str.contains('PPHOVRESERVE'))
-                            .then(pl.lit('HOV'))
-                            .otherwise(pl.col('cpt'))
-                            .alias('cpt')
-                    ])
 
+            delta = None
+            if USE_INCREMENTAL_RODEO:
+                # Rows seen last refresh keep their enrichment (RodeoDelta)
+                # Pick areas by content: a reloaded but unchanged plan keeps the snapshot
+                config = (
+                    self.site_code, self.timezone, self.shift_info.get('shift_start'), tuple(self.pick_area_index.areas)
+                )
+                df, delta = await asyncio.to_thread(self.rodeo_delta.split, df, config)
+
+            df = await asyncio.to_thread(self._enrich_rodeo, df)
+            if delta is not None:
+                delta['added'] = df
+                # Both sides are sorted by CPT already, merging them is linear
+                df = await asyncio.to_thread(
+                    delta['kept'].merge_sorted, df.select(delta['kept'].columns), 'need_to_ship_by_date'
+                )
 
-
-                    .collect()
-            )
-            
-
-            # Get DataFrame result
-            df = await df_task
             if df.height < 1:
                 logger.error("Rodeo data is empty")
                 return {"rodeo_full": pl.DataFrame()}
@@ -1372,7 +1147,7 @@ class DataProcessor:
 
 
             # Start grouping as soon as DataFrame is ready
-            grouping_task = asyncio.create_task(self._group_rodeo(df))
+            grouping_task = asyncio.create_task(self._group_rodeo(df, delta))
     
             # Get grouping results
             grouped_rodeo = await grouping_task
@@ -1385,75 +1160,135 @@ class DataProcessor:
             logger.error(f"Rodeo normalizing error: {str(e)}\nTraceback: ", exc_info=True)
             return {"rodeo_full": pl.DataFrame()}
 
-    async def _group_rodeo(self, df: pl.DataFrame):
-        """Group and aggregate Rodeo data"""
-        def _calculate_hours_remaining(cpt_str, now):    
-            if cpt_str == 'HOV':
-                hours_remaining = self.shift_info['hours_remaining'].seconds / 3600
-                return round(hours_remaining, 2)
-            
-            # Parse the CPT string (assuming current year)
-            current_year = now.year
-            try:
-                # Convert CPT to timezone aware datetime 
-                naive_cpt = dt.strptime(f"{current_year}-{cpt_str}", "%Y-%m-%d %H:%M")
-                cpt_time = pytz.timezone(self.timezone).localize(naive_cpt)
-                # Calculate the time difference in hours
-                time_diff = cpt_time - now
-                hours_remaining = time_diff.total_seconds() / 3600
-                
-                return round(hours_remaining, 2)
-            except ValueError as e:
-                print(str(e))
-                return None
+    def _enrich_rodeo(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Locations, pick area and CPT of raw Rodeo rows, columns renamed"""
+        return (
+            df.lazy()
+            # Delimited bodies only carry RODEO_COLUMNS
+            .drop(['Status', 'Work Pool', 'FN SKU', 'Pick Priority', 'Container Type'], strict=False)
+            # Extract locations (LOCATION_GRAMMARS) - native string expressions, Int64
+            .pipe(with_location, 'Outer Scannable ID', 'primary_aisle', 'primary_slot')
+            .pipe(with_location, 'Outer Outer Scannable ID', 'secondary_aisle', 'secondary_slot')
+            # Coalesce with proper null handling
+            .with_columns([
+                pl.coalesce([
+                    pl.col('primary_aisle'),
+                    pl.col('secondary_aisle')
+                ]).fill_null(-1).alias('Aisle'),
+                pl.coalesce([
+                    pl.col('primary_slot'),
+                    pl.col('secondary_slot')
+                ]).fill_null(-1).alias('Slot')
+            ])
+            .drop(['primary_aisle', 'primary_slot', 'secondary_aisle', 'secondary_slot'])
 
-        try:
+            # First matching pick area for the whole column (PickAreaIndex)
+            .with_columns([
+                self.pick_area_index.assign('Aisle', 'Slot').alias('Pick Area')
+            ])
 
-            non_hov_picks_rem = (
-                df.lazy()
-                .filter(~pl.col('process_path').str.contains('PPHOVRESERVE'))
-                .select([pl.col('transfer_request_id').count().alias("vol")])
-                .collect()
-                .get_column('vol')[0]
-            )
+            # Process remaining columns
+            .with_columns([
+                pl.col('Process Path').str.to_uppercase(),
+                pl.col('Pick Area').str.to_uppercase()
+            ])
 
-            hov_picks_rem = (
-                df.lazy()
-                .filter(pl.col('process_path').str.contains('PPHOVRESERVE'))
-                .select([pl.col('transfer_request_id').count().alias("vol")])
-                .collect()
-                .get_column('vol')[0]
-            )
 
-            all_picks_rem = (
-                df.lazy()
-                .select([pl.col('transfer_request_id').count().alias("vol")])
-                .collect()
-                .get_column('vol')[0]
-            )
+            .sort('Need To Ship By Date')
 
+            .with_columns([
+                pl.col('Need To Ship By Date')
+                    .str.strptime(pl.Datetime, format='%Y-%m-%d %H:%M:%S')
+                    .dt.replace_time_zone(self.timezone)
+                    .dt.strftime('%m-%d %H:%M')
+                    .alias('CPT')
+            ])
+            .rename(self._get_column_renames('Rodeo'))
 
-            # First level grouping by Process Path
-            logger.debug(f"Rodeo : Grouping by picks in CPT")
-            cpt_summary = df.group_by('cpt').agg([
-                # Case / Unit counts
-                pl.col('transfer_request_id').count().alias("total_cases"),
-                pl.col('quantity').sum().alias("total_units"),
+            .with_columns([
                 pl.when(pl.col('process_path').str.contains('PPHOVRESERVE'))
-                .then(pl.col('transfer_request_id'))
-                .count()
-                .alias('hov_cases')
+                    .then(pl.lit('HOV'))
+                    .otherwise(pl.col('cpt'))
+                    .alias('cpt')
             ])
 
-            cpt_summary = cpt_summary.with_columns([
-                # CPT-level hours remaining
-                pl.struct(['cpt']).map_elements(
-                    lambda x: _calculate_hours_remaining(
-                        cpt_str=x['cpt'],
-                        now=self.shift_info['now']
-                    )
-                ).alias('hours_remaining'),
 
+
+            .collect()
+        )
+
+    def _cpt_hours_remaining(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Hours until each distinct CPT, as (cpt, hours_remaining).
+
+        The CPT timestamp is read from the full need-to-ship date (cut to the
+        minute like the CPT label), so no year is guessed and CPTs after New
+        Year count forward. HOV gets the hours left in the shift.
+        """
+        now_us = int(self.shift_info['now'].timestamp() * 1_000_000)
+        hov_hours = round(self.shift_info['hours_remaining'].seconds / 3600, 2)
+        return (
+            df.lazy()
+            .group_by('cpt')
+            .agg(pl.col('need_to_ship_by_date').min().alias('cpt_time'))
+            .with_columns([
+                pl.col('cpt_time')
+                    .str.strptime(pl.Datetime, format='%Y-%m-%d %H:%M:%S', strict=False)
+                    .dt.truncate('1m')
+                    .dt.replace_time_zone(self.timezone, ambiguous='latest')
+            ])
+            .with_columns([
+                pl.when(pl.col('cpt') == 'HOV')
+                    .then(pl.lit(hov_hours))
+                    .otherwise(((pl.col('cpt_time').dt.epoch('us') - now_us) / 3_600_000_000).round(2))
+                    .alias('hours_remaining')
+            ])
+            .select(['cpt', 'hours_remaining'])
+            .collect()
+        )
+
+    def _rodeo_cube(self, df: pl.DataFrame) -> RollupCube:
+        """Rodeo rows aggregated at RODEO_CUBE_DIMENSIONS (+ extras)"""
+        return RollupCube(df, RODEO_CUBE_DIMENSIONS + RODEO_CUBE_EXTRA_DIMENSIONS, {
+            # Case / Unit counts
+            'total_cases': (pl.col('transfer_request_id').count(), 'sum'),
+            'total_units': (pl.col('quantity').sum(), 'sum'),
+            'hov_cases': (
+                pl.when(pl.col('process_path').str.contains('PPHOVRESERVE'))
+                .then(pl.col('transfer_request_id'))
+                .count(),
+                'sum'
+            ),
+            # Earliest need-to-ship date, for the hours remaining per CPT
+            'need_to_ship_by_date': (pl.col('need_to_ship_by_date').min(), 'min')
+        })
+
+    async def _group_rodeo(self, df: pl.DataFrame, delta: Optional[Dict[str, pl.DataFrame]] = None):
+        """Group and aggregate Rodeo data (from the last snapshot's cube given the changed rows)"""
+        try:
+            # One scan of rodeo_full at the finest grain, every level below is a
+            # rollup of that (the cube stays with the snapshot for other views)
+            if delta is not None and self.rodeo_delta.cube is not None:
+                logger.debug(f"Rodeo : Updating rollup cube")
+                cube = self.rodeo_delta.cube.update(df, delta['added'], delta['removed'])
+            else:
+                logger.debug(f"Rodeo : Building rollup cube")
+                cube = self._rodeo_cube(df)
+
+            # Hours remaining once per CPT, joined onto every level
+            cpt_hours = self._cpt_hours_remaining(cube.rollup(['cpt']))
+
+            is_hov = pl.col('process_path').str.contains('PPHOVRESERVE')
+            non_hov_picks_rem = cube.total('total_cases', ~is_hov)
+            hov_picks_rem = cube.total('total_cases', is_hov)
+            all_picks_rem = cube.total('total_cases')
+
+
+            # First level grouping by Process Path
+            logger.debug(f"Rodeo : Grouping by picks in CPT")
+            cpt_summary = cube.rollup(['cpt']).select(['cpt', 'total_cases', 'total_units', 'hov_cases'])
+
+            cpt_summary = cpt_summary.join(cpt_hours, on='cpt', how='left').with_columns([
                 # Calculate density
                 (pl.col('total_units') / pl.col('total_cases'))
                     .round(2)
@@ -1469,23 +1304,11 @@ class DataProcessor:
             # Second level grouping by Process Path within CPT
             logger.debug(f"Rodeo : Grouping by Process Path within CPT")
 
-            cpt_process_summary = df.group_by([
-                'cpt', 'process_path'
-            ]).agg([
-                # Case / Unit counts
-                pl.col('transfer_request_id').count().alias("total_cases"),
-                pl.col('quantity').sum().alias("total_units"),
-            ]).sort('cpt', 'process_path')
-
-            cpt_process_summary = cpt_process_summary.with_columns([
-                # CPT-level hours remaining
-                pl.struct(['cpt']).map_elements(
-                    lambda x: _calculate_hours_remaining(
-                        cpt_str=x['cpt'],
-                        now=self.shift_info['now']
-                    )
-                ).alias('hours_remaining'),
+            cpt_process_summary = cube.rollup(['cpt', 'process_path']).select([
+                'cpt', 'process_path', 'total_cases', 'total_units'
+            ])
 
+            cpt_process_summary = cpt_process_summary.join(cpt_hours, on='cpt', how='left').with_columns([
                 # Calculate density
                 (pl.col('total_units') / pl.col('total_cases'))
                     .round(2)
@@ -1500,24 +1323,12 @@ class DataProcessor:
 
             # Third level grouping by Pick Area within Process Path within CPT
             logger.debug(f"Rodeo : Grouping by Pick Area within Process Path within CPT")
-            cpt_process_area_summary = df.group_by([
-                'cpt', 'process_path', 'pick_area'
-            ]).agg([
-                # Case / Unit counts
-                pl.col('transfer_request_id').count().alias("total_cases"),
-                pl.col('quantity').sum().alias("total_units"),
-            ]).sort('cpt', 'process_path', 'pick_area')
-
-
-            cpt_process_area_summary = cpt_process_area_summary.with_columns([
-                # CPT-level hours remaining
-                pl.struct(['cpt']).map_elements(
-                    lambda x: _calculate_hours_remaining(
-                        cpt_str=x['cpt'],
-                        now=self.shift_info['now']
-                    )
-                ).alias('hours_remaining'),
+            cpt_process_area_summary = cube.rollup(['cpt', 'process_path', 'pick_area']).select([
+                'cpt', 'process_path', 'pick_area', 'total_cases', 'total_units'
+            ])
+
 
+            cpt_process_area_summary = cpt_process_area_summary.join(cpt_hours, on='cpt', how='left').with_columns([
                 # Calculate density
                 (pl.col('total_units') / pl.col('total_cases'))
                     .round(2)
@@ -1537,11 +1348,13 @@ class DataProcessor:
                     "hov_picks_rem": hov_picks_rem,
                     "all_picks_rem": all_picks_rem
                 },
-                "rodeo_full": df,
+                "rodeo_full": df.drop(ROW_KEY, strict=False),
                 "cpt_summary": cpt_summary,
                 "cpt_process_summary": cpt_process_summary,
                 "cpt_process_area_summary": cpt_process_area_summary,
+                "cube": cube,
             }
+            self.rodeo_delta.store(df, cube)
 
             return rodeo
 
@@ -1736,57 +1549,6 @@ class DataProcessor:
             }
         return {}
 
-    def _calculate_alignment(self, cpt, process_path, time_spent, time_passed, time_remaining, work_remaining, current_rate):
-        """
-        Calculate the expected time needed to complete a task vs the time alotted
-
-        This method calculates the alignment based on the time spent, time passed, 
-        time remaining, work remaining, and the current rate of work.
-
-        Parameters:
-        - time_spent (float): The total time spent on the task so far.
-        - time_passed (float): The total time that has passed since the task started.
-        - time_remaining (float): The estimated time remaining to complete the task.
-        - work_remaining (float): The amount of work that still needs to be done.
-        - current_rate (float): The current rate of work being completed (e.g., units per time).
-
-        Returns:
-        - float: The calculated alignment, which indicates the expected time needed 
-                to complete the task based on the provided parameters.
-        """
-
-        try:
-            # Handle edge cases
-            if not time_spent or not time_passed:
-                return True  # No time spent yet
-            if not time_remaining:
-                return True  # Past deadline
-            if not work_remaining:
-                return False # No work remaining = No Miss
-
-            # Calculate average headcount with zero protection
-            avg_hc = float(time_spent / time_passed) if time_passed > 0 else 0.0
-            
-            if self.site_info['plan_data']:
-                cpt_data = self.site_info['plan_data']['cpt_breakdown'].get(cpt)
-                path_data = cpt_data.get(process_path) if cpt_data else None
-                work_remaining = path_data.get('cases_left', 0)
-                time_remaining = cpt_data.get('hours_to_pick', 0.0)
-
-
-            # Calculate alignment with zero protection for rate
-            effective_rate = (avg_hc * current_rate) if current_rate else 0.0
-            work_time_needed = work_remaining / effective_rate if effective_rate > 0 else 999.0
-            
-            # Return alignment rounded to 2 decimal places
-            alignment = round(float(time_remaining - work_time_needed), 2)
-
-            # Return boolean indicating if we'll miss the deadline
-            return work_time_needed > time_remaining
-
-        except Exception as e:
-            logger.error(f"Error calculating alignment: {str(e)}")
-            return True  # Default to showing warning on error
 
 
 """async def main():
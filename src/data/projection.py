@@ -0,0 +1,124 @@
+import os
+import sys
+import polars as pl
+from typing import Any, Dict, List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Hours needed when there is no pick rate to work with
+NO_RATE_HOURS = 999.0
+
+PLAN_SCHEMA = {
+    'cpt': pl.Utf8,
+    'process_path': pl.Utf8,
+    'plan_cases_left': pl.Float64,
+    'plan_hours_to_pick': pl.Float64,
+}
+
+
+def plan_table(plan_data: Optional[Dict[str, Any]]) -> Optional[pl.DataFrame]:
+    """
+    Flatten plan_data['cpt_breakdown'] into one row per CPT and process path
+    (cpt, process_path, plan_cases_left, plan_hours_to_pick).
+    None without a plan; a plan without a breakdown gives an empty table.
+    """
+    if not plan_data:
+        return None
+
+    rows = []
+    for cpt, cpt_data in (plan_data.get('cpt_breakdown') or {}).items():
+        if not isinstance(cpt_data, dict):
+            continue
+        hours_to_pick = cpt_data.get('hours_to_pick', 0.0)
+        for path, path_data in cpt_data.items():
+            # CPT-level entries (hours_to_pick, mandatory, ...) sit next to the paths
+            if isinstance(path_data, dict):
+                rows.append((cpt, path, path_data.get('cases_left', 0), hours_to_pick))
+
+    return pl.DataFrame(rows, schema=PLAN_SCHEMA, orient='row')
+
+
+def _falsy(name: str) -> pl.Expr:
+    """Null or zero, like `not value` on the old per-row inputs"""
+    return pl.col(name).is_null() | (pl.col(name) == 0)
+
+
+def project(frame: pl.LazyFrame, time_passed: float, plan: Optional[pl.DataFrame],
+            keys: List[str]) -> pl.LazyFrame:
+    """
+    Add projected_miss and slack_hours to a (cpt, process_path[, pick_area])
+    level of the combined data (a step of the lazy merge graph).
+
+    Time needed is the work left over (average headcount x current rate),
+    with average headcount = labor hours / hours passed in the shift; it is
+    compared with the hours left to the CPT. With a plan, work left and
+    time left come from the plan (path cases spread over the path's areas by
+    their share of its cases). The edge cases of the old per-row check are
+    kept: no labor or no deadline is a miss, no work is not, and with a
+    plan a CPT / path the plan does not know is a miss. slack_hours is time
+    left minus time needed, null where it is not meaningful.
+    """
+    work = pl.col('total_cases')
+    time_left = pl.col('hours_remaining')
+    known = pl.lit(True)
+    if plan is not None:
+        frame = frame.join(plan.lazy(), on=['cpt', 'process_path'], how='left')
+        work = pl.col('plan_cases_left')
+        if 'pick_area' in keys:
+            # Spread the path's planned cases over its areas
+            work = work * (pl.col('total_cases') / pl.col('total_cases').sum().over(['cpt', 'process_path']))
+        time_left = pl.col('plan_hours_to_pick')
+        known = work.is_not_null() & time_left.is_not_null()
+
+    avg_hc = pl.col('total_hours') / time_passed if time_passed > 0 else pl.lit(0.0)
+    rate = (
+        pl.when(~_falsy('avg_cph'))
+        .then(avg_hc * pl.col('avg_cph'))
+        .otherwise(0.0)
+    )
+    needed = pl.when(rate > 0).then(work / rate).otherwise(NO_RATE_HOURS)
+
+    no_labor = _falsy('total_hours') | pl.lit(not time_passed)
+    no_deadline = _falsy('hours_remaining')
+    no_work = _falsy('total_cases')
+
+    return (
+        frame
+        .with_columns([
+            pl.when(no_labor | no_deadline).then(True)
+                .when(no_work).then(False)
+                .when(~known).then(True)
+                .otherwise(needed > time_left)
+                .alias('projected_miss'),
+            pl.when(no_labor | no_deadline | ~known).then(None)
+                .when(no_work).then(time_left)
+                .when(rate > 0).then((time_left - needed).round(2))
+                .otherwise(None)
+                .cast(pl.Float64)
+                .alias('slack_hours')
+        ])
+        .drop([name for name in PLAN_SCHEMA if name not in keys], strict=False)
+    )
+
+
+def cpt_projection(process_level: pl.LazyFrame, cpt_summary: pl.DataFrame) -> pl.LazyFrame:
+    """
+    CPT level of the projection: paths are picked in parallel, so a CPT
+    misses when any of its paths does and its slack is the tightest path's.
+    """
+    rollup = (
+        process_level
+        .group_by('cpt')
+        .agg([
+            pl.col('projected_miss').any().alias('projected_miss'),
+            pl.col('slack_hours').min().alias('slack_hours')
+        ])
+    )
+    return cpt_summary.lazy().join(rollup, on='cpt', how='left')
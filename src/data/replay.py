@@ -0,0 +1,275 @@
+import io
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import asyncio
+import zipfile
+import argparse
+import tempfile
+import polars as pl
+from datetime import date
+from typing import Any, Dict, List, Optional
+from requests.structures import CaseInsensitiveDict
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import CAPTURE_DIR, STREAM_CHUNK_BYTES, STREAM_BATCH_ROWS
+from src.data.areq import AsyncRequestHandler
+from src.data.capture import decode_shift_info
+from src.data.lpi_history import LpiHistoryStore
+from src.data.processor import DataProcessor
+from src.data.table_stream import TableStreamParser, RODEO_SCHEMA, RODEO_COLUMNS
+from src.data.transport import TransportResponse
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class CaptureBundle:
+    """A capture bundle written by ResponseCapture, loaded into memory"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with zipfile.ZipFile(path) as bundle:
+            self.manifest = json.loads(bundle.read('manifest.json'))
+            self._files = {
+                file_name: bundle.read(file_name)
+                for file_name in bundle.namelist()
+                if file_name != 'manifest.json'
+            }
+
+    @classmethod
+    def latest(cls, capture_dir: str = CAPTURE_DIR) -> Optional[str]:
+        """Path of the newest bundle, None if there is none"""
+        if not os.path.isdir(capture_dir):
+            return None
+        bundles = [
+            os.path.join(capture_dir, file_name)
+            for file_name in os.listdir(capture_dir)
+            if file_name.endswith('.zip')
+        ]
+        return max(bundles, key=os.path.getmtime) if bundles else None
+
+    @property
+    def site_code(self) -> str:
+        return self.manifest['site_code']
+
+    @property
+    def fetches(self) -> List[Dict[str, Any]]:
+        return self.manifest['fetches']
+
+    @property
+    def sources(self) -> List[Dict[str, Any]]:
+        return self.manifest['sources']
+
+    @property
+    def duration(self) -> float:
+        return self.manifest.get('duration', 0.0)
+
+    def read(self, file_name: str) -> bytes:
+        return self._files[file_name]
+
+    def shift_info(self) -> Dict[str, Any]:
+        return decode_shift_info(self.manifest['shift_info'])
+
+    def site_info(self) -> Dict[str, Any]:
+        """Site info as SiteBuilder.get_site_info() returned it at capture time"""
+        pick_areas = self._files.get('site/pick_areas.parquet')
+        return {
+            'site_code': self.site_code,
+            'pick_areas': pl.read_parquet(io.BytesIO(pick_areas)) if pick_areas else pl.DataFrame(),
+            'plan_data': self.manifest.get('plan_data'),
+        }
+
+    def extract_history(self, target_dir: str) -> int:
+        """Write the captured LPI history days under target_dir (LpiHistoryStore layout)"""
+        count = 0
+        for file_name, data in self._files.items():
+            if not file_name.startswith('lpi_history/'):
+                continue
+            path = os.path.join(target_dir, *file_name.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+            count += 1
+        return count
+
+
+class ReplayRequestHandler:
+    """
+    Drop-in for AsyncRequestHandler that plays a capture bundle back.
+
+    Sources are yielded in their recorded order at their recorded offsets divided
+    by `speed` (0 = no waiting). Bodies go through the same content handling as a
+    live response, so DataProcessor gets what it got at capture time, without any
+    network, cookies or Midway.
+    """
+
+    def __init__(self, bundle: CaptureBundle, speed: float = 1.0):
+        self.bundle = bundle
+        self.speed = speed
+        self.shift_info = bundle.shift_info()
+        self.limiter = None
+        self.capture = None
+        self.telemetry = None
+
+
+
+    def _fetch_content(self, fetch: Dict[str, Any]) -> Any:
+        """Rebuild the usable body of one recorded fetch"""
+        data = self.bundle.read(fetch['file'])
+        kind = fetch['kind']
+        if kind == 'frame':
+            return pl.read_parquet(io.BytesIO(data))
+        if kind == 'json':
+            return json.loads(data)
+        if kind == 'text':
+            return data.decode('utf-8')
+
+        response = TransportResponse(
+            url=fetch['url'],
+            status_code=fetch['status_code'],
+            headers=CaseInsensitiveDict(fetch['headers']),
+            content=data,
+            encoding=fetch.get('encoding'),
+        )
+        parser = None
+        if fetch.get('streamed') and fetch['status_code'] == 200:
+            parser = TableStreamParser(schema=RODEO_SCHEMA, batch_rows=STREAM_BATCH_ROWS, columns=RODEO_COLUMNS)
+            for offset in range(0, len(data), STREAM_CHUNK_BYTES):
+                parser.feed(data[offset:offset + STREAM_CHUNK_BYTES])
+        return AsyncRequestHandler._response_content(response, parser)
+
+    def _last_fetch(self, name: str) -> Optional[Dict[str, Any]]:
+        """The attempt whose result was handed on (the last one for a name)"""
+        matches = [fetch for fetch in self.bundle.fetches if fetch['name'] == name]
+        return matches[-1] if matches else None
+
+    def _response_for(self, source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if source['status_code'] is None:
+            return None
+
+        history = source.get('history')
+        if history:
+            pages = {}
+            for day in history['days']:
+                fetch = self._last_fetch(f"LPI(Hist) {day}")
+                if fetch is not None and fetch['status_code'] == 200:
+                    pages[date.fromisoformat(day)] = self._fetch_content(fetch)
+            return {
+                'status_code': source['status_code'],
+                'content': {
+                    'site_code': history['site_code'],
+                    'days': [date.fromisoformat(day) for day in history['days']],
+                    'pages': pages,
+                }
+            }
+
+        fetch = self._last_fetch(source['name'])
+        if fetch is None:
+            shards = self._shard_names(source['name'])
+            if shards:
+                # Sharded Rodeo fetch, merged the same way as live
+                frames = [self._fetch_content(self._last_fetch(shard)) for shard in shards]
+                return {
+                    'status_code': source['status_code'],
+                    'content': AsyncRequestHandler.merge_rodeo_shards(frames)
+                }
+
+        return {
+            'status_code': source['status_code'],
+            'content': self._fetch_content(fetch) if fetch is not None else None
+        }
+
+    def _shard_names(self, name: str) -> List[str]:
+        """Fetch names of a sharded source ("Rodeo 1/4", ...) in shard order"""
+        pattern = re.compile(rf"^{re.escape(name)} (\d+)/\d+$")
+        shards = {}
+        for fetch in self.bundle.fetches:
+            match = pattern.match(fetch['name'])
+            if match:
+                shards[int(match.group(1))] = fetch['name']
+        return [shards[index] for index in sorted(shards)]
+
+    async def stream_requests(self, sources: Optional[List[str]] = None):
+        """Yield the recorded sources (only `sources` when given)"""
+        start = time.monotonic()
+        for source in self.bundle.sources:
+            name = source['name']
+            if sources is not None and name not in sources:
+                continue
+
+            if self.speed > 0:
+                wait = source['offset'] / self.speed - (time.monotonic() - start)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            try:
+                response = await asyncio.to_thread(self._response_for, source)
+            except Exception as e:
+                logger.error(f"Replay failed for {name}: {str(e)}")
+                response = None
+            yield name, response
+
+
+async def replay_bundle(path: str, speed: float = 1.0) -> Dict[str, Any]:
+    """
+    Run a capture bundle through a fresh DataProcessor.
+
+    LPI history is read from a temporary store filled from the bundle, so the
+    replay neither needs nor changes the local history store.
+    """
+    bundle = CaptureBundle(path)
+    handler = ReplayRequestHandler(bundle, speed)
+
+    history_dir = tempfile.mkdtemp(prefix='pickassist_replay_')
+    previous_store = LpiHistoryStore._instance
+    try:
+        bundle.extract_history(os.path.join(history_dir, 'lpi_history'))
+        LpiHistoryStore._instance = LpiHistoryStore(history_dir)
+
+        processor = DataProcessor(
+            shift_info=handler.shift_info,
+            site_info=bundle.site_info(),
+            request_handler=handler
+        )
+        start = time.perf_counter()
+        await processor.process_incoming_data()
+        elapsed = time.perf_counter() - start
+
+        logger.info(f"Replayed {bundle.path} ({len(bundle.sources)} sources) in {elapsed:.2f}s "
+                    f"(captured refresh took {bundle.duration:.2f}s)")
+        print(f"Replay finished in {elapsed:.2f}s, captured refresh took {bundle.duration:.2f}s")
+        return processor.get_results()
+
+    finally:
+        LpiHistoryStore._instance = previous_store
+        shutil.rmtree(history_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a captured refresh through DataProcessor offline")
+    parser.add_argument('bundle', nargs='?', help="Capture bundle (default: newest in CAPTURE_DIR)")
+    parser.add_argument('--speed', type=float, default=1.0, help="Timing multiplier, 0 replays without waiting")
+    args = parser.parse_args()
+
+    path = args.bundle or CaptureBundle.latest()
+    if path is None:
+        print(f"No capture bundles in {CAPTURE_DIR}")
+        return
+
+    results = asyncio.run(replay_bundle(path, args.speed))
+    for name, result in results.items():
+        if not isinstance(result, dict):
+            continue
+        frames = {key: value.shape for key, value in result.items() if isinstance(value, pl.DataFrame)}
+        print(f"{name}: {frames}")
+
+
+if __name__ == "__main__":
+    main()
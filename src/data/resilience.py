@@ -0,0 +1,148 @@
+import os
+import sys
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from requests.exceptions import RequestException
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class DeadlineExceededError(RequestException):
+    """A request did not finish inside the refresh latency budget"""
+
+
+class RefreshDeadline:
+    """
+    Latency budget of one refresh, shared by every request in it.
+
+    Attempts are cut off when the budget runs out and a retry is only
+    scheduled when its backoff still fits, so one slow endpoint cannot
+    hold the refresh past `seconds`. 0 or None means no budget.
+    """
+
+    def __init__(self, seconds: Optional[float]):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, None without a budget"""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def allows(self, delay: float) -> bool:
+        """True when waiting `delay` seconds still leaves time for a request"""
+        remaining = self.remaining()
+        return remaining is None or remaining > delay
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker shared by every request handler.
+
+    After `threshold` consecutive failures (no response, 5xx or 429) a host
+    is open: requests to it fail at once instead of piling onto a struggling
+    upstream. After `cooldown` seconds one probe request is let through
+    (half-open); its success closes the host again, a failure re-opens it.
+    Every request let through is settled with record() or release().
+    """
+    _instance = None
+
+    def __init__(self, threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._hosts: Dict[str, Dict] = {}
+
+    @classmethod
+    def get_instance(cls) -> 'CircuitBreaker':
+        """Get singleton instance of CircuitBreaker"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Forget every host's state"""
+        cls._instance = None
+
+
+
+    @staticmethod
+    def is_failure(status_code: Optional[int]) -> bool:
+        """Responses that count against the host (auth errors do not)"""
+        return status_code is None or status_code >= 500 or status_code == 429
+
+    def _host(self, url: str) -> Dict:
+        host = urlsplit(url).hostname
+        return self._hosts.setdefault(host, {'failures': 0, 'opened_at': None, 'probing': False})
+
+    def allow(self, url: str) -> bool:
+        """True when a request to the URL's host may be sent"""
+        host = self._host(url)
+        if host['opened_at'] is None:
+            return True
+        if time.monotonic() - host['opened_at'] >= self.cooldown and not host['probing']:
+            host['probing'] = True
+            logger.info(f"Circuit half-open for {urlsplit(url).hostname}, sending a probe request")
+            return True
+        return False
+
+    def record(self, url: str, status_code: Optional[int]):
+        """Count one finished request (status None = no response)"""
+        if self.is_failure(status_code):
+            self.record_failure(url)
+        else:
+            self.record_success(url)
+
+    def record_success(self, url: str):
+        host = self._host(url)
+        if host['opened_at'] is not None:
+            logger.info(f"Circuit closed for {urlsplit(url).hostname}")
+        host.update(failures=0, opened_at=None, probing=False)
+
+    def record_failure(self, url: str):
+        host = self._host(url)
+        host['failures'] += 1
+        host['probing'] = False
+        if host['failures'] >= self.threshold:
+            if host['opened_at'] is None:
+                logger.warning(f"Circuit open for {urlsplit(url).hostname} after {host['failures']} failures, "
+                               f"pausing requests for {self.cooldown}s")
+            # A failed probe starts a new cooldown
+            host['opened_at'] = time.monotonic()
+
+    def release(self, url: str):
+        """
+        Settle a request that ended without an answer (refresh deadline,
+        cancelled). Not a failure of the host, but a probe gives up its slot:
+        the host stays open and the next probe goes out after a new cooldown.
+        """
+        host = self._host(url)
+        if host['probing']:
+            logger.info(f"Probe to {urlsplit(url).hostname} got no answer, circuit stays open")
+            host.update(opened_at=time.monotonic(), probing=False)
+
+    def status(self) -> Dict[str, str]:
+        """State per host: closed, open or half-open"""
+        states = {}
+        for host, state in self._hosts.items():
+            if state['opened_at'] is None:
+                states[host] = 'closed'
+            elif state['probing']:
+                states[host] = 'half-open'
+            else:
+                states[host] = 'open'
+        return states
@@ -0,0 +1,220 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import polars as pl
+from typing import Any, Callable, Dict, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import CACHE_DIR, CACHE_TTL_SECONDS
+from src.data.telemetry import RefreshTelemetry
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+def _write_atomic(path: str, write: Callable[[str], None]):
+    """Write through a temp file next to `path` and swap it in, so readers never see half a file"""
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(temp)
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def _ttl(name: str) -> int:
+    """TTL of the source a request belongs to ("LPI(Hist) 2026-10-10" -> LPI(Hist))"""
+    return CACHE_TTL_SECONDS.get(RefreshTelemetry.source_of(name), 0)
+
+
+class CachedResponse:
+    """A stored upstream body plus the validators it was served with"""
+
+    def __init__(self, meta: Dict[str, Any], paths: Dict[str, str]):
+        self.meta = meta
+        self._paths = paths
+        self._content = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.meta.get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.meta.get('last_modified')
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.meta.get('stored_at', 0)
+
+    @property
+    def size(self) -> int:
+        return self.meta.get('size', 0)
+
+    @property
+    def content(self) -> Any:
+        """Body read from disk on first use (only needed on a hit)"""
+        if self._content is None:
+            kind = self.meta.get('kind')
+            if kind == 'frame':
+                self._content = pl.read_parquet(self._paths['frame'])
+            elif kind == 'json':
+                with open(self._paths['json'], 'r', encoding='utf-8') as f:
+                    self._content = json.load(f)
+            else:
+                with open(self._paths['text'], 'r', encoding='utf-8') as f:
+                    self._content = f.read()
+        return self._content
+
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache for the upstream sources.
+
+    Each URL keeps its body (text, JSON, or a parsed table as parquet) next to a
+    small meta file with the ETag / Last-Modified validators. Requests send
+    If-None-Match / If-Modified-Since and a 304 is answered from disk. Sources
+    that send no validators can be served straight from disk for their TTL
+    (CACHE_TTL_SECONDS). Hit/miss counts and saved bytes are kept per refresh.
+    """
+    _instance = None
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = os.path.join(cache_dir, 'responses')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.reset_stats()
+
+    @classmethod
+    def get_instance(cls) -> 'ResponseCache':
+        """Get singleton instance of ResponseCache"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def reset_stats(self):
+        """Start a new refresh worth of hit/miss counts"""
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'not_modified': 0,
+            'ttl_hits': 0,
+            'bytes_saved': 0,
+            'bytes_downloaded': 0,
+        }
+
+
+
+    def _paths(self, url: str) -> Dict[str, str]:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return {
+            'meta': f"{base}.meta.json",
+            'text': f"{base}.txt",
+            'json': f"{base}.json",
+            'frame': f"{base}.parquet",
+        }
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Load the stored response for a URL, if any"""
+        paths = self._paths(url)
+        if not os.path.exists(paths['meta']):
+            return None
+
+        try:
+            with open(paths['meta'], 'r') as f:
+                meta = json.load(f)
+            return CachedResponse(meta, paths)
+
+        except Exception as e:
+            logger.warning(f"Unreadable cache entry for {url}: {str(e)}")
+            return None
+
+    def fresh(self, name: str, cached: Optional[CachedResponse]) -> bool:
+        """True if a validator-less entry is still inside its source TTL"""
+        if cached is None or cached.etag or cached.last_modified:
+            return False
+        ttl = _ttl(name)
+        return ttl > 0 and cached.age < ttl
+
+    @staticmethod
+    def conditional_headers(cached: Optional[CachedResponse], headers: Optional[Dict] = None) -> Optional[Dict]:
+        """Add If-None-Match / If-Modified-Since from a cached entry"""
+        if cached is None or not (cached.etag or cached.last_modified):
+            return headers
+
+        conditional = dict(headers or {})
+        if cached.etag:
+            conditional['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            conditional['If-Modified-Since'] = cached.last_modified
+        return conditional
+
+    def store(self, name: str, url: str, response_headers, content: Any, size: int):
+        """Write a 200 body and its validators to disk"""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not (etag or last_modified) and _ttl(name) <= 0:
+            # Nothing to revalidate with and no TTL, not worth the disk write
+            return
+
+        paths = self._paths(url)
+        try:
+            if isinstance(content, pl.DataFrame):
+                kind = 'frame'
+                _write_atomic(paths['frame'], content.write_parquet)
+            elif isinstance(content, (dict, list)):
+                kind = 'json'
+                def write(path: str):
+                    with open(path, 'w', encoding='utf-8') as f:
+                        json.dump(content, f)
+                _write_atomic(paths['json'], write)
+            else:
+                kind = 'text'
+                def write(path: str):
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                _write_atomic(paths['text'], write)
+
+            meta = {
+                'source': name,
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'kind': kind,
+                'size': size,
+                'stored_at': time.time(),
+            }
+            # Meta last, so it never points at a body that is not there yet
+            def write_meta(path: str):
+                with open(path, 'w') as f:
+                    json.dump(meta, f)
+            _write_atomic(paths['meta'], write_meta)
+
+        except Exception as e:
+            logger.warning(f"Could not cache {name} response: {str(e)}")
+
+    def record_hit(self, name: str, cached: CachedResponse, revalidated: bool):
+        self.stats['hits'] += 1
+        self.stats['bytes_saved'] += cached.size
+        if revalidated:
+            self.stats['not_modified'] += 1
+        else:
+            self.stats['ttl_hits'] += 1
+        logger.info(f"{name} : Served from cache ({'304' if revalidated else 'TTL'}, {cached.size} bytes saved)")
+
+    def record_miss(self, name: str, size: int):
+        self.stats['misses'] += 1
+        self.stats['bytes_downloaded'] += size
+
+    def summary(self) -> str:
+        return (f"Response cache: {self.stats['hits']} hits "
+                f"({self.stats['not_modified']} revalidated, {self.stats['ttl_hits']} TTL) / "
+                f"{self.stats['misses']} misses, "
+                f"{self.stats['bytes_saved']} bytes saved, "
+                f"{self.stats['bytes_downloaded']} bytes downloaded")
@@ -0,0 +1,99 @@
+import os
+import sys
+import polars as pl
+from typing import Dict, Optional, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import RODEO_DELTA_MAX_SHARE
+from src.data.rollup import RollupCube
+from src.data.table_stream import RODEO_COLUMNS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Changes on every refresh without changing anything derived from the row
+REFRESHED_COLUMNS = ['Dwell Time (hours)']
+# 64-bit hash of the transfer request ID and every other column the
+# enrichment and the cube read, one integer key is far cheaper to match
+ROW_KEY = '__rodeo_row'
+
+
+class RodeoDelta:
+    """
+    The last enriched Rodeo snapshot, so a refresh only enriches the rows
+    it has not seen.
+
+    A row is the same when its transfer request ID and the columns it is
+    derived from are (ROW_KEY); such rows keep their aisle, slot, pick area and CPT
+    and only take the new dwell time. A row with a known ID that changed
+    (moved to a cart, new quantity) counts as removed and added. Added rows
+    are enriched, and the cube is updated with the added and removed rows.
+    The snapshot is rebuilt in full when the enrichment would differ (site,
+    shift, timezone or pick areas changed), rows repeat or most rows
+    changed.
+    """
+
+    def __init__(self, renames: Dict[str, str]):
+        self.renames = renames
+        self.frame: Optional[pl.DataFrame] = None
+        self.cube: Optional[RollupCube] = None
+        self.config: Optional[Tuple] = None
+        self._pending: Optional[Tuple] = None
+
+    def reset(self):
+        """Forget the snapshot, the next refresh is a full rebuild"""
+        self.frame, self.cube, self.config = None, None, None
+
+    def split(self, raw: pl.DataFrame, config: Tuple) -> Tuple[pl.DataFrame, Optional[Dict[str, pl.DataFrame]]]:
+        """
+        Tag the raw rows with ROW_KEY and split them against the snapshot.
+
+        Returns (rows to enrich, delta). delta is None for a full rebuild,
+        otherwise 'kept' (enriched rows carried over in snapshot order, with
+        the new dwell time) and 'removed' (enriched rows no longer listed).
+        """
+        raw = raw.with_columns([
+            pl.struct([name for name in RODEO_COLUMNS if name not in REFRESHED_COLUMNS]).hash().alias(ROW_KEY)
+        ])
+        self._pending = None
+        if raw.get_column(ROW_KEY).n_unique() < raw.height:
+            # Repeated rows cannot be matched one for one
+            logger.warning(f"Rodeo : Repeated rows, full rebuild")
+            self.reset()
+            return raw, None
+
+        self._pending = config
+        if self.frame is None or self.config != config:
+            if self.frame is not None:
+                logger.info(f"Rodeo : Site, shift or pick areas changed, full rebuild")
+            return raw, None
+
+        added = raw.join(self.frame.select(ROW_KEY), on=ROW_KEY, how='anti')
+        if added.height > raw.height * RODEO_DELTA_MAX_SHARE:
+            logger.info(f"Rodeo : {added.height} of {raw.height} rows changed, full rebuild")
+            return raw, None
+
+        refreshed = [self.renames[name] for name in REFRESHED_COLUMNS]
+        listed = raw.select(
+            [ROW_KEY]
+            + [pl.col(name).alias(self.renames[name]) for name in REFRESHED_COLUMNS]
+            + [pl.lit(True).alias('__listed')]
+        )
+        # A left join keeps the snapshot's order (sorted by CPT)
+        matched = self.frame.drop(refreshed).join(listed, on=ROW_KEY, how='left')
+        is_listed = matched.get_column('__listed').is_not_null()
+        kept = matched.filter(is_listed).select(self.frame.columns)
+        removed = self.frame.filter(~is_listed)
+        logger.info(f"Rodeo : {kept.height} rows kept, {added.height} added, {removed.height} removed")
+        return added, {'kept': kept, 'removed': removed}
+
+    def store(self, frame: pl.DataFrame, cube: RollupCube):
+        """Keep a processed snapshot (and its cube) for the next refresh"""
+        if self._pending is None:
+            return
+        self.frame, self.cube, self.config = frame, cube, self._pending
+        self._pending = None
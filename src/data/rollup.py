@@ -0,0 +1,159 @@
+import os
+import sys
+import polars as pl
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Rows behind each base group, so a group emptied by removed rows can be dropped
+ROWS = '__rows'
+
+# How a measure combines when rolling finer groups up into coarser ones
+ROLLUPS = {
+    'sum': lambda name: pl.col(name).sum(),
+    'min': lambda name: pl.col(name).min(),
+    'max': lambda name: pl.col(name).max(),
+}
+
+
+class RollupCube:
+    """
+    One snapshot of a frame, aggregated once at its finest grain.
+
+    `measures` maps a name to (expression over the raw rows, rollup), where
+    the rollup ('sum', 'min' or 'max') is how finer groups combine. Any
+    coarser level is rolled up from the base aggregate, which is far
+    smaller than the raw rows, and kept, so asking for the same dimensions
+    again is free. Dimensions missing from the frame are left out. The next
+    snapshot's cube can be derived from the rows that changed (update()).
+    """
+
+    def __init__(self, df: pl.DataFrame, dimensions: Sequence[str], measures: Dict[str, Tuple[pl.Expr, str]]):
+        self.dimensions = [name for name in dimensions if name in df.columns]
+        self.measures = measures
+        self.base = self._aggregate(df)
+        self._levels: Dict[Tuple[str, ...], pl.DataFrame] = {}
+
+    def _ties(self, name: str) -> str:
+        """Hidden base column counting the rows that hold a min / max measure's value"""
+        return f'__{name}_ties'
+
+    def _aggregate(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Measures (and row count, min / max ties) of raw rows at the cube's grain"""
+        ties = [
+            # A min / max measure is over one column
+            (pl.col(expr.meta.root_names()[0]) == expr).sum().alias(self._ties(name))
+            for name, (expr, rollup) in self.measures.items() if rollup != 'sum'
+        ]
+        return (
+            df.lazy()
+            .group_by(self.dimensions)
+            .agg([expr.alias(name) for name, (expr, _) in self.measures.items()] + [pl.len().alias(ROWS)] + ties)
+            .collect()
+        )
+
+    def _aggregations(self):
+        return [
+            ROLLUPS[rollup](name).cast(self.base.schema[name]).alias(name)
+            for name, (_, rollup) in self.measures.items()
+        ]
+
+    def rollup(self, dimensions: Sequence[str] = ()) -> pl.DataFrame:
+        """Measures grouped by `dimensions` (sorted by them), one row of totals for none"""
+        key = tuple(dimensions)
+        if key not in self._levels:
+            unknown = [name for name in key if name not in self.dimensions]
+            if unknown:
+                raise ValueError(f"Not a cube dimension: {unknown} (have {self.dimensions})")
+
+            if key and set(key) == set(self.dimensions):
+                # Already the grain of the base
+                level = self.base.select([*key, *self.measures]).sort(list(key))
+            elif key:
+                level = self.base.group_by(list(key)).agg(self._aggregations()).sort(list(key))
+            else:
+                level = self.base.select(self._aggregations())
+            self._levels[key] = level
+        return self._levels[key]
+
+    def update(self, df: pl.DataFrame, added: pl.DataFrame, removed: pl.DataFrame) -> 'RollupCube':
+        """
+        Cube of the next snapshot `df`, which is this cube's snapshot minus the
+        `removed` rows plus the `added` ones, without aggregating `df` again.
+
+        Sums take the deltas. A min / max keeps the number of rows holding it,
+        so removing rows only changes it when all of those go; such groups
+        are aggregated from `df` again. Groups left without rows are dropped.
+        """
+        keys = self.dimensions
+        sums = [name for name, (_, rollup) in self.measures.items() if rollup == 'sum'] + [ROWS]
+        extremes = [name for name, (_, rollup) in self.measures.items() if rollup != 'sum']
+
+        def signed(name: str, suffix: str = '') -> pl.Expr:
+            # Unsigned counts cannot go negative on the way
+            column = pl.col(name + suffix).fill_null(0)
+            return column.cast(pl.Int64) if self.base.schema[name].is_integer() else column
+
+        merged = (
+            self.base.lazy()
+            .join(self._aggregate(removed).lazy(), on=keys, how='left', join_nulls=True, suffix='__removed')
+            .join(self._aggregate(added).lazy(), on=keys, how='full', coalesce=True, join_nulls=True, suffix='__added')
+            .with_columns([
+                (signed(name) + signed(name, '__added') - signed(name, '__removed')).alias(name)
+                for name in sums
+            ])
+        )
+
+        columns, stale = [], []
+        for name in extremes:
+            better = (lambda a, b: a < b) if self.measures[name][1] == 'min' else (lambda a, b: a > b)
+            value, ties = pl.col(name), pl.col(self._ties(name))
+            added_value, added_ties = pl.col(f'{name}__added'), pl.col(f'{self._ties(name)}__added')
+            # Without the removed rows that held it
+            kept_ties = ties.fill_null(0) - pl.when(pl.col(f'{name}__removed') == value).then(
+                pl.col(f'{self._ties(name)}__removed')).otherwise(0)
+            kept_value = pl.when(kept_ties > 0).then(value)
+            columns += [
+                pl.when(added_value.is_null() | (kept_value.is_not_null() & better(kept_value, added_value)))
+                    .then(kept_value).otherwise(added_value).alias(name),
+                pl.when(added_value.is_null()).then(kept_ties)
+                    .when(kept_value.is_null() | better(added_value, kept_value)).then(added_ties)
+                    .when(better(kept_value, added_value)).then(kept_ties)
+                    .otherwise(kept_ties + added_ties).alias(self._ties(name))
+            ]
+            stale.append(value.is_not_null() & (kept_ties <= 0))
+
+        base = (
+            merged
+            .with_columns(columns + [pl.any_horizontal(stale or [pl.lit(False)]).alias('__stale')])
+            .filter(pl.col(ROWS) > 0)
+            .select(list(self.base.schema) + ['__stale'])
+            .collect()
+        )
+        if base['__stale'].any():
+            # Every row holding a group's min / max went, aggregate those groups again
+            stale_keys = base.filter(pl.col('__stale')).select(keys)
+            fresh = self._aggregate(df.join(stale_keys, on=keys, how='semi', join_nulls=True))
+            base = pl.concat([base.filter(~pl.col('__stale')), fresh.with_columns(pl.lit(True).alias('__stale'))],
+                             how='vertical_relaxed')
+        base = base.drop('__stale')
+
+        cube = RollupCube.__new__(RollupCube)
+        cube.dimensions = self.dimensions
+        cube.measures = self.measures
+        cube.base = base.select([pl.col(name).cast(dtype) for name, dtype in self.base.schema.items()])
+        cube._levels = {}
+        return cube
+
+    def total(self, measure: str, where: Optional[pl.Expr] = None) -> Any:
+        """One measure over the whole snapshot, or over the base groups matching `where`"""
+        base = self.base if where is None else self.base.filter(where)
+        _, rollup = self.measures[measure]
+        return base.select(ROLLUPS[rollup](measure).cast(self.base.schema[measure])).item()
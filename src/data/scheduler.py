@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import SOURCE_REFRESH_CADENCE, MIN_REFRESH_SECONDS
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+class SourceScheduler:
+    """
+    Tracks when each upstream source was last fetched and which ones are due.
+
+    Sources are claimed when a refresh is dispatched (so an overlapping timer
+    does not fetch them twice) and released again if the fetch fails, which
+    makes them due on the next tick. The refresh interval set in the UI is a
+    floor: faster sources are fetched at that interval, slower ones (LPI(Hist))
+    keep their own SOURCE_REFRESH_CADENCE.
+    """
+
+    def __init__(self, cadence: Optional[Dict[str, int]] = None):
+        self.cadence = dict(cadence or SOURCE_REFRESH_CADENCE)
+        self._last_fetch: Dict[str, float] = {}
+
+
+
+    def _interval(self, name: str, min_interval: Optional[float] = None) -> float:
+        interval = self.cadence.get(name, 0)
+        if min_interval is not None:
+            interval = max(interval, min_interval)
+        return interval
+
+    def due_sources(self, min_interval: Optional[float] = None, now: Optional[float] = None) -> List[str]:
+        """Sources never fetched or past their cadence"""
+        now = now or time.time()
+        return [
+            name for name in self.cadence
+            if name not in self._last_fetch
+            or now - self._last_fetch[name] >= self._interval(name, min_interval)
+        ]
+
+    def claim(self, names: List[str], now: Optional[float] = None):
+        """Mark sources as fetched at dispatch time"""
+        now = now or time.time()
+        for name in names:
+            self._last_fetch[name] = now
+        logger.info(f"Scheduled sources: {', '.join(names) if names else 'none'}")
+
+    def claim_due(self, min_interval: Optional[float] = None) -> List[str]:
+        """Claim and return every due source"""
+        due = self.due_sources(min_interval)
+        self.claim(due)
+        return due
+
+    def release(self, names: List[str]):
+        """Forget the fetch time of failed sources so they are due again"""
+        for name in names:
+            self._last_fetch.pop(name, None)
+
+    def seconds_until_due(self, min_interval: Optional[float] = None, now: Optional[float] = None) -> float:
+        """Time until the next source becomes due (never below MIN_REFRESH_SECONDS)"""
+        now = now or time.time()
+        waits = [
+            self._last_fetch[name] + self._interval(name, min_interval) - now
+            if name in self._last_fetch else 0
+            for name in self.cadence
+        ]
+        return max(min(waits, default=0), MIN_REFRESH_SECONDS)
+
+    def reset(self):
+        """Make every source due (new shift or site)"""
+        self._last_fetch = {}
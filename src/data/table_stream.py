@@ -0,0 +1,251 @@
+import io
+import os
+import csv
+import sys
+import polars as pl
+from lxml import etree
+from typing import Dict, List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Rodeo ItemList columns that are not plain strings
+RODEO_SCHEMA = {
+    'Quantity': pl.Int64,
+    'Dwell Time (hours)': pl.Float64,
+}
+# Rodeo ItemList columns the pipeline reads (delimited bodies load only these)
+RODEO_COLUMNS = [
+    'Transfer Request ID', 'Destination Warehouse', 'Need To Ship By Date', 'Process Path',
+    'Scannable ID', 'Outer Scannable ID', 'Outer Outer Scannable ID', 'Quantity', 'Dwell Time (hours)',
+]
+
+UTF8_BOM = b'\xef\xbb\xbf'
+SNIFF_BYTES = 64 * 1024  # Most of the body read before deciding HTML vs delimited text
+
+
+def sniff_delimiter(head: bytes) -> Optional[str]:
+    """',' or '\\t' when a body starts like a delimited table, None for HTML (or anything else)"""
+    text = head[len(UTF8_BOM):] if head.startswith(UTF8_BOM) else head
+    text = text.lstrip()
+    if not text or text.startswith(b'<'):
+        return None
+    header = text.split(b'\n', 1)[0]
+    tabs, commas = header.count(b'\t'), header.count(b',')
+    if not tabs and not commas:
+        return None
+    return '\t' if tabs >= commas else ','
+
+
+def read_delimited(body: bytes, separator: str, schema: Optional[Dict[str, pl.DataType]] = None,
+                   columns: Optional[List[str]] = None) -> pl.DataFrame:
+    """
+    Read a CSV/TSV body straight into Polars.
+    Every column is read as a string and `schema` columns are cast like the
+    HTML parser does (bad values become null). With `columns`, only those
+    that are in the header are read.
+    """
+    schema = schema or {}
+    if body.startswith(UTF8_BOM):
+        body = body[len(UTF8_BOM):]
+
+    first_line = body.lstrip().split(b'\n', 1)[0].decode('utf-8', errors='replace').rstrip('\r')
+    header = next(csv.reader([first_line], delimiter=separator), [])
+    selected = [name for name in columns if name in header] if columns else header
+    if columns and len(selected) < len(columns):
+        logger.warning(f"Delimited table is missing columns: {[name for name in columns if name not in header]}")
+    if not selected:
+        return pl.DataFrame()
+
+    df = pl.read_csv(
+        io.BytesIO(body),
+        separator=separator,
+        columns=selected,
+        schema_overrides={name: pl.Utf8 for name in selected},
+        infer_schema_length=0,
+        truncate_ragged_lines=True,
+        encoding='utf8-lossy',
+    )
+    return df.with_columns([
+        pl.col(name).cast(dtype, strict=False)
+        for name, dtype in schema.items()
+        if name in df.columns
+    ])
+
+
+class TableStreamParser:
+    """
+    Incremental parser for the first <table> of an HTML response.
+
+    Feed it body chunks as they arrive; each finished <tr> is pulled out of the
+    tree and cleared, so memory stays bounded by the row buffer instead of the
+    whole document. Every `batch_rows` rows the buffer is turned into a Polars
+    batch, and close() returns all batches as one DataFrame.
+
+    A body that starts like CSV/TSV instead is buffered as is and read with
+    read_delimited() on close(), only the `columns` it is given.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, pl.DataType]] = None, batch_rows: int = 10000, keep_raw: bool = False,
+                 columns: Optional[List[str]] = None):
+        self.schema = schema or {}
+        self.batch_rows = batch_rows
+        self.columns = columns
+        # None until the first line is in, then ',' / '\t' for delimited bodies
+        self.separator: Optional[str] = None
+        self._mode: Optional[str] = None
+        self._head: List[bytes] = []
+        self._delimited: List[bytes] = []
+        # Raw body chunks, only kept when the response is being captured
+        self.raw_chunks: Optional[List[bytes]] = [] if keep_raw else None
+
+        self._parser = etree.HTMLPullParser(events=('start', 'end'), tag=('table', 'tr'))
+        self._table_depth = 0
+        self._tables_seen = 0
+        self._header: Optional[List[str]] = None
+        self._rows: List[List[Optional[str]]] = []
+        self._batches: List[pl.DataFrame] = []
+
+        self.bytes_read = 0
+        self.rows_read = 0
+
+    def feed(self, chunk: bytes):
+        """Parse the next chunk of the response body"""
+        if not chunk:
+            return
+        self.bytes_read += len(chunk)
+        if self.raw_chunks is not None:
+            self.raw_chunks.append(chunk)
+
+        if self._mode is None:
+            # Hold the start of the body until it shows which format it is
+            self._head.append(chunk)
+            head = b''.join(self._head)
+            text = head.lstrip(UTF8_BOM).lstrip()
+            if not text.startswith(b'<') and b'\n' not in text and len(head) < SNIFF_BYTES:
+                return
+            self._start(head)
+            return
+        self._consume(chunk)
+
+    def _start(self, head: bytes):
+        self._head = []
+        self.separator = sniff_delimiter(head)
+        self._mode = 'html' if self.separator is None else 'delimited'
+        self._consume(head)
+
+    def _consume(self, chunk: bytes):
+        if self._mode == 'delimited':
+            self._delimited.append(chunk)
+        else:
+            self._parser.feed(chunk)
+            self._drain()
+
+    def close(self) -> pl.DataFrame:
+        """Finish parsing and return every row as one DataFrame"""
+        if self._mode is None and self._head:
+            self._start(b''.join(self._head))
+
+        if self._mode == 'delimited':
+            df = read_delimited(b''.join(self._delimited), self.separator, self.schema, self.columns)
+            self._delimited = []
+            self.rows_read = df.height
+            logger.info(f"Read {self.rows_read} delimited rows from {self.bytes_read} bytes")
+            return df
+
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError:
+            # Truncated markup, keep whatever rows were complete
+            pass
+        self._drain()
+        self._flush()
+
+        if not self._batches:
+            return pl.DataFrame(schema={name: pl.Utf8 for name in (self._header or [])})
+
+        df = pl.concat(self._batches, how='vertical')
+        self._batches = []
+        logger.info(f"Parsed {self.rows_read} table rows from {self.bytes_read} bytes")
+        return df
+
+    def raw_body(self) -> bytes:
+        """Everything fed so far (empty unless built with keep_raw)"""
+        return b''.join(self.raw_chunks or [])
+
+    def _drain(self):
+        for event, element in self._parser.read_events():
+            if element.tag == 'table':
+                if event == 'start':
+                    self._table_depth += 1
+                else:
+                    self._table_depth -= 1
+                    self._tables_seen += 1
+                continue
+
+            # Only the first top-level table is read (same as read_html(...)[0])
+            if event != 'end' or self._tables_seen > 0 or self._table_depth != 1:
+                continue
+
+            cells = [child for child in element if child.tag in ('td', 'th')]
+            values = [''.join(cell.itertext()).strip() for cell in cells]
+
+            if self._header is None:
+                self._header = self._unique_names(values)
+            elif values:
+                self._add_row(values)
+
+            # Drop the finished row (and anything before it) from the tree
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    @staticmethod
+    def _unique_names(names: List[str]) -> List[str]:
+        """Suffix repeated header names the way pandas does (Name, Name.1, ...)"""
+        seen = {}
+        unique = []
+        for name in names:
+            if name in seen:
+                seen[name] += 1
+                unique.append(f"{name}.{seen[name]}")
+            else:
+                seen[name] = 0
+                unique.append(name)
+        return unique
+
+    def _add_row(self, values: List[str]):
+        width = len(self._header)
+        if len(values) < width:
+            values = values + [''] * (width - len(values))
+        self._rows.append([value if value != '' else None for value in values[:width]])
+        self.rows_read += 1
+
+        if len(self._rows) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self):
+        """Turn buffered rows into a typed Polars batch"""
+        if not self._rows or self._header is None:
+            return
+
+        columns = list(zip(*self._rows))
+        batch = pl.DataFrame(
+            {name: list(column) for name, column in zip(self._header, columns)},
+            schema={name: pl.Utf8 for name in self._header},
+        )
+        batch = batch.with_columns([
+            pl.col(name).cast(dtype, strict=False)
+            for name, dtype in self.schema.items()
+            if name in batch.columns
+        ])
+        self._batches.append(batch)
+        self._rows = []
@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import time
+from datetime import datetime as dt
+from typing import Any, Dict, List, Optional
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import TELEMETRY_PATH, TELEMETRY_KEEP
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Network phases of one request, in the order they happen
+PHASES = ('queued', 'dns', 'connect', 'kerberos', 'ttfb', 'download')
+
+
+def phase_timings(marks: Dict[str, float]) -> Dict[str, float]:
+    """
+    Turn the perf_counter marks of one request into phase durations.
+    aiohttp resolves DNS inside connection setup and does not report TLS on
+    its own, so 'connect' is connection setup (TCP + TLS) minus DNS.
+    """
+    def span(start: str, end: str) -> float:
+        if start in marks and end in marks:
+            return max(marks[end] - marks[start], 0.0)
+        return 0.0
+
+    dns = span('dns_start', 'dns_end')
+    return {
+        'queued': span('queued_start', 'queued_end'),
+        'dns': dns,
+        'connect': max(span('connect_start', 'connect_end') - dns, 0.0),
+        'ttfb': span('headers_sent', 'response_start'),
+        'download': span('response_start', 'body_end'),
+        'total': span('request_start', 'body_end'),
+    }
+
+
+class RefreshTelemetry:
+    """
+    Network timing record for one refresh.
+
+    Every upstream attempt keeps its phase timings (pool/limit wait, DNS,
+    connect, Kerberos, time to first byte, download), status and bytes; every
+    source keeps its wall time and retry count, and cookie checks / Selenium
+    refreshes are timed too. finish() rolls it up per source, keeps it as
+    `last` for the app and appends it as one JSON line to TELEMETRY_PATH.
+    """
+
+    def __init__(self, path: str = TELEMETRY_PATH, keep: int = TELEMETRY_KEEP):
+        self.path = path
+        self.keep = keep
+        self.last: Optional[Dict[str, Any]] = None
+        self._reset()
+
+    def _reset(self):
+        self._started = None
+        self._record: Dict[str, Any] = {}
+        self._requests: List[Dict[str, Any]] = []
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._cookies = {'check_seconds': 0.0, 'refresh_seconds': 0.0, 'refreshes': 0}
+
+
+
+    @staticmethod
+    def source_of(name: str) -> str:
+        """Top-level source of a request name ("Rodeo 2/4" -> "Rodeo")"""
+        return name.split(' ', 1)[0]
+
+    def begin(self, site_code: str, sources: Optional[List[str]] = None):
+        """Start the record for a refresh"""
+        self._reset()
+        self._started = time.perf_counter()
+        self._record = {
+            'started_at': dt.now().isoformat(timespec='seconds'),
+            'site_code': site_code,
+            'requested': sources,
+        }
+
+    @property
+    def active(self) -> bool:
+        return self._started is not None
+
+    def record_attempt(self, name: str, url: str, attempt: int, status_code: Optional[int],
+                       timing: Optional[Dict[str, float]] = None, size: int = 0,
+                       cached: Optional[str] = None, error: Optional[str] = None):
+        """One upstream attempt (or cache answer) for a request"""
+        if not self.active:
+            return
+        timing = timing or {}
+        entry = {
+            'name': name,
+            'source': self.source_of(name),
+            'url': url,
+            'attempt': attempt,
+            'status_code': status_code,
+            'bytes': size,
+            'cached': cached,
+            'error': error,
+            'total': round(timing.get('total', 0.0), 4),
+        }
+        entry.update({phase: round(timing.get(phase, 0.0), 4) for phase in PHASES})
+        self._requests.append(entry)
+
+    def record_cookies(self, check_seconds: float = 0.0, refresh_seconds: float = 0.0):
+        """Time spent testing cookies and refreshing them with Selenium"""
+        if not self.active:
+            return
+        self._cookies['check_seconds'] += check_seconds
+        self._cookies['refresh_seconds'] += refresh_seconds
+        if refresh_seconds:
+            self._cookies['refreshes'] += 1
+
+    def record_source(self, name: str, seconds: float, status_code: Optional[int]):
+        """Wall time of a source from request start to its response"""
+        if not self.active:
+            return
+        self._sources[name] = {'seconds': round(seconds, 4), 'status_code': status_code}
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """Roll the refresh up per source, keep it as `last` and save it"""
+        if not self.active:
+            return None
+
+        sources = {}
+        for name, source in self._sources.items():
+            requests = [entry for entry in self._requests if entry['source'] == name]
+            # Attempts past the first of each request name are retries
+            names = {entry['name'] for entry in requests}
+            sources[name] = {
+                **source,
+                'requests': len(requests),
+                'retries': len(requests) - len(names),
+                'bytes': sum(entry['bytes'] for entry in requests),
+                'cached': sum(1 for entry in requests if entry['cached']),
+                'phases': {phase: round(sum(entry[phase] for entry in requests), 4) for phase in PHASES},
+            }
+
+        record = dict(self._record)
+        record['total_seconds'] = round(time.perf_counter() - self._started, 4)
+        record['cookies'] = {key: round(value, 4) for key, value in self._cookies.items()}
+        record['sources'] = sources
+        record['requests'] = self._requests
+
+        self.last = record
+        self._reset()
+        self._save(record)
+        return record
+
+    def _save(self, record: Dict[str, Any]):
+        """Append to the JSON lines file, keeping the newest `keep` refreshes"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            if len(lines) > self.keep:
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    f.writelines(lines[-self.keep:])
+
+        except Exception as e:
+            logger.warning(f"Could not save refresh telemetry: {str(e)}")
+
+    def summary_text(self, record: Optional[Dict[str, Any]] = None) -> str:
+        """Readable breakdown of a refresh (the last one by default)"""
+        record = record or self.last
+        if not record:
+            return "No refresh timings yet"
+
+        lines = [f"Refresh {record['total_seconds']:.1f}s ({record['site_code']})"]
+        for name, source in sorted(record['sources'].items(), key=lambda item: -item[1]['seconds']):
+            phases = source['phases']
+            slowest = max(PHASES, key=lambda phase: phases[phase])
+            lines.append(
+                f"{name}: {source['seconds']:.1f}s, {source['requests']} req, {source['retries']} retries, "
+                f"{source['bytes'] / 1e6:.1f} MB, most time in {slowest} ({phases[slowest]:.1f}s)"
+            )
+        cookies = record['cookies']
+        lines.append(f"Cookies: check {cookies['check_seconds']:.1f}s, "
+                     f"Selenium refresh {cookies['refresh_seconds']:.1f}s ({cookies['refreshes']}x)")
+        return '\n'.join(lines)
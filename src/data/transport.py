@@ -0,0 +1,267 @@
+import os
+import sys
+import json
+import time
+import base64
+import asyncio
+import urllib.request
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+# Optional: native asyncio HTTP client. Without it AsyncRequestHandler
+# falls back to pushing AmznReq.requests through worker threads.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: SPNEGO token generation (installed alongside requests_kerberos)
+try:
+    import spnego
+except ImportError:
+    spnego = None
+
+
+# Module Path Fix
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from src.config.constants import HOST_CONNECTION_LIMIT, KEEPALIVE_SECONDS, REQUEST_TIMEOUT_SECONDS, STREAM_CHUNK_BYTES
+from src.data.telemetry import phase_timings
+from src.utils.logger import CustomLogger
+logger = CustomLogger.get_logger(__name__)
+#logger.error(f"Some Error: {str(e)}")
+#logger.info("Some Info")
+
+
+# Transport-level failures (no response at all), retried like a ConnectionError
+TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp is not None else (asyncio.TimeoutError,)
+
+
+class TransportResponse:
+    """Small stand-in for requests.Response so callers can treat both paths alike"""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes, encoding: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        # Bytes received (also counts streamed bodies) and phase durations
+        self.size = len(content)
+        self.timing: Optional[Dict[str, float]] = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class AsyncTransport:
+    """
+    Pooled asyncio HTTP transport for the upstream hosts.
+
+    Keeps one aiohttp session (and connection pool) per host so picking-console,
+    fclm-portal and rodeo each get their own keep-alive connections, limited by
+    HOST_CONNECTION_LIMIT. Cookies come from the shared AmznReq cookie jar on every
+    request, and Kerberos (SPNEGO) is negotiated per host on a 401 and then sent
+    up front for the rest of the session.
+
+    The sessions are tied to the event loop they were created on, so the instance
+    should be reused from a long-lived loop to keep connections warm across refreshes.
+    """
+    _instance = None
+
+    def __init__(self, amzn_req):
+        self.amzn_req = amzn_req
+        self._sessions = {}
+        self._negotiate_hosts = set()
+        self._loop = None
+        self.stats = {
+            'requests': 0,
+            'negotiations': 0,
+            'sessions_opened': 0,
+        }
+
+    @classmethod
+    def available(cls) -> bool:
+        """True when aiohttp is installed"""
+        return aiohttp is not None
+
+    @classmethod
+    def get_instance(cls, amzn_req) -> 'AsyncTransport':
+        """Get singleton instance of AsyncTransport bound to the current AmznReq"""
+        if cls._instance is None:
+            cls._instance = cls(amzn_req)
+        else:
+            cls._instance.amzn_req = amzn_req
+        return cls._instance
+
+    @classmethod
+    async def reset_instance(cls):
+        """Close pooled connections and drop the singleton"""
+        if cls._instance is not None:
+            await cls._instance.close()
+        cls._instance = None
+
+
+
+    def _session_for(self, host: str) -> 'aiohttp.ClientSession':
+        """Get (or open) the pooled session for a host on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions cannot move between loops, start fresh pools
+            if self._sessions:
+                logger.info("Event loop changed, discarding pooled sessions")
+            self._sessions = {}
+            self._loop = loop
+
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HOST_CONNECTION_LIMIT,
+                limit_per_host=HOST_CONNECTION_LIMIT,
+                keepalive_timeout=KEEPALIVE_SECONDS,
+                ssl=False,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                trace_configs=[self._trace_config()],
+            )
+            self._sessions[host] = session
+            self.stats['sessions_opened'] += 1
+            logger.info(f"Opened connection pool for {host}")
+        return session
+
+    @staticmethod
+    def _trace_config() -> 'aiohttp.TraceConfig':
+        """Stamp each request's phases into the marks dict passed as trace_request_ctx"""
+        def mark(name: str):
+            async def on_event(session, context, params):
+                if isinstance(context.trace_request_ctx, dict):
+                    context.trace_request_ctx[name] = time.perf_counter()
+            return on_event
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(mark('queued_start'))
+        trace_config.on_connection_queued_end.append(mark('queued_end'))
+        trace_config.on_dns_resolvehost_start.append(mark('dns_start'))
+        trace_config.on_dns_resolvehost_end.append(mark('dns_end'))
+        trace_config.on_connection_create_start.append(mark('connect_start'))
+        trace_config.on_connection_create_end.append(mark('connect_end'))
+        trace_config.on_request_headers_sent.append(mark('headers_sent'))
+        # Fires once the response headers are in, before the body is read
+        trace_config.on_request_end.append(mark('response_start'))
+        return trace_config
+
+    def _cookie_header(self, url: str) -> Optional[str]:
+        """Build the Cookie header for a URL from the AmznReq cookie jar"""
+        if self.amzn_req is None:
+            # Mock upstream (UPSTREAM_OVERRIDE), no cookies to send
+            return None
+        cookie_jar = self.amzn_req.export_cookies()
+        if cookie_jar is None:
+            return None
+        probe = urllib.request.Request(url)
+        cookie_jar.add_cookie_header(probe)
+        return probe.get_header('Cookie')
+
+    def _negotiate_header(self, host: str) -> Optional[str]:
+        """Create a Kerberos Negotiate header for a host"""
+        if spnego is None:
+            logger.warning("spnego not installed, cannot negotiate Kerberos")
+            return None
+        context = spnego.client(hostname=host, service='HTTP')
+        token = context.step()
+        self.stats['negotiations'] += 1
+        return f"Negotiate {base64.b64encode(token).decode()}"
+
+    async def get(self, url: str, headers: Optional[Dict] = None, on_chunk: Optional[Callable[[bytes], None]] = None) -> TransportResponse:
+        """
+        GET a URL through the pooled session for its host.
+
+        When `on_chunk` is given, a 200 body is handed over chunk by chunk
+        (already gzip/br decoded) instead of being buffered on the response.
+        `on_chunk` runs in a worker thread, one chunk at a time and in order,
+        so parsing overlaps the download without blocking the event loop.
+        """
+        host = urlsplit(url).hostname
+        session = self._session_for(host)
+
+        request_headers = dict(headers or {})
+        # aiohttp manages these itself
+        for managed in ('Host', 'Connection', 'TE'):
+            request_headers.pop(managed, None)
+
+        cookie_header = self._cookie_header(url)
+        if cookie_header:
+            request_headers['Cookie'] = cookie_header
+
+        # Token generation plus the 401 round trip of a first handshake
+        kerberos = 0.0
+        if host in self._negotiate_hosts:
+            negotiate_start = time.perf_counter()
+            auth_header = await asyncio.to_thread(self._negotiate_header, host)
+            kerberos += time.perf_counter() - negotiate_start
+            if auth_header:
+                request_headers['Authorization'] = auth_header
+
+        self.stats['requests'] += 1
+        response = await self._send(session, url, request_headers, on_chunk)
+
+        if (response.status_code == 401
+                and 'Authorization' not in request_headers
+                and 'negotiate' in response.headers.get('WWW-Authenticate', '').lower()):
+            # Full handshake once, then send the token up front for this host
+            negotiate_start = time.perf_counter()
+            auth_header = await asyncio.to_thread(self._negotiate_header, host)
+            if auth_header:
+                self._negotiate_hosts.add(host)
+                request_headers['Authorization'] = auth_header
+                kerberos += response.timing['total'] + time.perf_counter() - negotiate_start
+                response = await self._send(session, url, request_headers, on_chunk)
+
+        response.timing['kerberos'] = kerberos
+        return response
+
+    async def _send(self, session, url: str, headers: Dict, on_chunk: Optional[Callable[[bytes], None]] = None) -> TransportResponse:
+        marks = {'request_start': time.perf_counter()}
+        async with session.get(url, headers=headers, allow_redirects=True, trace_request_ctx=marks) as resp:
+            size = 0
+            if on_chunk is not None and resp.status == 200:
+                feeding = None
+                async for chunk in resp.content.iter_chunked(STREAM_CHUNK_BYTES):
+                    size += len(chunk)
+                    # The previous chunk must be in before the next one goes
+                    if feeding is not None:
+                        await feeding
+                    feeding = asyncio.ensure_future(asyncio.to_thread(on_chunk, chunk))
+                if feeding is not None:
+                    await feeding
+                body = b''
+            else:
+                body = await resp.read()
+            marks['body_end'] = time.perf_counter()
+
+            response = TransportResponse(
+                url=str(resp.url),
+                status_code=resp.status,
+                headers=resp.headers.copy(),
+                content=body,
+                encoding=resp.charset,
+            )
+            response.size = size or len(body)
+            response.timing = phase_timings(marks)
+            return response
+
+    async def close(self):
+        """Close every pooled session"""
+        for host, session in list(self._sessions.items()):
+            try:
+                if not session.closed:
+                    await session.close()
+            except Exception as e:
+                logger.warning(f"Error closing session for {host}: {str(e)}")
+        self._sessions = {}
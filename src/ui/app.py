@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import asyncio
 import webbrowser
 from PIL import Image
@@ -11,7 +12,7 @@ from PySide6.QtCore import QTimer, Signal, QThread, QDateTime
 
 # Module Path Fix
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from src.config.constants import USER, THIS_VERSION, SITES
+from src.config.constants import USER, THIS_VERSION, SITES, USE_SOURCE_SCHEDULER, USE_PREFETCH
 from src.config.versioning import VersionHandler
 from src.ui.input_dialog import InputDialog, ShiftTimeDialog
 from src.ui.tabs import OverviewTab, DetailsTab, PathsTab, SettingsTab
@@ -20,6 +21,7 @@ from src.ui.plan_tab import EnhancedPlanCalculator, PlanTab
 
 from src.config.res_finder import ResourceFinder
 from src.data.processor import DataProcessor
+from src.data.prefetch import RefreshPrefetcher
 from src.config.chronos import TimeManager
 from src.config.site_build import SiteBuilder
 
@@ -34,16 +36,43 @@ logger = CustomLogger.get_logger(__name__)
 class DataProcessingThread(QThread):
     finished = Signal(dict)
     error = Signal(str)
+    # Provisional results while slower sources are still processing
+    partial = Signal(dict)
+
+    # One loop shared by every refresh so pooled connections stay alive
+    _loop = None
+
+    def __init__(self, sources=None, processor=None):
+        super().__init__()
+        # Sources to fetch this run, None for all
+        self.sources = sources
+        # Processor to run on, a staged one for prefetches (None for the shared instance)
+        self.processor = processor
+        # Wall time of the run, set before finished is emitted
+        self.duration = None
+        # True when the run raised instead of finishing
+        self.failed = False
+
+    @classmethod
+    def get_loop(cls):
+        """Get the long-lived event loop used for data processing"""
+        if cls._loop is None or cls._loop.is_closed():
+            cls._loop = asyncio.new_event_loop()
+        return cls._loop
 
     def run(self):
         """Execute data processing in separate thread"""
         try:
-            loop = asyncio.new_event_loop()
+            loop = self.get_loop()
             asyncio.set_event_loop(loop)
             
-            processor = DataProcessor.get_instance()
+            processor = self.processor or DataProcessor.get_instance()
+            # Staged prefetches stay hidden until they are swapped in
+            on_partial = self.partial.emit if self.processor is None else None
+            started = time.monotonic()
             try:
-                results = loop.run_until_complete(processor.process_incoming_data())
+                results = loop.run_until_complete(processor.process_incoming_data(self.sources, on_partial))
+                self.duration = time.monotonic() - started
                 error_summary = ""
                 # Unpack the results
                 if isinstance(results, tuple) and len(results) == 2:
@@ -71,9 +100,11 @@ class DataProcessingThread(QThread):
                     self.error.emit(error_summary)
                     
             finally:
-                loop.close()
+                # Keep the loop open for the next refresh, just detach it
+                asyncio.set_event_loop(None)
         except Exception as e:
             logger.error(f"Thread error: {str(e)}")
+            self.failed = True
             self.error.emit(str(e))
 
 
@@ -92,6 +123,9 @@ class SDCPickAssistApp(qtw.QMainWindow):
 
         self.time_manager = TimeManager.get_instance()
         self.processing_thread = None
+        self.prefetch_thread = None
+        self.prefetcher = RefreshPrefetcher()
+        self.swap_on_prefetch = None # run_it(scheduled) waiting on the running prefetch
 
 
         # Create and show dialog
@@ -134,10 +168,40 @@ class SDCPickAssistApp(qtw.QMainWindow):
         )
 
 
-    def run_it(self):
+    def run_it(self, scheduled=False):
         """Non-blocking main data processing method"""
+        if self.processing_thread is not None and self.processing_thread.isRunning():
+            logger.info("Refresh already running, skipping")
+            return
+
+        if self.prefetch_thread is not None and self.prefetch_thread.isRunning():
+            # Never two runs on the shared loop, the prefetch is the next refresh already
+            logger.info("Prefetch running, showing its results when it lands")
+            self.swap_on_prefetch = scheduled
+            self.set_processing_button()
+            return
+
+        if self.prefetcher.ready:
+            if scheduled and self.swap_prefetched():
+                return
+            # A manual refresh fetches everything fresh
+            self.prefetcher.discard(DataProcessor.get_instance())
+
+        sources = self.select_sources(scheduled)
+
+        self.set_processing_button()
+
+        self.update_shift_progress_bar()
+        # Create new thread instance
+        self.processing_thread = DataProcessingThread(sources)
+        self.processing_thread.finished.connect(self.on_processing_complete)
+        self.processing_thread.error.connect(self.on_processing_error)
+        self.processing_thread.partial.connect(self.on_partial_results)
         
+        # Start processing in background
+        self.processing_thread.start()
 
+    def set_processing_button(self):
         self.go_button.setEnabled(False)
         self.go_button.setText("Processing...")
         self.go_button.setStyleSheet("""
@@ -153,19 +217,109 @@ class SDCPickAssistApp(qtw.QMainWindow):
             }
         """)
 
-        self.update_shift_progress_bar()
-        # Create new thread instance
-        self.processing_thread = DataProcessingThread()
-        self.processing_thread.finished.connect(self.on_processing_complete)
-        self.processing_thread.error.connect(self.on_processing_error)
-        
-        # Start processing in background
-        self.processing_thread.start()
+    def select_sources(self, scheduled=False):
+        """Sources for this run: only the due ones on a scheduled refresh, else all"""
+        processor = DataProcessor.get_instance()
+        self.time_manager.update_shift()
+        processor.update_shift_info()
+        if not (scheduled and USE_SOURCE_SCHEDULER):
+            processor.scheduler.claim(list(processor.scheduler.cadence))
+            return None
+
+        return processor.scheduler.claim_due(self.tab_settings.refresh_interval_seconds())
+
+    def run_prefetch(self):
+        """Fetch and process the next scheduled refresh in the background, shown when it is due"""
+        if not USE_PREFETCH or self.is_closing:
+            return
+        if self.processing_thread is not None and self.processing_thread.isRunning():
+            logger.info("Refresh running, skipping prefetch")
+            return
+        if self.prefetch_thread is not None and self.prefetch_thread.isRunning():
+            return
+
+        processor = DataProcessor.get_instance()
+        self.prefetcher.discard(processor)
+
+        self.time_manager.update_shift()
+        processor.update_shift_info()
+        if USE_SOURCE_SCHEDULER:
+            # Sources that will be due when the refresh timer fires
+            due_at = time.time() + self.tab_settings.msecs_until_refresh() / 1000
+            sources = processor.scheduler.due_sources(self.tab_settings.refresh_interval_seconds(), now=due_at)
+            if not sources:
+                return
+            processor.scheduler.claim(sources, now=due_at)
+        else:
+            sources = None
+            processor.scheduler.claim(list(processor.scheduler.cadence))
+
+        logger.info(f"Prefetching {', '.join(sources) if sources else 'all sources'}")
+        staged = self.prefetcher.begin(processor, sources)
+        self.prefetch_thread = DataProcessingThread(sources, processor=staged)
+        self.prefetch_thread.finished.connect(self.on_prefetch_complete)
+        self.prefetch_thread.error.connect(self.on_prefetch_error)
+        self.prefetch_thread.start()
+
+    def on_prefetch_complete(self, results):
+        """Prefetch landed, keep it staged until the refresh is due"""
+        self.prefetcher.complete(self.prefetch_thread.duration, self.prefetcher.errors)
+        self.prefetch_thread.quit()
+        self.prefetch_thread.wait()
+        self.prefetch_thread = None
+
+        if self.swap_on_prefetch is not None:
+            scheduled, self.swap_on_prefetch = self.swap_on_prefetch, None
+            if not self.swap_prefetched():
+                self.run_it(scheduled)
+
+    def on_prefetch_error(self, error_msg):
+        """Keep the prefetch's request errors for the swap, drop it when the run failed"""
+        if error_msg == "":
+            return
+        self.prefetcher.errors = error_msg
+        if self.prefetch_thread is None or not self.prefetch_thread.failed:
+            return
+
+        logger.warning(f"Prefetch failed: {error_msg}")
+        self.prefetcher.discard(DataProcessor.get_instance())
+        self.prefetch_thread.quit()
+        self.prefetch_thread.wait()
+        self.prefetch_thread = None
+
+        if self.swap_on_prefetch is not None:
+            scheduled, self.swap_on_prefetch = self.swap_on_prefetch, None
+            self.run_it(scheduled)
+
+    def swap_prefetched(self):
+        """Show the prefetched results at once, False when there were none fresh enough"""
+        taken = self.prefetcher.take(DataProcessor.get_instance())
+        if taken is None:
+            return False
+
+        results, error_summary = taken
+        self.on_processing_error(error_summary)
+        self.on_processing_complete(results)
+        return True
+
+    def on_partial_results(self, results):
+        """Show provisional results, the pending sources are filled in when the refresh completes"""
+        self.results = results
+        completeness = results.get('combined_data', {}).get('completeness', {})
+        pending = [name for name, complete in completeness.items() if not complete]
+        logger.info(f"Showing partial results, waiting on {', '.join(pending)}")
+        self.last_update_label.setText(
+            f"Last Update: {QDateTime.currentDateTime().toString('yyyy-MM-dd hh:mm:ss')} (waiting on {', '.join(pending)})"
+        )
+        self.update_tabs()
 
     def on_processing_complete(self, results):
         """Handle completed processing"""
         self.results = results
         logger.info("Data processing completed successfully")
+        if self.processing_thread is not None and self.processing_thread.duration is not None:
+            # Lead time for the next prefetch
+            self.prefetcher.record_duration(self.processing_thread.duration)
         self.go_button.setEnabled(True)
         self.go_button.setText("Refresh")
         self.go_button.setStyleSheet("""
@@ -183,6 +337,11 @@ class SDCPickAssistApp(qtw.QMainWindow):
         self.last_update = QDateTime.currentDateTime().toString('yyyy-MM-dd hh:mm:ss')
         self.last_update_label.setText(f"Last Update: {self.last_update}")
 
+        # Network timing breakdown of this refresh on hover
+        telemetry = getattr(DataProcessor.get_instance().request_handler, 'telemetry', None)
+        if telemetry is not None and telemetry.last is not None:
+            self.last_update_label.setToolTip(telemetry.summary_text())
+
         SiteBuilder.get_instance().get_site_info(new=True)
 
         self.update_tabs()
@@ -1020,8 +1179,8 @@ class SDCPickAssistApp(qtw.QMainWindow):
         else:
             self.time_manager.update_shift()
             self.shift_info = TimeManager.get_instance().get_shift_info()
-            DataProcessor.reset_instance()
-            DataProcessor.get_instance()
+            # Same shift, keep processed data and source schedule
+            DataProcessor.get_instance().update_shift_info()
             
             # Use current_time instead of now for last_update
             current_time = self.shift_info['current_time']
@@ -17,7 +17,7 @@ from asyncio import create_task, get_event_loop
 
 # Module Path Fix
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from src.config.constants import USER
+from src.config.constants import USER, USE_SOURCE_SCHEDULER, USE_PREFETCH
 from src.config.site_build import SiteBuilder
 from src.config.chronos import TimeManager
 from src.data.processor import DataProcessor
@@ -2219,7 +2219,7 @@ class SettingsTab(qtw.QWidget):
                 
                 # Start timer
                 logger.info("Starting timer")
-                self.auto_refresh_timer.start(self.auto_refresh_interval * 60000)
+                self.start_refresh_timer()
                 
                 # Update button state
                 self.parent.go_button.setText("Refresh")
@@ -2255,7 +2255,7 @@ class SettingsTab(qtw.QWidget):
                 
                 # Start timer
                 logger.info("Starting timer")
-                self.auto_refresh_timer.start(self.auto_refresh_interval * 60000)
+                self.start_refresh_timer()
                 # Update button state
                 self.parent.go_button.setText("Refresh")
                 
@@ -2275,13 +2275,13 @@ class SettingsTab(qtw.QWidget):
             return
             
         try:
-            # Run the refresh
-            self.parent.run_it()
+            # Run the refresh (only the sources that are due)
+            self.parent.run_it(scheduled=True)
             
             # Schedule next refresh only if still auto-refreshing
             if self.is_auto_refreshing and not self.is_closing:
                 logger.info("Scheduling next auto-refresh")
-                self.auto_refresh_timer.start(self.auto_refresh_interval * 60000)
+                self.start_refresh_timer()
                 
         except Exception as e:
             logger.info(f"Error in run_auto_refresh: {str(e)}")
@@ -2303,6 +2303,46 @@ class SettingsTab(qtw.QWidget):
             self.auto_refresh_timer = None
             logger.info("Auto-Refresh Timer Stopped")
 
+        if getattr(self, 'prefetch_timer', None) is not None:
+            self.prefetch_timer.stop()
+
+    def refresh_interval_seconds(self):
+        """Refresh interval from the spinbox, in seconds"""
+        return getattr(self, 'auto_refresh_interval', self.refresh_spinbox.value()) * 60
+
+    def next_refresh_msecs(self):
+        """Timer delay until the next source is due (or the full interval without the scheduler)"""
+        if not USE_SOURCE_SCHEDULER:
+            return self.refresh_interval_seconds() * 1000
+        seconds = DataProcessor.get_instance().scheduler.seconds_until_due(self.refresh_interval_seconds())
+        return int(seconds * 1000)
+
+    def msecs_until_refresh(self):
+        """Time left on the running refresh timer"""
+        if getattr(self, 'auto_refresh_timer', None) is not None and self.auto_refresh_timer.isActive():
+            return self.auto_refresh_timer.remainingTime()
+        return self.next_refresh_msecs()
+
+    def start_refresh_timer(self):
+        """Start the timer for the next refresh and the prefetch ahead of it"""
+        msecs = self.next_refresh_msecs()
+        self.auto_refresh_timer.start(msecs)
+        if not USE_PREFETCH:
+            return
+
+        if getattr(self, 'prefetch_timer', None) is None:
+            self.prefetch_timer = QTimer()
+            self.prefetch_timer.setSingleShot(True)
+            self.prefetch_timer.timeout.connect(self.parent.run_prefetch)
+
+        # Lead time from how long recent refreshes took
+        lead_msecs = int(self.parent.prefetcher.lead_seconds() * 1000)
+        if lead_msecs >= msecs:
+            # Refresh is due before a prefetch could finish
+            self.prefetch_timer.stop()
+            return
+        self.prefetch_timer.start(msecs - lead_msecs)
+
 
 
     def open_webhook_dialog(self):